@@ -0,0 +1,41 @@
+""" Benchmark generate() against generate_many()
+
+Usage:
+    $ PYTHONPATH=. python benchmarks/bench_generate_many.py [rows]
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from flask_seeder import generator
+
+GENERATORS = {
+    "Integer": lambda: generator.Integer(start=1, end=1000000),
+    "UUID": generator.UUID,
+    "Email": generator.Email,
+    "Name": generator.Name,
+    "Sequence": lambda: generator.Sequence(end=float("inf")),
+    "String": lambda: generator.String(r"abc[5-9]{4}\c[xyz]"),
+    "IPv4": generator.IPv4,
+    "IPv6": generator.IPv6,
+    "IPv4 /8": lambda: generator.IPv4(network="10.0.0.0/8", exclude=["10.0.0.0/24"]),
+    "IPv6 /32": lambda: generator.IPv6(network="2001:db8::/32"),
+    "Timestamp": lambda: generator.Timestamp(datetime(2024, 1, 1), jitter=timedelta(seconds=1)),
+}
+
+def main(rows=100000):
+    """ Run the benchmark and print a result table """
+    print("%-10s %12s %16s %8s" % ("Generator", "generate()", "generate_many()", "Speedup"))
+    for name, factory in GENERATORS.items():
+        gen = factory()
+        gen.generate_many(1)
+
+        single = min(timeit.repeat(lambda: [gen.generate() for _ in range(rows)],
+                                   number=1, repeat=3))
+        batch = min(timeit.repeat(lambda: gen.generate_many(rows), number=1, repeat=3))
+
+        print("%-10s %11.3fs %15.3fs %7.1fx" % (name, single, batch, single / batch))
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,46 @@
+""" Benchmark import time
+
+Measures how long it takes to import Flask-Seeder modules in a fresh
+interpreter, using `python -X importtime`. Importing `flask_seeder.cli` is
+what every `flask` command pays for, as the `seed` command is registered
+through an entry point.
+
+Usage:
+    $ PYTHONPATH=. python benchmarks/bench_import.py [runs]
+"""
+
+import re
+import subprocess
+import sys
+
+MODULES = [
+    "flask_seeder",
+    "flask_seeder.cli",
+    "flask_seeder.generator",
+    "flask_seeder.faker",
+]
+
+IMPORTTIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$")
+
+def import_time(module):
+    """ Cumulative import time of `module` in microseconds, in a fresh interpreter """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1))
+
+    raise RuntimeError("No import time found for %s" % module)
+
+def main(runs=5):
+    """ Run the benchmark and print a result table """
+    print("%-26s %12s" % ("Module", "Import time"))
+    for module in MODULES:
+        best = min(import_time(module) for _ in range(runs))
+        print("%-26s %10.1fms" % (module, best / 1000))
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,42 @@
+""" Benchmark the Regex generator
+
+Compares the Regex generator with the String generator on patterns that
+produce the same kind of strings.
+
+Usage:
+    $ PYTHONPATH=. python benchmarks/bench_regex.py [rows]
+"""
+
+import sys
+import timeit
+
+from flask_seeder.generator import Regex, String
+
+PATTERNS = [
+    (r"abc[5-9]{4}[a-zA-Z][xyz]", r"abc[5-9]{4}\c[xyz]"),
+    (r"[a-zA-Z]{64}", r"\c{64}"),
+    (r"(mr|mrs|ms) [a-zA-Z]{3,10} \d{5}", r"(mr|mrs|ms) \c{3,10} \d{5}"),
+    (r"[A-Z]{3}-\d{4}-[a-f]{8}", r"[A-Z]{3}-\d{4}-[a-f]{8}"),
+]
+
+def best(func):
+    """ Best time out of three runs """
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+def main(rows=100000):
+    """ Run the benchmark and print a result table """
+    print("%-36s %12s %12s %16s" % ("Pattern", "Regex", "String", "String codegen"))
+    for regex, pattern in PATTERNS:
+        regex_generator = Regex(regex)
+        string_generator = String(pattern)
+        codegen_generator = String(pattern, codegen=True)
+
+        print("%-36s %11.3fs %11.3fs %15.3fs" % (
+            regex,
+            best(lambda: regex_generator.generate_many(rows)),
+            best(lambda: string_generator.generate_many(rows)),
+            best(lambda: [codegen_generator.generate() for _ in range(rows)]),
+        ))
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
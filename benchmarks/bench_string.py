@@ -0,0 +1,42 @@
+""" Benchmark the String generator
+
+Compares generate() through the interpreter and through a generated
+function (`codegen=True`) with the batched generate_many().
+
+Usage:
+    $ PYTHONPATH=. python benchmarks/bench_string.py [rows]
+"""
+
+import sys
+import timeit
+
+from flask_seeder.generator import String
+
+PATTERNS = [
+    r"abc[5-9]{4}\c[xyz]",
+    r"\c{64}",
+    r"(mr|mrs|ms) \c{3,10} \d{5}",
+    r"[A-Z]{3}-\d{4}-[a-f]{8}",
+]
+
+def best(func):
+    """ Best time out of three runs """
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+def main(rows=100000):
+    """ Run the benchmark and print a result table """
+    print("%-30s %12s %12s %16s" % ("Pattern", "Interpreter", "Codegen", "generate_many()"))
+    for pattern in PATTERNS:
+        interpreter = String(pattern)
+        generated = String(pattern, codegen=True)
+        generated.generate()
+
+        print("%-30s %11.3fs %11.3fs %15.3fs" % (
+            pattern,
+            best(lambda: [interpreter.generate() for _ in range(rows)]),
+            best(lambda: [generated.generate() for _ in range(rows)]),
+            best(lambda: interpreter.generate_many(rows)),
+        ))
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
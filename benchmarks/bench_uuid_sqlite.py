@@ -0,0 +1,49 @@
+""" Benchmark inserting UUID keys into SQLite
+
+Inserts rows keyed by version 4 and version 7 UUIDs into an SQLite table
+and reports the insert time and the size of the database file. Random
+version 4 keys land all over the primary key index, while time ordered
+version 7 keys are appended to the end of it.
+
+Usage:
+    $ PYTHONPATH=. python benchmarks/bench_uuid_sqlite.py [rows]
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+
+from flask_seeder.generator import UUID
+
+BATCH_SIZE = 10000
+
+def insert(generator, rows):
+    """ Insert `rows` rows, returns seconds taken and database size in bytes """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE item (id BLOB PRIMARY KEY, value INTEGER) WITHOUT ROWID")
+
+        started = time.perf_counter()
+        for offset in range(0, rows, BATCH_SIZE):
+            size = min(BATCH_SIZE, rows - offset)
+            keys = generator.generate_many(size)
+            connection.executemany("INSERT INTO item VALUES (?, ?)",
+                                   [(key.bytes, offset + i) for i, key in enumerate(keys)])
+            connection.commit()
+        seconds = time.perf_counter() - started
+
+        connection.close()
+        return seconds, os.path.getsize(path)
+
+def main(rows=1000000):
+    """ Run the benchmark and print a result table """
+    print("%-10s %12s %12s" % ("Version", "Insert", "Size"))
+    for version in (4, 7):
+        seconds, size = insert(UUID(version=version), rows)
+        print("%-10d %11.3fs %10.1fMB" % (version, seconds, size / 2**20))
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,38 @@
+""" Benchmark the NumPy backend against the pure Python generate_many()
+
+Requires NumPy to be installed.
+
+Usage:
+    $ PYTHONPATH=. python benchmarks/bench_vectorize.py [rows]
+"""
+
+import sys
+import timeit
+
+from flask_seeder import generator
+
+GENERATORS = {
+    "Integer": lambda **kwargs: generator.Integer(start=1, end=1000000, **kwargs),
+    "Name": generator.Name,
+}
+
+def main(rows=1000000):
+    """ Run the benchmark and print a result table """
+    if generator.numpy is None:
+        sys.exit("NumPy is not installed")
+
+    print("%-10s %12s %12s %8s" % ("Generator", "Python", "NumPy", "Speedup"))
+    for name, factory in GENERATORS.items():
+        python = factory(vectorize=False)
+        vectorized = factory()
+        python.generate_many(1)
+        vectorized.generate_many(1)
+
+        python_time = min(timeit.repeat(lambda: python.generate_many(rows), number=1, repeat=3))
+        numpy_time = min(timeit.repeat(lambda: vectorized.generate_many(rows), number=1, repeat=3))
+
+        print("%-10s %11.3fs %11.3fs %7.1fx" % (name, python_time, numpy_time,
+                                                python_time / numpy_time))
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
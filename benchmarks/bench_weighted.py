@@ -0,0 +1,46 @@
+""" Benchmark weighted sampling
+
+Compares drawing by weight with `random.choices()` and with an alias table,
+for different numbers of weights.
+
+Usage:
+    $ PYTHONPATH=. python benchmarks/bench_weighted.py [rows]
+"""
+
+import sys
+import random
+import timeit
+from itertools import accumulate
+
+from flask_seeder.generator import AliasTable, numpy
+
+SIZES = [10, 1000, 100000]
+
+def best(func):
+    """ Best time out of three runs """
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+def main(rows=100000):
+    """ Run the benchmark and print a result table """
+    print("%-10s %12s %12s %12s" % ("Weights", "choices()", "Alias", "Alias NumPy"))
+    rnd = random.Random(1)
+    for size in SIZES:
+        weights = [1 / (rank + 1) for rank in range(size)]
+        cum_weights = list(accumulate(weights))
+        population = range(size)
+        table = AliasTable(weights)
+
+        vectorized = float("nan")
+        if numpy is not None:
+            np_random = numpy.random.default_rng(1)
+            vectorized = best(lambda: table.draw_many(rnd, rows, np_random))
+
+        print("%-10d %11.3fs %11.3fs %11.3fs" % (
+            size,
+            best(lambda: rnd.choices(population, cum_weights=cum_weights, k=rows)),
+            best(lambda: table.draw_many(rnd, rows)),
+            vectorized,
+        ))
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -10,8 +10,9 @@ class SeedConfig:
     This is intended to be stored as an instance inside a Flask app
     for access to Flask-Seed configuration.
     """
-    def __init__(self, db):
+    def __init__(self, db, seed=None):
         self.db = db
+        self.seed = seed
 
 
 # pylint: disable=too-few-public-methods
@@ -23,14 +24,16 @@ class FlaskSeeder:
         seeder.init_app(app, db)
 
     """
-    def __init__(self, app=None, db=None):
+    def __init__(self, app=None, db=None, seed=None):
         """ Initialize FlaskSeeder
         Arguments:
             app: Flask app
             db: SQLAlchemy database object
+            seed: Optional master seed for generators, see `flask_seeder.generator.seed()`
         """
         self.app = app
         self.db = db
+        self.seed = seed
 
         if app is not None and db is not None:
             self.init_app(app, db)
@@ -50,4 +53,4 @@ class FlaskSeeder:
         if not hasattr(app, 'extensions'):
             app.extensions = {}
 
-        app.extensions['flask_seeder'] = SeedConfig(self.db)
+        app.extensions['flask_seeder'] = SeedConfig(self.db, seed=self.seed)
@@ -0,0 +1,90 @@
+""" Integer allocators """
+
+import threading
+
+from flask_seeder.database import highest_value
+
+class Allocator:
+    """ Allocator for blocks of consecutive integers
+
+    Sequence generators sharing an allocator never hand out the same integer,
+    also when used from several threads. Blocks are handed out under a lock,
+    so the lock is only taken once per block instead of once per integer.
+    """
+
+    def __init__(self, start=1):
+        """ Initialize allocator
+
+        Arguments:
+            start: First integer to hand out
+        """
+        self._next = start
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_database(cls, session, column, **kwargs):
+        """ Create an allocator starting after the highest value in the database
+
+        Arguments:
+            session: SQLAlchemy session
+            column: Column or ORM attribute, like `User.id`
+        """
+        return cls(start=highest_value(session, column) + 1, **kwargs)
+
+    def allocate(self, size):
+        """ Allocate a block of integers
+
+        Arguments:
+            size: Number of integers in the block
+
+        Returns:
+            The first integer of the block.
+        """
+        with self._lock:
+            first = self._next
+            self._next += size
+
+        return first
+
+class SharedAllocator(Allocator):
+    """ Allocator for blocks of consecutive integers, shared between processes
+
+    The next integer is kept in a `multiprocessing` manager, so the allocator
+    can be sent to worker processes, for example with `Faker.create(workers=...)`.
+    """
+
+    def __init__(self, start=1, manager=None): # pylint: disable=super-init-not-called
+        """ Initialize allocator
+
+        Arguments:
+            start: First integer to hand out
+            manager: Optional `multiprocessing` manager, a new one is started if not set
+        """
+        if manager is None:
+            import multiprocessing # pylint: disable=import-outside-toplevel
+            manager = multiprocessing.Manager()
+
+        self._manager = manager
+        self._next = manager.Value("q", start)
+        self._lock = manager.Lock()
+
+    def __getstate__(self):
+        # The manager stays in the process that started it, the proxies can be shared
+        state = self.__dict__.copy()
+        state["_manager"] = None
+        return state
+
+    def allocate(self, size):
+        """ Allocate a block of integers
+
+        Arguments:
+            size: Number of integers in the block
+
+        Returns:
+            The first integer of the block.
+        """
+        with self._lock:
+            first = self._next.value
+            self._next.value = first + size
+
+        return first
@@ -0,0 +1,71 @@
+""" Bloom filter """
+
+import math
+import hashlib
+
+def digest(value, size=16, key=b""):
+    """ Hash a value with BLAKE2b
+
+    Strings are hashed as UTF-8, other values by their repr().
+
+    Arguments:
+        value: Value to hash
+        size: Digest size in bytes
+        key: Optional key, up to 64 bytes
+
+    Returns:
+        The digest as an integer.
+    """
+    data = value.encode() if isinstance(value, str) else repr(value).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=size, key=key).digest(), "little")
+
+class BloomFilter:
+    """ Bloom filter
+
+    Probabilistic set membership with a fixed memory footprint. Values that
+    have been added are always reported as present, values that haven't been
+    added are reported as present with a probability of about `error_rate`.
+
+    Attributes:
+        size: Number of bits in the filter
+        hashes: Number of bits set per value
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        """ Initialize filter
+
+        Arguments:
+            capacity: Expected number of values
+            error_rate: False positive rate when `capacity` values have been added
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("Invalid bloom filter capacity or error rate")
+
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        hashed = digest(value)
+        first = hashed & 0xFFFFFFFFFFFFFFFF
+        second = hashed >> 64 | 1
+
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def __contains__(self, value):
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+    def add(self, value):
+        """ Add value to the filter
+
+        Returns:
+            True if the value was not already in the filter.
+        """
+        added = False
+        for pos in self._positions(value):
+            mask = 1 << (pos & 7)
+            if not self._bits[pos >> 3] & mask:
+                self._bits[pos >> 3] |= mask
+                added = True
+
+        return added
@@ -5,6 +5,7 @@ $ FLASK_APP=app flask seed <command>
 
 import os
 import re
+import sys
 import importlib.util
 import inspect
 from itertools import groupby, chain
@@ -92,8 +93,13 @@ def get_seeders_from_script(script):
         Returns a list of loaded seeder objects from the script
     """
     seeders = []
-    spec = importlib.util.spec_from_file_location("flask_seeder.seeder.ext", script)
+    # Registered under a name unique to the script, so classes defined in
+    # the script can be pickled, for example by Faker worker processes
+    path = os.path.splitext(os.path.abspath(script))[0]
+    name = "flask_seeder.seeder.ext_" + re.sub(r"\W", "_", path)
+    spec = importlib.util.spec_from_file_location(name, script)
     module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
     spec.loader.exec_module(module)
 
     members = inspect.getmembers(module, inspect.isclass)
@@ -129,6 +135,38 @@ def get_seeders(root=None):
 
     return chain.from_iterable(sorted_seeders)
 
+def run_seeder(seeder, flush_every=None):
+    """ Run a single seeder and report the result
+
+    Arguments:
+        seeder: Seeder instance
+        flush_every: Flush and expunge the session every N objects added with Seeder.add()
+
+    Returns:
+        True if the seeder ran without errors, otherwise False.
+    """
+    if flush_every:
+        seeder.flush_every = flush_every
+
+    try:
+        seeder.run()
+        # Seeders that don't call Seeder.__init__() have no pending objects or flushes
+        if flush_every and getattr(seeder, "pending", 0):
+            seeder.flush()
+        seeder.after_run()
+    # pylint: disable=broad-except,invalid-name
+    except Exception as e:
+        click.echo("%s...\t[ERROR]" % seeder.name)
+        click.echo("\t%s" % e)
+        return False
+
+    click.echo("%s...\t[OK]" % seeder.name)
+    if flush_every:
+        for chunk, (objects, seconds) in enumerate(getattr(seeder, "flushes", ()), start=1):
+            click.echo("\tFlush %d: %d objects in %.3fs" % (chunk, objects, seconds))
+
+    return True
+
 
 @click.group()
 def seed():
@@ -141,9 +179,19 @@ def seed():
 @click.option("--commit/--no-commit", default=True,
               help="Commit changes to database after seeding",
               envvar="FLASK_SEEDER_AUTOCOMMIT")
+@click.option("--flush-every", default=None, type=click.IntRange(min=1),
+              help="Flush and expunge the session every N objects added with Seeder.add()",
+              envvar="FLASK_SEEDER_FLUSH_EVERY")
+@click.option("--commit-per-seeder", is_flag=True, default=False,
+              help="Commit changes after each seeder instead of once after all seeders",
+              envvar="FLASK_SEEDER_COMMIT_PER_SEEDER")
+@click.option("--seed", "seed_value", default=None, type=int,
+              help="Master seed for generators, to produce the same data on every run",
+              envvar="FLASK_SEEDER_SEED")
 @click.argument("seeders", nargs=-1)
 @with_appcontext
-def seed_run(root, commit, seeders):
+def seed_run(root, commit, flush_every, commit_per_seeder, seed_value, seeders):
+    # pylint: disable=too-many-arguments
     """ Run database seeders
 
     Any optional arguments after the options will be treated as a list of seeders to run,
@@ -152,32 +200,46 @@ def seed_run(root, commit, seeders):
         $ flask seed run DemoSeeder AnotherDemoSeeder
 
     """
+    # Imported here to keep other flask commands from loading the generators
+    from flask_seeder import generator # pylint: disable=import-outside-toplevel
+
     click.echo("Running database seeders")
-    db = None
     try:
-        db = app.extensions["flask_seeder"].db
+        config = app.extensions["flask_seeder"]
     except KeyError:
         raise RuntimeError("Flask-Seeder not initialized!")
 
+    db = config.db
+    if seed_value is None:
+        seed_value = config.seed
+
     for seeder in get_seeders(root=root):
         if seeders and seeder.name not in seeders:
             continue
 
         seeder.db = db
-        try:
-            seeder.run()
-        # pylint: disable=broad-except,invalid-name
-        except Exception as e:
-            click.echo("%s...\t[ERROR]" % seeder.name)
-            click.echo("\t%s" % e)
+        if seed_value is not None:
+            # Derive per seeder so a seeder gives the same data when run alone
+            generator.seed(generator.derive_seed(seed_value, seeder.name))
+
+        if not run_seeder(seeder, flush_every):
+            if commit and commit_per_seeder:
+                db.session.rollback()
             continue
 
-        click.echo("%s...\t[OK]" % seeder.name)
+        if commit and commit_per_seeder:
+            db.session.commit()
+
+    if seed_value is not None:
+        generator.seed(None)
 
     if not commit:
         click.echo("Not committing changes to database!")
         return
 
+    if commit_per_seeder:
+        return
+
     click.echo("Committing to database!")
     db.session.commit()
 
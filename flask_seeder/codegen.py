@@ -0,0 +1,511 @@
+""" String Generator pattern code generator
+
+Turns a compiled pattern into a specialized Python function, as an
+alternative to interpreting the AST node by node for every string.
+Regular expressions in Python `re` syntax are compiled the same way.
+"""
+
+import functools
+from itertools import accumulate
+
+try:
+    from re import _parser as sre_parse, _constants as sre
+except ImportError: # pragma: no cover
+    import sre_parse # pylint: disable=deprecated-module
+    import sre_constants as sre # pylint: disable=deprecated-module
+
+# The regex opcodes are created at runtime, so pylint can't see them
+# pylint: disable=no-member
+
+from flask_seeder.parser import ALPHA, COMPILE_CACHE_SIZE, DIGIT, node_choices, node_constant
+
+# Largest fixed repeat that is unrolled into separate choice() calls
+UNROLL_LIMIT = 8
+
+class _Builder:
+    """ Collects expressions and constants for the generated function """
+
+    def __init__(self):
+        self.namespace = {}
+        self.expressions = []
+        self._literal = ""
+
+    def name(self, value):
+        """ Store a value in the function namespace and return its name """
+        name = "_c%d" % len(self.namespace)
+        self.namespace[name] = value
+        return name
+
+    def literal(self, value):
+        """ Add a constant string, merged with adjacent constants """
+        self._literal += value
+
+    def expression(self, expression):
+        """ Add a Python expression producing a string """
+        if self._literal:
+            self.expressions.append(repr(self._literal))
+            self._literal = ""
+        self.expressions.append(expression)
+
+    def source(self):
+        """ Get the function source code """
+        self.expression(None)
+        body = " + ".join(expr for expr in self.expressions if expr) or "''"
+        return ("def generate(rnd):\n"
+                "    choice = rnd.choice\n"
+                "    choices = rnd.choices\n"
+                "    randint = rnd.randint\n"
+                "    return %s\n" % body)
+
+def _repeat(builder, node, pool):
+    repeat = node.get("repeat", {"type": "QUANTIFIER", "value": 1})
+
+    constant = None
+    if pool is not None and len(pool) == 1:
+        pool, constant = None, pool[0]
+    elif pool is None:
+        constant = node_constant(node)
+
+    if repeat["type"] == "QUANTIFIER_RANGE":
+        size = "randint(%d, %d)" % (repeat["value"]["start"], repeat["value"]["end"])
+        if pool is None:
+            builder.expression("%r * %s" % (constant, size))
+        else:
+            builder.expression("''.join(choices(%s, k=%s))" % (builder.name(pool), size))
+        return
+
+    count = repeat["value"]
+    if pool is None:
+        builder.literal(constant * count)
+    elif count <= UNROLL_LIMIT:
+        name = builder.name(pool)
+        for _ in range(count):
+            builder.expression("choice(%s)" % name)
+    else:
+        builder.expression("''.join(choices(%s, k=%d))" % (builder.name(pool), count))
+
+def source(pattern):
+    """ Generate Python source for a compiled pattern
+
+    Arguments:
+        pattern: A Pattern from `flask_seeder.parser.compile()`
+
+    Returns:
+        Tuple with the source code of a `generate(rnd)` function and a
+        dictionary with the constants it uses.
+    """
+    builder = _Builder()
+    for node in pattern.ast:
+        _repeat(builder, node, node_choices(node))
+
+    return builder.source(), builder.namespace
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_function(pattern):
+    """ Compile a pattern into a Python function
+
+    All choices, ranges and constants are computed once, constant parts
+    are folded together and short repeats are unrolled.
+
+    Arguments:
+        pattern: A Pattern from `flask_seeder.parser.compile()`
+
+    Returns:
+        A function that takes a random number generator and returns
+        a string matching the pattern.
+    """
+    code, namespace = source(pattern)
+    code = compile(code, "<pattern %r>" % pattern.pattern, "exec")
+    exec(code, namespace) # pylint: disable=exec-used
+    return namespace["generate"]
+
+
+# Regular expression support
+
+# Characters used for ".", negated character classes and categories
+PRINTABLE = "".join(chr(code) for code in range(32, 127))
+WHITESPACE = " \t\n\r\f\v"
+WORD = ALPHA + DIGIT + "_"
+
+CATEGORIES = {
+    sre.CATEGORY_DIGIT: DIGIT,
+    sre.CATEGORY_NOT_DIGIT: "".join(c for c in PRINTABLE if c not in DIGIT),
+    sre.CATEGORY_SPACE: WHITESPACE,
+    sre.CATEGORY_NOT_SPACE: "".join(c for c in PRINTABLE if c not in WHITESPACE),
+    sre.CATEGORY_WORD: WORD,
+    sre.CATEGORY_NOT_WORD: "".join(c for c in PRINTABLE if c not in WORD),
+}
+
+REPEATS = (sre.MAX_REPEAT, sre.MIN_REPEAT, getattr(sre, "POSSESSIVE_REPEAT", sre.MAX_REPEAT))
+
+# Largest number of extra repetitions for unbounded quantifiers like * and +
+REPEAT_LIMIT = 8
+
+def _character_class(items):
+    """ Get the characters matched by the items of a regex character class """
+    chars = []
+    negate = False
+    for op, value in items:
+        if op is sre.NEGATE:
+            negate = True
+        elif op is sre.LITERAL:
+            chars.append(chr(value))
+        elif op is sre.RANGE:
+            chars.extend(chr(code) for code in range(value[0], value[1] + 1))
+        elif op is sre.CATEGORY and value in CATEGORIES:
+            chars.extend(CATEGORIES[value])
+        else:
+            raise ValueError("Unsupported character class item %s" % op)
+
+    chars = tuple(dict.fromkeys(chars))
+    if negate:
+        chars = tuple(c for c in PRINTABLE if c not in chars)
+
+    if not chars:
+        raise ValueError("Character class matches no characters")
+
+    return chars
+
+def _single_character(op, value):
+    """ Get the characters a single character item chooses from, or None """
+    if op is sre.LITERAL:
+        return (chr(value),)
+    if op is sre.NOT_LITERAL:
+        return tuple(c for c in PRINTABLE if c != chr(value))
+    if op is sre.ANY:
+        return tuple(PRINTABLE)
+    if op is sre.IN:
+        return _character_class(value)
+
+    return None
+
+def _group_references(items):
+    """ Find all group numbers used in backreferences """
+    result = set()
+    for op, value in items:
+        if op is sre.GROUPREF:
+            result.add(value)
+        elif op is sre.BRANCH:
+            for branch in value[1]:
+                result |= _group_references(branch)
+        elif op in REPEATS:
+            result |= _group_references(value[2])
+        elif op is sre.SUBPATTERN:
+            result |= _group_references(value[-1])
+
+    return result
+
+def _matched_groups(items, matched=frozenset()):
+    """ Check backreferences and find the groups that always take part in a match
+
+    A backreference to a group that may not have taken part in the match,
+    like `\\2` in `((a)|b)\\2`, makes the whole match fail in `re`, so no
+    string could be generated for it.
+
+    Arguments:
+        items: Parsed regular expression items
+        matched: Groups that always take part in the match before `items`
+
+    Returns:
+        `matched` plus the groups that always take part in a match of `items`.
+    """
+    matched = set(matched)
+    for op, value in items:
+        if op is sre.GROUPREF and value not in matched:
+            raise ValueError("Backreference to group %d, which may not take part in the match"
+                             % value)
+        if op is sre.BRANCH:
+            matched = set.intersection(*[_matched_groups(branch, matched)
+                                         for branch in value[1]])
+        elif op in REPEATS:
+            repeated = _matched_groups(value[2], matched)
+            if value[0] > 0:
+                matched = repeated
+        elif op is sre.SUBPATTERN:
+            matched = _matched_groups(value[-1], matched)
+            if value[0] is not None:
+                matched.add(value[0])
+
+    return matched
+
+class _RegexBuilder(_Builder):
+    """ Collects statements for a function generated from a regular expression """
+
+    def __init__(self, references):
+        super().__init__()
+        self.references = references
+        self.lines = []
+        self._indent = 1
+        self._variables = 0
+
+    def variable(self):
+        """ Get a new local variable name """
+        self._variables += 1
+        return "_v%d" % self._variables
+
+    def flush(self):
+        """ Emit pending constant string """
+        if self._literal:
+            literal, self._literal = self._literal, ""
+            self.append(repr(literal))
+
+    def statement(self, code):
+        """ Add a statement """
+        self.flush()
+        self.lines.append(("    " * self._indent, code, None))
+
+    def append(self, expression):
+        """ Add an expression producing part of the string """
+        self.flush()
+        self.lines.append(("    " * self._indent, "append(%s)" % expression, expression))
+
+    def indent(self):
+        """ Start a block """
+        self.flush()
+        self._indent += 1
+
+    def dedent(self):
+        """ End a block """
+        self.flush()
+        self._indent -= 1
+
+    def source(self):
+        """ Get the function source code """
+        self.flush()
+        header = ("def generate(rnd):\n"
+                  "    choice = rnd.choice\n"
+                  "    choices = rnd.choices\n"
+                  "    randint = rnd.randint\n")
+
+        if all(expression is not None for _, _, expression in self.lines):
+            body = " + ".join(expression for _, _, expression in self.lines) or "''"
+            return header + "    return %s\n" % body
+
+        lines = ["    out = []", "    append = out.append"]
+        lines.extend("    g%d = ''" % group for group in sorted(self.references))
+        lines.extend(indent + code for indent, code, _ in self.lines)
+        lines.append("    return ''.join(out)")
+        return header + "\n".join(lines) + "\n"
+
+def _emit_repeat(builder, low, high, items):
+    if high is sre.MAXREPEAT:
+        high = low + REPEAT_LIMIT
+    size = str(low) if low == high else "randint(%d, %d)" % (low, high)
+
+    chars = _single_character(*items[0]) if len(items) == 1 else None
+    if chars is not None and len(chars) == 1:
+        if low == high:
+            builder.literal(chars[0] * low)
+        else:
+            builder.append("%r * %s" % (chars[0], size))
+    elif chars is not None:
+        builder.append("''.join(choices(%s, k=%s))" % (builder.name(chars), size))
+    elif high > 0:
+        builder.statement("for _ in range(%s):" % size)
+        builder.indent()
+        _emit_regex(builder, items)
+        builder.dedent()
+
+def _emit_branch(builder, branches):
+    variable = builder.variable()
+    builder.statement("%s = randint(0, %d)" % (variable, len(branches) - 1))
+    for index, branch in enumerate(branches):
+        builder.statement("%s %s == %d:" % ("if" if index == 0 else "elif", variable, index))
+        builder.indent()
+        start = len(builder.lines)
+        _emit_regex(builder, branch)
+        builder.flush()
+        if len(builder.lines) == start:
+            builder.statement("pass")
+        builder.dedent()
+
+def _emit_regex(builder, items):
+    for op, value in items:
+        chars = _single_character(op, value)
+        if chars is not None and len(chars) == 1:
+            builder.literal(chars[0])
+        elif chars is not None:
+            builder.append("choice(%s)" % builder.name(chars))
+        elif op in REPEATS:
+            _emit_repeat(builder, value[0], value[1], value[2])
+        elif op is sre.BRANCH:
+            _emit_branch(builder, value[1])
+        elif op is sre.SUBPATTERN and value[0] in builder.references:
+            start = builder.variable()
+            builder.statement("%s = len(out)" % start)
+            _emit_regex(builder, value[-1])
+            builder.statement("g%d = ''.join(out[%s:])" % (value[0], start))
+        elif op is sre.SUBPATTERN:
+            _emit_regex(builder, value[-1])
+        elif op is sre.GROUPREF:
+            builder.append("g%d" % value)
+        elif op is not sre.AT:
+            raise ValueError("Unsupported regular expression construct %s" % op)
+
+def regex_source(pattern):
+    """ Generate Python source for a regular expression
+
+    Arguments:
+        pattern: Regular expression in Python `re` syntax
+
+    Returns:
+        Tuple with the source code of a `generate(rnd)` function and a
+        dictionary with the constants it uses.
+    """
+    items = list(sre_parse.parse(pattern))
+    _matched_groups(items)
+    builder = _RegexBuilder(_group_references(items))
+    _emit_regex(builder, items)
+
+    return builder.source(), builder.namespace
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_regex(pattern):
+    """ Compile a regular expression into a Python function
+
+    The expression is parsed once with the regex parser from the standard library
+    and turned into a function that generates matching strings, in the same way
+    `compile_function()` does for String patterns.
+
+    Supported are literals, character classes and categories, `.`, groups,
+    alternation, backreferences and quantifiers. Unbounded quantifiers like `*`
+    and `+` repeat at most REPEAT_LIMIT times more than their minimum. Anchors
+    and word boundaries are ignored, lookarounds and conditionals raise ValueError,
+    as do backreferences to groups that may not take part in the match.
+
+    Arguments:
+        pattern: Regular expression in Python `re` syntax
+
+    Returns:
+        A function that takes a random number generator and returns
+        a string matching the expression.
+    """
+    code, namespace = regex_source(pattern)
+    exec(compile(code, "<regex %r>" % pattern, "exec"), namespace) # pylint: disable=exec-used
+    return namespace["generate"]
+
+
+class _ColumnBuilder(_Builder):
+    """ Collects columns for a function generating a batch of strings from a regular expression """
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.columns = []
+        self.format = ""
+
+    def literal(self, value):
+        """ Add a constant string to the format of every string """
+        self.format += value.replace("%", "%%")
+
+    def column(self, *lines):
+        """ Add a column, computed by `lines` into the variable `_col` """
+        name = "_v%d" % (len(self.columns) + 1)
+        self.lines.extend("    " + line.replace("_col", name) for line in lines)
+        self.columns.append(name)
+        self.format += "%s"
+
+    def source(self):
+        """ Get the function source code """
+        header = ("def generate_many(rnd, n):\n"
+                  "    choices = rnd.choices\n"
+                  "    randint = rnd.randint\n")
+
+        if not self.columns:
+            body = "    return [%r] * n" % self.format.replace("%%", "%")
+        elif self.format == "%s":
+            body = "\n".join(self.lines) + "\n    return %s" % self.columns[0]
+        else:
+            body = "\n".join(self.lines) + "\n    return [%s %% row for row in zip(%s)]" % (
+                self.name(self.format), ", ".join(self.columns))
+
+        return header + body + "\n"
+
+def _regex_function(items):
+    """ Compile regular expression items into a `generate(rnd)` function """
+    builder = _RegexBuilder(_group_references(items))
+    _emit_regex(builder, items)
+    code, namespace = builder.source(), builder.namespace
+    exec(compile(code, "<regex>", "exec"), namespace) # pylint: disable=exec-used
+    return namespace["generate"]
+
+def _emit_column_repeat(builder, low, high, chars):
+    if high is sre.MAXREPEAT:
+        high = low + REPEAT_LIMIT
+
+    if high == 0:
+        return
+    if len(chars) == 1 and low == high:
+        builder.literal(chars[0] * low)
+    elif len(chars) == 1:
+        builder.column("_col = [%r * randint(%d, %d) for _ in range(n)]" % (chars[0], low, high))
+    elif low == high:
+        builder.column("_col = ''.join(choices(%s, k=%d * n))" % (builder.name(chars), low),
+                       "_col = [_col[i:i + %d] for i in range(0, %d * n, %d)]" % (low, low, low))
+    else:
+        builder.column("_sizes = [randint(%d, %d) for _ in range(n)]" % (low, high),
+                       "_col = ''.join(choices(%s, k=sum(_sizes)))" % builder.name(chars),
+                       "_ends = accumulate(_sizes)",
+                       "_col = [_col[end - size:end] for size, end in zip(_sizes, _ends)]")
+
+def _emit_columns(builder, items):
+    for op, value in items:
+        chars = _single_character(op, value)
+        repeated = (_single_character(*value[2][0])
+                    if op in REPEATS and len(value[2]) == 1 else None)
+        if chars is not None and len(chars) == 1:
+            builder.literal(chars[0])
+        elif chars is not None:
+            builder.column("_col = choices(%s, k=n)" % builder.name(chars))
+        elif repeated is not None:
+            _emit_column_repeat(builder, value[0], value[1], repeated)
+        elif op is sre.SUBPATTERN:
+            _emit_columns(builder, value[-1])
+        elif op is not sre.AT:
+            function = builder.name(_regex_function([(op, value)]))
+            builder.column("_col = [%s(rnd) for _ in range(n)]" % function)
+
+def regex_columns_source(pattern):
+    """ Generate Python source for a batch of strings from a regular expression
+
+    Every top-level item of the expression becomes a column with its part of
+    all strings in the batch. Characters and repeated characters are drawn for
+    the whole column with a single choices() call, other items like alternations
+    are generated one string at a time. The columns are joined at the end.
+    Expressions with backreferences are generated one string at a time.
+
+    Arguments:
+        pattern: Regular expression in Python `re` syntax
+
+    Returns:
+        Tuple with the source code of a `generate_many(rnd, n)` function and a
+        dictionary with the constants it uses.
+    """
+    items = list(sre_parse.parse(pattern))
+    _matched_groups(items)
+    builder = _ColumnBuilder()
+    builder.namespace["accumulate"] = accumulate
+    if _group_references(items):
+        function = builder.name(_regex_function(items))
+        builder.column("_col = [%s(rnd) for _ in range(n)]" % function)
+    else:
+        _emit_columns(builder, items)
+
+    return builder.source(), builder.namespace
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_regex_many(pattern):
+    """ Compile a regular expression into a function generating batches of strings
+
+    See `regex_columns_source()` and `compile_regex()`.
+
+    Arguments:
+        pattern: Regular expression in Python `re` syntax
+
+    Returns:
+        A function that takes a random number generator and a number `n`, and
+        returns a list of `n` strings matching the expression.
+    """
+    code, namespace = regex_columns_source(pattern)
+    exec(compile(code, "<regex %r>" % pattern, "exec"), namespace) # pylint: disable=exec-used
+    return namespace["generate_many"]
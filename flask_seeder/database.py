@@ -0,0 +1,60 @@
+""" Database helpers
+
+Functions to query and update tables that generated rows are inserted into.
+SQLAlchemy is imported when they are called, it is not needed otherwise.
+"""
+
+def _column(column):
+    """ Get the table column of an ORM attribute or column """
+    return getattr(column, "expression", column)
+
+def highest_value(session, column):
+    """ Get the highest value of a column in the database
+
+    Arguments:
+        session: SQLAlchemy session
+        column: Column or ORM attribute, like `User.id`
+
+    Returns:
+        The highest value, or 0 if the table is empty.
+    """
+    from sqlalchemy import func # pylint: disable=import-outside-toplevel
+
+    return session.query(func.max(_column(column))).scalar() or 0
+
+def sync_sequence(session, column):
+    """ Move the database sequence of a column past its highest value
+
+    Rows inserted with explicit keys, for example from a Sequence generator,
+    don't move the sequence the database uses for keys it assigns itself.
+    Call this after inserting such rows so the database doesn't hand out
+    keys that are already taken. Supported for PostgreSQL, MySQL/MariaDB
+    and SQLite, where AUTOINCREMENT tables keep their own counter.
+
+    Arguments:
+        session: SQLAlchemy session
+        column: Column or ORM attribute, like `User.id`
+    """
+    from sqlalchemy import text # pylint: disable=import-outside-toplevel
+
+    column = _column(column)
+    table = column.table
+    value = highest_value(session, column)
+    dialect = session.get_bind().dialect
+
+    if dialect.name == "postgresql":
+        session.execute(
+            text("SELECT setval(pg_get_serial_sequence(:table, :column), :value, :called)"),
+            {"table": table.fullname, "column": column.name, "value": max(value, 1),
+             "called": value > 0},
+        )
+    elif dialect.name in ("mysql", "mariadb"):
+        session.execute(text("ALTER TABLE %s AUTO_INCREMENT = %d"
+                             % (dialect.identifier_preparer.format_table(table), value + 1)))
+    elif dialect.name == "sqlite":
+        exists = text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'")
+        if session.execute(exists).first():
+            session.execute(text("UPDATE sqlite_sequence SET seq = :value WHERE name = :table"),
+                            {"value": value, "table": table.name})
+    else:
+        raise NotImplementedError("Unable to sync sequences for %s" % dialect.name)
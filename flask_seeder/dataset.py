@@ -0,0 +1,390 @@
+""" Dataset formats
+
+Text datasets have one entry per line, optionally followed by a tab and
+the weight of the entry. Entries without a weight have weight 1.
+
+Binary datasets are stored as a header, an array of offsets, optionally an
+array of weights and one packed UTF-8 blob with all entries. The file is
+memory mapped, so loading a dataset costs next to nothing, and the pages are
+shared between processes using the same file. An entry is decoded only when
+it is looked up.
+
+Binary datasets are built from the text files in the data directory with
+
+    $ python -m flask_seeder.dataset [-o DIRECTORY] [text files...]
+
+which writes a `.bin` file next to each text file, or into DIRECTORY.
+
+Datasets are loaded once per process with load_dataset() and shared by
+all generators using them.
+"""
+
+import os
+import sys
+import mmap
+import struct
+import threading
+from array import array
+from collections.abc import Sequence
+
+from flask_seeder.distribution import AliasTable
+
+MAGIC = b"FSDS"
+VERSION = 1
+# Same as VERSION, with an array of weights after the offsets
+VERSION_WEIGHTED = 2
+
+# Magic, format version and number of entries
+HEADER = struct.Struct("<4sIQ")
+
+# File suffix of binary datasets
+SUFFIX = ".bin"
+
+def parse_lines(lines):
+    """ Split text dataset lines into entries and weights
+
+    Arguments:
+        lines: List of lines, each an entry optionally followed by a tab and a weight
+
+    Returns:
+        Tuple with a tuple of entries and a tuple of weights,
+        or None instead of the weights if no line has a weight.
+    """
+    if not any("\t" in line for line in lines):
+        return tuple(lines), None
+
+    entries = []
+    weights = []
+    for line in lines:
+        entry, tab, weight = line.rpartition("\t")
+        entries.append(entry if tab else weight)
+        weights.append(float(weight) if tab else 1.0)
+
+    return tuple(entries), tuple(weights)
+
+def build(entries, path, weights=None):
+    """ Write a binary dataset
+
+    Arguments:
+        entries: Iterable with the strings in the dataset
+        path: Path of the binary dataset file to write
+        weights: Optional weight of each entry
+    """
+    encoded = [entry.encode("utf-8") for entry in entries]
+    if weights is not None:
+        weights = array("d", weights)
+        if len(weights) != len(encoded):
+            raise ValueError("Expected one weight per entry")
+
+    # Offsets are absolute file positions, entry i is at offsets[i]:offsets[i+1]
+    start = HEADER.size + 8 * (len(encoded) + 1) + (0 if weights is None else 8 * len(encoded))
+    offsets = array("Q", [start])
+    for entry in encoded:
+        offsets.append(offsets[-1] + len(entry))
+
+    if sys.byteorder == "big": # pragma: no cover
+        offsets.byteswap()
+        if weights is not None:
+            weights.byteswap()
+
+    with open(path, "wb") as target:
+        version = VERSION if weights is None else VERSION_WEIGHTED
+        target.write(HEADER.pack(MAGIC, version, len(encoded)))
+        target.write(offsets.tobytes())
+        if weights is not None:
+            target.write(weights.tobytes())
+        target.write(b"".join(encoded))
+
+def build_text(path, directory=None):
+    """ Build a binary dataset from a text dataset
+
+    Arguments:
+        path: Path of the text file
+        directory: Directory to write the binary dataset to, next to the text file if not set
+
+    Returns:
+        Path of the binary dataset, the text file name with a `.bin` suffix.
+    """
+    target = os.path.splitext(path)[0] + SUFFIX
+    if directory is not None:
+        target = os.path.join(directory, os.path.basename(target))
+    with open(path, encoding="utf-8") as source:
+        entries, weights = parse_lines(source.read().splitlines())
+
+    build(entries, target, weights)
+    return target
+
+def text_files(root=None):
+    """ Find all text datasets
+
+    Arguments:
+        root: Directory to search, the bundled data directory if not set
+
+    Returns:
+        A sorted list with the paths of all `.txt` files below `root`.
+    """
+    if root is None:
+        root = os.path.join(os.path.dirname(__file__), "data")
+
+    return sorted(
+        os.path.join(path, name)
+        for path, _, names in os.walk(root)
+        for name in names if name.endswith(".txt")
+    )
+
+class Dataset(Sequence):
+    """ Memory mapped binary dataset
+
+    Behaves like a read-only sequence of strings, so it can be passed to
+    `random.choice()` and `random.choices()` like a list.
+
+    Attributes:
+        path: Path of the binary dataset file
+        weights: Sequence with the weight of each entry, None if the dataset has no weights
+    """
+
+    def __init__(self, path):
+        """ Open binary dataset
+
+        Arguments:
+            path: Path of the binary dataset file
+        """
+        self.path = path
+        with open(path, "rb") as source:
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self._size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version not in (VERSION, VERSION_WEIGHTED):
+            raise ValueError("Unsupported dataset file %s" % path)
+
+        start = HEADER.size
+        end = start + 8 * (self._size + 1)
+        self._offsets = self._array(start, end, "Q")
+
+        self.weights = None
+        if version == VERSION_WEIGHTED:
+            self.weights = self._array(end, end + 8 * self._size, "d")
+
+    def _array(self, start, end, typecode):
+        """ View part of the file as an array of 8 byte little endian values """
+        data = memoryview(self._mmap)[start:end]
+        if sys.byteorder == "little":
+            return data.cast(typecode)
+
+        values = array(typecode, data.tobytes()) # pragma: no cover
+        values.byteswap() # pragma: no cover
+        return values # pragma: no cover
+
+    def __reduce__(self):
+        # Reopen the file instead of copying the contents
+        return (Dataset, (self.path,))
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+
+        if not 0 <= index < self._size:
+            raise IndexError("dataset index out of range")
+
+        offsets = self._offsets
+        return str(self._mmap[offsets[index]:offsets[index + 1]], "utf-8")
+
+    def take(self, indices):
+        """ Look up many entries at once
+
+        Faster than looking up the entries one by one.
+
+        Arguments:
+            indices: Iterable with entry indices, from 0 to len(dataset) - 1
+
+        Returns:
+            A list with the entries.
+        """
+        blob = self._mmap
+        offsets = self._offsets
+        return [str(blob[offsets[i]:offsets[i + 1]], "utf-8") for i in indices]
+
+# Datasets shipped with Flask-Seeder
+NAMES = "names/names.txt"
+DOMAINS = "domains/domains.txt"
+
+# Datasets and alias tables loaded by load_dataset(), shared by all generators in the process
+_DATASETS = {}
+_DATASETS_LOCK = threading.Lock()
+
+def resource_path(path):
+    """ Get the resource path
+
+    Arguments:
+        path: Relative path to the resource, absolute paths are returned as is
+
+    Returns:
+        Returns the full filesystem path to the resource.
+        Note that no validation is made to ensure the resource actually exist.
+    """
+    if os.path.isabs(path):
+        return path
+
+    try:
+        # Imported here as importlib.resources is slow to import
+        from importlib.resources import files # pylint: disable=import-outside-toplevel
+    except ImportError: # pragma: no cover
+        # Python < 3.9
+        return os.path.join(os.path.dirname(__file__), "data", path)
+
+    return str(files("flask_seeder").joinpath("data/" + path))
+
+def read_resource(path):
+    """ Read resource text file
+
+    Reads resource text file and returns content as a list.
+
+    Arguments:
+        path: The resource path relative to the data root directory
+
+    Returns:
+        A list with the file contents.
+    """
+    lines = []
+    with open(resource_path(path)) as source:
+        lines = source.read().splitlines()
+
+    return lines
+
+def load_dataset(path):
+    """ Get a shared dataset
+
+    The resource is read the first time it is asked for and kept for the
+    lifetime of the process, or until evicted with evict_datasets().
+    All generators using the same resource share the same dataset.
+
+    If a binary dataset built with `python -m flask_seeder.dataset` exists next
+    to the text file, and is not older than the text file, it is memory mapped
+    instead of reading the text file. A path to a binary dataset can also be
+    given directly.
+
+    Arguments:
+        path: The resource path relative to the data root directory
+
+    Returns:
+        A tuple with the dataset entries, or a `flask_seeder.dataset.Dataset`.
+    """
+    return _load_dataset(path)[0]
+
+def load_alias_table(path):
+    """ Get the alias table of a shared dataset
+
+    Built from the entry weights when the dataset is loaded, see load_dataset().
+
+    Arguments:
+        path: The resource path relative to the data root directory
+
+    Returns:
+        An AliasTable, or None if the dataset has no weights.
+    """
+    return _load_dataset(path)[1]
+
+def _load_dataset(path):
+    loaded = _DATASETS.get(path)
+    if loaded is None:
+        with _DATASETS_LOCK:
+            loaded = _DATASETS.get(path)
+            if loaded is None:
+                binary = _binary_path(resource_path(path))
+                if binary is not None:
+                    dataset = Dataset(binary)
+                    weights = dataset.weights
+                else:
+                    dataset, weights = parse_lines(read_resource(path))
+
+                loaded = (dataset, None if weights is None else AliasTable(weights))
+                _DATASETS[path] = loaded
+
+    return loaded
+
+def _binary_path(text):
+    """ Get the binary dataset for a text file
+
+    Returns:
+        Path of the binary dataset next to `text`, or None if there is none or
+        it is older than the text file, for example after the text file was edited.
+    """
+    binary = os.path.splitext(text)[0] + SUFFIX
+    if not os.path.exists(binary):
+        return None
+
+    if binary != text and os.path.exists(text):
+        if os.path.getmtime(binary) < os.path.getmtime(text):
+            return None
+
+    return binary
+
+def take(dataset, indices):
+    """ Look up many entries of a dataset from load_dataset()
+
+    Arguments:
+        dataset: Tuple or binary dataset
+        indices: Iterable with entry indices
+
+    Returns:
+        A list with the entries.
+    """
+    if isinstance(dataset, Dataset):
+        return dataset.take(indices)
+
+    return [dataset[i] for i in indices]
+
+def preload_datasets(*paths):
+    """ Load datasets up front
+
+    Useful before forking worker processes, so the datasets are loaded
+    once and shared with the workers instead of being read by each of them.
+
+    Arguments:
+        paths: Resource paths to load, all datasets used by the built in
+            generators if none are given
+    """
+    for path in paths or (NAMES, DOMAINS):
+        load_dataset(path)
+
+def evict_datasets(*paths):
+    """ Drop loaded datasets from memory
+
+    Generators load evicted datasets again the next time they need them.
+
+    Arguments:
+        paths: Resource paths to evict, all loaded datasets if none are given
+    """
+    with _DATASETS_LOCK:
+        if not paths:
+            _DATASETS.clear()
+        for path in paths:
+            _DATASETS.pop(path, None)
+
+def main(argv=None):
+    """ Build binary datasets from text files, all bundled datasets by default """
+    import argparse # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(prog="python -m flask_seeder.dataset",
+                                     description="Build binary datasets from text datasets")
+    parser.add_argument("paths", nargs="*", metavar="path",
+                        help="text dataset, all bundled datasets if none are given")
+    parser.add_argument("-o", "--output", metavar="DIRECTORY",
+                        help="directory to write the binary datasets to, "
+                             "instead of next to the text files")
+    args = parser.parse_args(argv)
+
+    if args.output is not None:
+        os.makedirs(args.output, exist_ok=True)
+
+    for path in args.paths or text_files():
+        print("%s -> %s" % (path, build_text(path, args.output)))
+
+if __name__ == "__main__":
+    main()
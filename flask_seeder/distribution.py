@@ -0,0 +1,322 @@
+""" Distributions
+
+Distributions draw indexes from a range, used by generators to pick
+values with a skew instead of uniformly.
+"""
+
+import math
+import functools
+from array import array
+
+class AliasTable:
+    """ Walker alias table
+
+    Draws indexes from a discrete distribution in constant time, no matter
+    the number of weights. Every index owns a slot with the probability of
+    keeping it, and an alias that is drawn instead otherwise.
+
+    Attributes:
+        size: Number of weights
+    """
+
+    def __init__(self, weights):
+        """ Build alias table with Vose's method
+
+        Arguments:
+            weights: Non-negative weight of each index
+        """
+        self.size = len(weights)
+        total = math.fsum(weights)
+        if not self.size or total <= 0 or min(weights) < 0:
+            raise ValueError("Weights must be non-negative and not all zero")
+
+        scaled = [weight * self.size / total for weight in weights]
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+
+        self._probability = array("d", [1.0]) * self.size
+        self._alias = array("q", range(self.size))
+        while small and large:
+            less, more = small.pop(), large[-1]
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(large.pop())
+
+    def __len__(self):
+        return self.size
+
+    def draw(self, rnd):
+        """ Draw an index using `rnd` """
+        value = rnd.random() * self.size
+        index = int(value)
+        return index if value - index < self._probability[index] else self._alias[index]
+
+    def draw_many(self, rnd, n, np_random=None):
+        """ Draw `n` indexes
+
+        Arguments:
+            rnd: Random number generator
+            n: Number of indexes
+            np_random: Optional NumPy random generator, drawn from instead of `rnd`
+
+        Returns:
+            A list of indexes.
+        """
+        size = self.size
+        if np_random is not None:
+            import numpy as np # pylint: disable=import-outside-toplevel
+            probability = np.frombuffer(self._probability, dtype=np.float64)
+            alias = np.frombuffer(self._alias, dtype=np.int64)
+            values = np_random.random(n) * size
+            indexes = values.astype(np.int64)
+            return np.where(values - indexes < probability[indexes],
+                            indexes, alias[indexes]).tolist()
+
+        random_ = rnd.random
+        probability = self._probability
+        alias = self._alias
+        result = []
+        append = result.append
+        for _ in range(n):
+            value = random_() * size
+            index = int(value)
+            append(index if value - index < probability[index] else alias[index])
+
+        return result
+
+class Distribution:
+    """ Base class for distributions
+
+    A distribution draws indexes into `range(size)`, which generators map onto
+    their values: the integers from `start` to `end`, or the entries of a dataset.
+    """
+
+    def draw(self, rnd, size):
+        """ Draw an index from `range(size)` using `rnd` """
+        raise NotImplementedError()
+
+    def draw_many(self, rnd, size, n, np_random=None): # pylint: disable=unused-argument
+        """ Draw `n` indexes from `range(size)`
+
+        Arguments:
+            rnd: Random number generator
+            size: Number of values to draw from
+            n: Number of indexes
+            np_random: Optional NumPy random generator, drawn from instead of `rnd`
+
+        Returns:
+            A list of indexes.
+        """
+        return [self.draw(rnd, size) for _ in range(n)]
+
+class Categorical(Distribution):
+    """ Draw each index with its own weight """
+
+    def __init__(self, weights):
+        """ Initialize distribution
+
+        Arguments:
+            weights: Non-negative weight of each index
+        """
+        self.weights = tuple(weights)
+        self._table = AliasTable(self.weights)
+
+    def _check(self, size):
+        if size != len(self.weights):
+            raise ValueError("Expected %d weights, got %d" % (size, len(self.weights)))
+
+    def draw(self, rnd, size):
+        self._check(size)
+        return self._table.draw(rnd)
+
+    def draw_many(self, rnd, size, n, np_random=None):
+        self._check(size)
+        return self._table.draw_many(rnd, n, np_random)
+
+class _RejectionInversion:
+    """ Zipf sampler for ranges too large for an alias table
+
+    Rejection-inversion sampling, see W. Hormann and G. Derflinger, "Rejection-inversion
+    to generate variates from monotone discrete distributions" (1996). A point is drawn
+    by inversion from a continuous hat function over the ranks, and its nearest rank
+    is accepted with the right probability. Needs no memory per value and accepts
+    nearly every draw at the first try.
+    """
+
+    def __init__(self, size, exponent):
+        self.size = size
+        self.exponent = exponent
+        self._first = self._integral(1.5, math) - 1
+        self._last = self._integral(size + 0.5, math)
+        self._threshold = 2 - self._inverse(self._integral(2.5, math) - 2 ** -exponent, math)
+
+    def __len__(self):
+        return self.size
+
+    def _integral(self, x, xp):
+        """ Integral of the hat function `x ** -exponent`, with `xp` either math or NumPy """
+        if self.exponent == 1:
+            return xp.log(x)
+
+        exponent = 1 - self.exponent
+        return xp.expm1(exponent * xp.log(x)) / exponent
+
+    def _inverse(self, x, xp):
+        """ Inverse of _integral() """
+        if self.exponent == 1:
+            return xp.exp(x)
+
+        exponent = 1 - self.exponent
+        return xp.exp(xp.log1p(exponent * x) / exponent)
+
+    def draw(self, rnd):
+        """ Draw an index using `rnd` """
+        while True:
+            value = self._last + rnd.random() * (self._first - self._last)
+            x = self._inverse(value, math)
+            rank = min(max(int(x + 0.5), 1), self.size)
+            if (rank - x <= self._threshold
+                    or value >= self._integral(rank + 0.5, math) - rank ** -self.exponent):
+                return rank - 1
+
+    def draw_many(self, rnd, n, np_random=None):
+        """ Draw `n` indexes, see AliasTable.draw_many() """
+        if np_random is None:
+            return [self.draw(rnd) for _ in range(n)]
+
+        import numpy as np # pylint: disable=import-outside-toplevel
+        indexes = np.empty(n, dtype=np.int64)
+        pending = np.arange(n)
+        while pending.size:
+            values = self._last + np_random.random(pending.size) * (self._first - self._last)
+            x = self._inverse(values, np)
+            ranks = np.clip(np.floor(x + 0.5), 1, self.size)
+            accepted = ((ranks - x <= self._threshold)
+                        | (values >= self._integral(ranks + 0.5, np) - ranks ** -self.exponent))
+            indexes[pending[accepted]] = ranks[accepted] - 1
+            pending = pending[~accepted]
+
+        return indexes.tolist()
+
+# Tables of up to TABLE_LIMIT values take about 1.6MB each
+@functools.lru_cache(maxsize=2)
+def _zipf_table(size, exponent):
+    return AliasTable([1 / rank ** exponent for rank in range(1, size + 1)])
+
+class Zipf(Distribution):
+    """ Zipf distribution
+
+    Index `k` is drawn with a probability proportional to `1 / (k + 1) ** exponent`,
+    so the first values are drawn far more often than the rest. Up to TABLE_LIMIT
+    values, draws use an alias table that is built once for each size and shared
+    between all Zipf distributions. Larger ranges, of any size, use rejection-inversion
+    sampling instead, which is a few times slower per draw but needs no table.
+    """
+    TABLE_LIMIT = 10**5
+
+    def __init__(self, exponent=1.0):
+        """ Initialize distribution
+
+        Arguments:
+            exponent: Larger exponents concentrate more draws on the first values
+        """
+        if exponent <= 0:
+            raise ValueError("Zipf exponent must be positive")
+
+        self.exponent = exponent
+
+    def _sampler(self, size):
+        if size > self.TABLE_LIMIT:
+            return _RejectionInversion(size, self.exponent)
+
+        return _zipf_table(size, self.exponent)
+
+    def draw(self, rnd, size):
+        return self._sampler(size).draw(rnd)
+
+    def draw_many(self, rnd, size, n, np_random=None):
+        return self._sampler(size).draw_many(rnd, n, np_random)
+
+class _Continuous(Distribution):
+    """ Base class for distributions drawn from a continuous distribution
+
+    Values are scaled by `size` and rounded down, and values outside
+    `range(size)` are drawn again.
+    """
+
+    def _sample(self, rnd, size):
+        raise NotImplementedError()
+
+    def _sample_many(self, np_random, size, n):
+        raise NotImplementedError()
+
+    def draw(self, rnd, size):
+        while True:
+            index = math.floor(self._sample(rnd, size))
+            if 0 <= index < size:
+                return index
+
+    def draw_many(self, rnd, size, n, np_random=None):
+        if np_random is None:
+            return super().draw_many(rnd, size, n)
+
+        import numpy as np # pylint: disable=import-outside-toplevel
+        indexes = np.floor(self._sample_many(np_random, size, n))
+        outside = np.flatnonzero((indexes < 0) | (indexes >= size))
+        while outside.size:
+            indexes[outside] = np.floor(self._sample_many(np_random, size, outside.size))
+            outside = outside[(indexes[outside] < 0) | (indexes[outside] >= size)]
+
+        return indexes.astype(np.int64).tolist()
+
+class Normal(_Continuous):
+    """ Normal distribution
+
+    Mean and standard deviation are relative to the number of values,
+    a mean of 0.5 is in the middle of the range.
+    """
+
+    def __init__(self, mean=0.5, stddev=0.15):
+        """ Initialize distribution
+
+        Arguments:
+            mean: Mean, from 0 to 1
+            stddev: Standard deviation
+        """
+        if not 0 <= mean <= 1 or stddev <= 0:
+            raise ValueError("Mean must be from 0 to 1 and standard deviation positive")
+
+        self.mean = mean
+        self.stddev = stddev
+
+    def _sample(self, rnd, size):
+        return rnd.gauss(self.mean * size, self.stddev * size)
+
+    def _sample_many(self, np_random, size, n):
+        return np_random.normal(self.mean * size, self.stddev * size, n)
+
+class Exponential(_Continuous):
+    """ Exponential distribution
+
+    The first values are drawn most often. The scale is the mean relative to
+    the number of values, a scale of 0.1 has its mean at a tenth of the range.
+    """
+
+    def __init__(self, scale=0.1):
+        """ Initialize distribution
+
+        Arguments:
+            scale: Mean relative to the number of values
+        """
+        if scale <= 0:
+            raise ValueError("Exponential scale must be positive")
+
+        self.scale = scale
+
+    def _sample(self, rnd, size):
+        return rnd.expovariate(1 / (self.scale * size))
+
+    def _sample_many(self, np_random, size, n):
+        return np_random.exponential(self.scale * size, n)
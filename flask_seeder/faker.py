@@ -1,6 +1,28 @@
 """ Faker module """
 
-from flask_seeder.generator import Generator
+import pickle
+import random
+from itertools import chain, count, islice
+
+# The generator module is imported on first use, as it is slow to import
+# and `import flask_seeder` is paid for by every `flask` command
+
+def _create_partition(faker, limit):
+    """ Create the objects of one partition, run in worker processes
+
+    Returns:
+        Tuple with the list of objects and a dictionary with the pool keys.
+    """
+    return faker.create(limit), {arg: pool.values for arg, pool in faker.pools.items()}
+
+def _picklable(value):
+    """ Check if a value can be sent to worker processes """
+    try:
+        pickle.dumps(value)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+    return True
 
 # pylint: disable=too-few-public-methods
 class Faker:
@@ -12,17 +34,25 @@ class Faker:
             "name": generator.Name()
         }
 
+    The optional `pools` attribute is a dictionary with a Pool for some
+    of the `init` fields. Every value generated for such a field is added
+    to its pool, to be used by Reference generators in other fakers.
+
     Attributes:
         cls: The type of class to be created
         init: Dictionary with initialization data
+        pools: Dictionary with pools to fill with generated values
     """
 
-    def __init__(self, cls=None, init=None):
+    def __init__(self, cls=None, init=None, pools=None):
         """ Initialize faker """
         self.cls = cls
         self.init = init
+        self.pools = pools or {}
 
     def _init_args(self):
+        from flask_seeder.generator import Generator # pylint: disable=import-outside-toplevel
+
         args = {}
         if self.init is None:
             return args
@@ -33,23 +63,269 @@ class Faker:
             else:
                 args[arg] = value
 
+        for arg, pool in self.pools.items():
+            pool.add(args[arg])
+
         return args
 
-    def create(self, limit=1):
+    def _partition(self, index, offset, seed):
+        """ Create a faker for a single partition
+
+        Every generator in `init` is spawned with its own random stream derived
+        from `seed`, the partition index and the field name, and positioned
+        `offset` values ahead.
+        """
+        # pylint: disable=import-outside-toplevel
+        from flask_seeder.generator import Generator, Pool, derive_random
+
+        pools = {arg: Pool() for arg in self.pools}
+        if self.init is None:
+            return Faker(cls=self.cls, pools=pools)
+
+        init = {}
+        for arg, value in self.init.items():
+            if isinstance(value, Generator):
+                value = value.spawn(derive_random(seed, index, arg), offset)
+            init[arg] = value
+
+        return Faker(cls=self.cls, init=init, pools=pools)
+
+    def _advance(self, limit):
+        """ Move the generators in `init` past `limit` values created in partitions
+
+        Keeps later calls from repeating sequence numbers and unique values.
+        """
+        from flask_seeder.generator import Generator # pylint: disable=import-outside-toplevel
+
+        for value in (self.init or {}).values():
+            if isinstance(value, Generator):
+                value.advance(limit)
+
+    def _create_partitioned(self, limit, workers, seed, partitions):
+        """ Create objects in partitions
+
+        Split `limit` into `partitions` nearly equal parts and create each
+        part with its own partition faker, in `workers` processes.
+
+        Returns:
+            Iterator of lists with the objects of each partition, in order.
+        """
+        if limit is None:
+            raise ValueError("A limit is required when creating objects in partitions")
+
+        workers = workers or 1
+        partitions = partitions or workers
+        if workers < 1 or partitions < 1:
+            raise ValueError("Invalid number of workers or partitions")
+
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        fakers = []
+        sizes = []
+        offset = 0
+        for index in range(partitions):
+            size = limit // partitions + (1 if index < limit % partitions else 0)
+            fakers.append(self._partition(index, offset, seed))
+            sizes.append(size)
+            offset += size
+
+        self._advance(limit)
+
+        if workers == 1 or not _picklable(fakers[0]):
+            yield from self._collect_partitions(map(_create_partition, fakers, sizes))
+            return
+
+        # Only imported when needed, it's slow to import
+        from concurrent.futures import ProcessPoolExecutor # pylint: disable=import-outside-toplevel
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from self._collect_partitions(executor.map(_create_partition, fakers, sizes))
+
+    def _collect_partitions(self, results):
+        """ Add pool keys from partition results and yield the objects """
+        for instances, keys in results:
+            for arg, values in keys.items():
+                self.pools[arg].extend(values)
+
+            yield instances
+
+    def create(self, limit=1, workers=None, seed=None, partitions=None):
         """ Create objects
 
         Create a number of instance of `cls`,
         all initialized with data from `init`.
 
+        Objects are created one at a time, so the same generators give the same
+        objects as `create_iter()`. Use `create_mappings()` for data generated
+        one field at a time.
+
+        If `workers` or `partitions` is set, `limit` is split into partitions that
+        are created independently, optionally in parallel worker processes.
+        Each partition draws from random streams derived from `seed`, so the
+        result only depends on `seed` and the number of partitions, no matter
+        how many workers are used. Worker processes need `cls` and all generators
+        to be picklable, otherwise the partitions are created in this process,
+        with the same result. The generators in `init` are advanced past
+        the created values, so later calls continue with new sequence numbers
+        and unique values.
+
         Arguments:
             limit: How many objects to create, default 1.
+            workers: Number of worker processes, 1 creates all partitions in this process.
+            seed: Master seed for partitioned creation, random if not set.
+            partitions: Number of partitions, defaults to the number of workers.
 
         Returns:
             List of `cls` instances initialized with data from `init`.
         """
-        instances = []
-        for _ in range(limit):
-            args = self._init_args()
-            instances.append(self.cls(**args))
+        if workers is not None or partitions is not None:
+            return list(chain.from_iterable(
+                self._create_partitioned(limit, workers, seed, partitions)
+            ))
+
+        return [self.cls(**self._init_args()) for _ in range(limit)]
+
+    def create_columns(self, limit=1):
+        """ Create column data
+
+        Generate the data for `limit` objects one field at a time, without
+        creating any `cls` instances. Each generator in `init` is called
+        once for the whole column.
+
+        Arguments:
+            limit: How many values to create for each field, default 1.
+
+        Returns:
+            Dictionary with the `init` field names as keys and a list
+            of `limit` values for each field.
+        """
+        from flask_seeder.generator import Generator # pylint: disable=import-outside-toplevel
+
+        columns = {}
+        if self.init is None:
+            return columns
+
+        for arg, value in self.init.items():
+            if isinstance(value, Generator):
+                columns[arg] = value.generate_many(limit)
+            else:
+                columns[arg] = [value] * limit
+
+        for arg, pool in self.pools.items():
+            pool.extend(columns[arg])
+
+        return columns
+
+    def create_records(self, limit=1):
+        """ Create records
+
+        Same as `create_columns()` but the data is returned row by row.
+
+        Arguments:
+            limit: How many records to create, default 1.
+
+        Returns:
+            List of `limit` tuples, with values in the same order as
+            the fields in `init`.
+        """
+        columns = self.create_columns(limit)
+        if not columns:
+            return [()] * limit
+
+        return list(zip(*columns.values()))
+
+    def create_mappings(self, limit=1):
+        """ Create mappings
+
+        Same as `create_records()` but each row is a dictionary, just like
+        the keyword arguments `create()` would pass to `cls`.
+
+        Arguments:
+            limit: How many mappings to create, default 1.
+
+        Returns:
+            List of `limit` dictionaries with the `init` field names as keys.
+        """
+        columns = self.create_columns(limit)
+        if not columns:
+            return [{} for _ in range(limit)]
+
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    def insert(self, session, limit=1, batch_size=1000):
+        """ Insert rows into the database
+
+        Generate data for `limit` rows and insert it in batches, without
+        creating `cls` instances or adding anything to the session identity map.
+
+        If `cls` is a SQLAlchemy mapped class, the rows are inserted with
+        `session.bulk_insert_mappings()`. Otherwise `cls` is assumed to be a
+        SQLAlchemy Core `Table` and the rows are inserted with an executemany
+        `INSERT` statement.
+
+        Arguments:
+            session: SQLAlchemy session, for example `db.session`
+            limit: How many rows to insert, default 1.
+            batch_size: Maximum number of rows generated and inserted at a time.
+
+        Returns:
+            Number of inserted rows.
+        """
+        if batch_size < 1:
+            raise ValueError("Invalid batch size %s" % batch_size)
+
+        inserted = 0
+        while inserted < limit:
+            mappings = self.create_mappings(min(batch_size, limit - inserted))
+
+            if hasattr(self.cls, "__mapper__"):
+                session.bulk_insert_mappings(self.cls, mappings)
+            else:
+                session.execute(self.cls.insert(), mappings)
+
+            inserted += len(mappings)
+
+        return inserted
+
+    def create_iter(self, limit=None, chunk_size=None, workers=None, seed=None, partitions=None):
+        """ Create objects lazily
+
+        Same as `create()` but instances are created one at a time as the
+        returned iterator is consumed, so only the objects currently in use
+        are held in memory.
+
+        With `workers` or `partitions` set, whole partitions are created at a time
+        as described in `create()` and streamed in order.
+
+        Arguments:
+            limit: How many objects to create, None for an unbounded stream.
+            chunk_size: Optional number of objects to yield together as a list.
+            workers: Number of worker processes for partitioned creation.
+            seed: Master seed for partitioned creation.
+            partitions: Number of partitions for partitioned creation.
+
+        Returns:
+            Iterator of `cls` instances, or of lists with up to `chunk_size`
+            instances if `chunk_size` is set.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("Invalid chunk size %s" % chunk_size)
+
+        if workers is not None or partitions is not None:
+            instances = chain.from_iterable(
+                self._create_partitioned(limit, workers, seed, partitions)
+            )
+        else:
+            rows = count() if limit is None else range(limit)
+            instances = (self.cls(**self._init_args()) for _ in rows)
+
+        if chunk_size is None:
+            yield from instances
+            return
 
-        return instances
+        chunk = list(islice(instances, chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(instances, chunk_size))
@@ -0,0 +1,37 @@
+""" Generators module """
+
+import sys
+
+from flask_seeder.generator.base import (
+    VECTORIZE_THRESHOLD, _import_numpy, slicer, derive_seed, derive_random, seed, Generator
+)
+from flask_seeder.generator.numeric import Integer, Timestamp
+from flask_seeder.generator.keys import UUID, Sequence, Reference
+from flask_seeder.generator.text import Email, Name, String, Regex
+from flask_seeder.generator.network import (
+    format_ipv6, format_ipv4_many, format_ipv6_many, IPv4, IPv6
+)
+from flask_seeder.generator.unique import Unique
+from flask_seeder.dataset import (
+    NAMES, DOMAINS, resource_path, read_resource, load_dataset, load_alias_table, take,
+    preload_datasets, evict_datasets
+)
+from flask_seeder.distribution import (
+    AliasTable, Distribution, Categorical, Zipf, Normal, Exponential
+)
+from flask_seeder.allocator import Allocator, SharedAllocator
+from flask_seeder.bloom import BloomFilter
+from flask_seeder.database import highest_value, sync_sequence
+from flask_seeder.permutation import Permutation
+from flask_seeder.pool import Pool
+
+def __getattr__(name):
+    # Keeps `flask_seeder.generator.numpy` working without importing NumPy up front
+    if name == "numpy":
+        return _import_numpy()
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+if sys.version_info < (3, 7): # pragma: no cover
+    # No module __getattr__ before Python 3.7, see PEP 562
+    numpy = _import_numpy()
@@ -0,0 +1,252 @@
+""" Generator base class """
+
+import copy
+import random
+from itertools import count
+
+# NumPy is imported the first time a batch could be vectorized, see _import_numpy()
+_NUMPY = None
+
+# Smallest batch where the NumPy backend pays off
+VECTORIZE_THRESHOLD = 64
+
+# Master seed for generators created without `rnd` or `seed`, see seed()
+_MASTER_SEED = None
+_STREAMS = count()
+
+def _import_numpy():
+    """ Import NumPy on first use
+
+    Keeps NumPy out of the import time of Flask-Seeder, and with it
+    out of the start up time of every `flask` command.
+
+    Returns:
+        The numpy module, or None if NumPy is not installed.
+    """
+    global _NUMPY # pylint: disable=global-statement
+    if _NUMPY is None:
+        try:
+            import numpy # pylint: disable=import-outside-toplevel
+            _NUMPY = numpy
+        except ImportError: # pragma: no cover
+            _NUMPY = False
+
+    return _NUMPY or None
+
+def slicer(string, start, end):
+    """ Slice a string
+
+    Return a slice of the string matching anything between, and including,
+    the `start` and `end` characters.
+
+    Arguments:
+        string: Original string
+        start: Start character to begin slicing
+        end: End character to stop slicing
+
+    Returns:
+        A new string which is a slice from the original string, including the start
+        and end characters.
+
+        None is return in case a valid slice couldn't be found, as in start or end
+        characters are inversed or doesn't exist in the original slice.
+    """
+    result = ""
+    add = False
+    for char in string:
+        if char == start:
+            add = True
+        if add:
+            result += char
+
+        # Only return if we have found start
+        if char == end and add:
+            return result
+
+    return None
+
+def derive_seed(seed, *keys): # pylint: disable=redefined-outer-name
+    """ Derive a seed
+
+    Derive a new seed from a master seed and a number of keys, for example
+    a partition index and a field name.
+
+    Arguments:
+        seed: Master seed
+        keys: Values identifying the derived seed
+
+    Returns:
+        The derived seed as a string.
+    """
+    return ":".join(str(key) for key in (seed,) + keys)
+
+def derive_random(seed, *keys): # pylint: disable=redefined-outer-name
+    """ Derive a random number generator
+
+    Create an independent random number generator whose state only depends
+    on a master seed and a number of keys. The same seed and keys always
+    give the same stream, also across processes.
+
+    Arguments:
+        seed: Master seed
+        keys: Values identifying the stream
+
+    Returns:
+        A new `random.Random` instance.
+    """
+    return random.Random(derive_seed(seed, *keys))
+
+def seed(value=None):
+    """ Seed generators
+
+    Set a master seed for all generators created from now on without an
+    explicit `rnd` or `seed`. Each such generator gets its own random stream,
+    derived from the master seed and the order the generators are created in,
+    so the same seeder code produces the same data on every run.
+
+    Arguments:
+        value: Master seed, or None to go back to the global random module.
+    """
+    global _MASTER_SEED, _STREAMS # pylint: disable=global-statement
+    _MASTER_SEED = value
+    _STREAMS = count()
+
+# pylint: disable=too-few-public-methods
+class Generator:
+    """ Base Generator class
+
+    Subclasses of Generator must implement the generate() method.
+
+    Unless `rnd` is set, each generator draws from its own `random.Random`
+    stream if it's created with a `seed` or after a master seed has been set
+    with `seed()`, and from the global random module otherwise.
+
+    Attributes:
+        rnd: Random number generator, python built-in random module by default
+        seed: Seed of the random stream, None if not seeded
+        vectorize: Use NumPy for large batches when it is installed
+        ascii_characters: String with valid ascii characters
+        integers: String with valid integers
+    """
+    def __init__(self, rnd=None, vectorize=True, seed=None): # pylint: disable=redefined-outer-name
+        if rnd is None and seed is None and _MASTER_SEED is not None:
+            seed = derive_seed(_MASTER_SEED, next(_STREAMS))
+
+        if rnd is None and seed is not None:
+            rnd = random.Random(seed)
+
+        self.rnd = rnd or random
+        self.seed = seed
+        self.vectorize = vectorize
+        self.alpha = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        self.digit = "0123456789"
+        self._np_random = None
+
+    def _vectorized(self, n):
+        """ Get NumPy random generator for a batch
+
+        The NumPy generator is seeded from `rnd` the first time it's used.
+        A vectorized backend is only used for built-in random sources, since a
+        custom `rnd` is expected to produce all values.
+
+        Arguments:
+            n: Size of the batch
+
+        Returns:
+            A `numpy.random.Generator` if the batch should be vectorized, otherwise None.
+        """
+        if not self.vectorize or n < VECTORIZE_THRESHOLD:
+            return None
+
+        if not (self.rnd is random or isinstance(self.rnd, random.Random)):
+            return None
+
+        np = _import_numpy()
+        if np is None:
+            return None
+
+        if self._np_random is None:
+            self._np_random = np.random.default_rng(self.rnd.getrandbits(64))
+
+        return self._np_random
+
+    def generate(self):
+        """ Generate data
+        Must be implemented by subclasses
+        """
+        raise NotImplementedError()
+
+    def generate_many(self, n):
+        """ Generate a batch of data
+
+        Subclasses may override this method with a faster implementation
+        than calling `generate()` once per value.
+
+        Arguments:
+            n: Number of values to generate
+
+        Returns:
+            A list with `n` generated values.
+        """
+        return [self.generate() for _ in range(n)]
+
+    def cardinality(self): # pylint: disable=no-self-use
+        """ Number of distinct values
+
+        Returns:
+            The number of distinct values the generator can produce,
+            or None if it's unknown.
+        """
+        return None
+
+    def advance(self, n):
+        """ Advance the generator
+
+        Move the generator forward as if `n` values had been generated.
+        Generators that produce independent random values have no position,
+        so this does nothing unless overridden by a subclass.
+
+        Arguments:
+            n: Number of values to skip
+        """
+
+    def spawn(self, rnd, offset=0):
+        """ Spawn a generator for a partition
+
+        Create a copy of the generator that draws random numbers from `rnd`,
+        positioned `offset` values ahead of this generator. This generator is
+        left untouched.
+
+        Arguments:
+            rnd: Random number generator for the copy
+            offset: Number of values the copy should skip
+
+        Returns:
+            A new generator of the same type.
+        """
+        clone = copy.copy(self)
+        clone.rnd = rnd
+        clone.seed = None
+        clone._np_random = None # pylint: disable=protected-access
+        clone.advance(offset)
+        return clone
+
+    def fork(self, key, offset=0):
+        """ Fork the generator
+
+        Spawn a copy of the generator with an independent random stream derived
+        from this generator's seed and `key`. Seeded generators always give the same
+        stream for the same key, which allows work to be split across threads or
+        processes without sharing a random number generator.
+
+        Arguments:
+            key: Value identifying the new stream, for example a thread number
+            offset: Number of values the copy should skip
+
+        Returns:
+            A new generator of the same type.
+        """
+        base = self.seed if self.seed is not None else self.rnd.getrandbits(64)
+        clone = self.spawn(random.Random(derive_seed(base, key)), offset)
+        clone.seed = derive_seed(base, key)
+        return clone
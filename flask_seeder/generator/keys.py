@@ -0,0 +1,266 @@
+""" Key generators """
+
+import os
+import math
+import random
+from itertools import accumulate
+
+from flask_seeder.generator.base import Generator
+
+class UUID(Generator):
+    """ Random UUID generator
+
+    Version 4 UUIDs are completely random. Version 7 UUIDs start with a
+    millisecond timestamp followed by a counter, so they are strictly
+    increasing and inserted next to each other in an index, see RFC 9562.
+    """
+
+    def __init__(self, version=4, start=None, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            version: UUID version, 4 or 7
+            start: Optional datetime of the first version 7 UUID. When set, timestamps
+                count from `start` instead of the clock, one tick for each UUID, which
+                makes seeded version 7 UUIDs reproducible.
+        """
+        super().__init__(**kwargs)
+        if version not in (4, 7):
+            raise ValueError("Unsupported UUID version %s" % version)
+
+        self.version = version
+        self.start = start
+        # Last timestamp and counter used, as milliseconds << 12 | counter
+        self._last = -1 if start is None else (int(start.timestamp() * 1000) << 12) - 1
+
+    def cardinality(self):
+        """ Number of random UUIDs """
+        return 2**122
+
+    def advance(self, n):
+        """ Skip the next `n` version 7 timestamps, does nothing unless `start` is set """
+        if self.version == 7 and self.start is not None:
+            self._last += n
+
+    def _entropy(self, size):
+        """ Get `size` random bytes, drawn at once """
+        if self.rnd is random:
+            return os.urandom(size)
+
+        return self.rnd.getrandbits(8 * size).to_bytes(size, "big") if size > 0 else b""
+
+    def generate(self):
+        """ Generate a random UUID
+
+        Version 4 UUIDs come from the operating system unless the generator
+        draws from its own random stream, for example when it is seeded.
+        """
+        import uuid # pylint: disable=import-outside-toplevel
+
+        if self.version == 7:
+            return self.generate_many(1)[0]
+
+        if self.rnd is random:
+            return uuid.uuid4()
+
+        return uuid.UUID(int=self.rnd.getrandbits(128), version=4)
+
+    def generate_many(self, n):
+        """ Generate a list of `n` random UUIDs
+
+        Entropy for the whole batch is read with a single `os.urandom()` call,
+        or drawn from `rnd` if the generator has its own random stream.
+        """
+        import uuid # pylint: disable=import-outside-toplevel
+
+        if self.version == 4:
+            entropy = self._entropy(16 * n)
+            return [uuid.UUID(bytes=entropy[i:i+16], version=4) for i in range(0, 16 * n, 16)]
+
+        # Within a millisecond the counter keeps the UUIDs increasing, and if it
+        # overflows the timestamp runs slightly ahead of the clock
+        first = self._last + 1
+        if self.start is None:
+            import time # pylint: disable=import-outside-toplevel
+            first = max(first, int(time.time() * 1000) << 12)
+        self._last = first + n - 1
+
+        # 62 random bits per UUID, after the version, counter and variant
+        entropy = self._entropy(8 * n)
+        from_bytes = int.from_bytes
+        return [
+            uuid.UUID(int=(tick >> 12) << 80 | 0x7 << 76 | (tick & 0xfff) << 64 | 0x2 << 62
+                      | from_bytes(entropy[i:i+8], "big") & 0x3fffffffffffffff)
+            for i, tick in zip(range(0, 8 * n, 8), range(first, first + n))
+        ]
+
+class Sequence(Generator):
+    """ Sequence integer generator
+
+    With an `allocator`, integers are taken from the allocator in blocks of
+    `block_size` instead of counting from `start`, so several generators,
+    threads or processes sharing the allocator never generate the same integer.
+    """
+
+    def __init__(self, start=1, end=None, allocator=None, block_size=1000, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            start: Start of sequence
+            end: End of sequence, 100 by default or no end with an allocator
+            allocator: Optional Allocator or SharedAllocator to take integers from
+            block_size: Number of integers taken from the allocator at a time
+        """
+        super().__init__(**kwargs)
+        if end is None:
+            end = 100 if allocator is None else math.inf
+
+        self._start = start
+        self.end = end
+        self.allocator = allocator
+        self.block_size = block_size
+
+        self._next = self.start
+        # End of the current block from the allocator
+        self._block_end = self._next
+
+    @property
+    def start(self):
+        return self._start
+
+    @start.setter
+    def start(self, value):
+        self._start = value
+        if self.allocator is None and self._next < self._start:
+            self._next = self._start
+
+    def _take(self, n):
+        """ Take the next `n` integers """
+        if self.allocator is None:
+            values = range(self._next, self._next + n)
+            if values and values[-1] > self.end:
+                raise RuntimeError
+
+            self._next += n
+            return list(values)
+
+        values = []
+        while len(values) < n:
+            if self._next >= self._block_end:
+                size = max(self.block_size, n - len(values))
+                self._next = self.allocator.allocate(size)
+                self._block_end = self._next + size
+
+            size = min(n - len(values), self._block_end - self._next)
+            values.extend(range(self._next, self._next + size))
+            self._next += size
+
+        if values and values[-1] > self.end:
+            raise RuntimeError
+
+        return values
+
+    def generate(self):
+        """ Generate next integer in the sequence
+
+        This method will raise a RuntimeError if the sequence
+        has reached the end.
+        """
+        if self.allocator is not None:
+            return self._take(1)[0]
+
+        value = self._next
+        self._next += 1
+
+        if value > self.end:
+            raise RuntimeError
+
+        return value
+
+    def generate_many(self, n):
+        """ Generate the next `n` integers in the sequence
+
+        This method will raise a RuntimeError if the sequence
+        would pass the end, in which case no values are consumed
+        unless an allocator is used.
+        """
+        return self._take(n)
+
+    def advance(self, n):
+        """ Skip the next `n` integers in the sequence
+
+        Does nothing with an allocator, as the allocator already
+        keeps generators from handing out the same integers.
+        """
+        if self.allocator is None:
+            self._next += n
+
+    def spawn(self, rnd, offset=0):
+        """ Spawn a generator for a partition
+
+        With an allocator, the copy starts with an empty block
+        so it doesn't hand out integers from this generator's block.
+        """
+        clone = super().spawn(rnd, offset)
+        if self.allocator is not None:
+            clone._block_end = clone._next # pylint: disable=protected-access
+        return clone
+
+    def cardinality(self):
+        """ Number of integers from `start` to `end`, unknown with an allocator """
+        if self.allocator is not None:
+            return None
+
+        return max(0, self.end - self.start + 1)
+
+class Reference(Generator):
+    """ Reference generator
+
+    Draws keys from a Pool, typically to fill foreign keys with
+    keys of parent objects created earlier.
+    """
+
+    def __init__(self, pool, weighted=False, distribution=None, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            pool: Pool to draw keys from
+            weighted: Draw keys according to the pool weights instead of uniformly
+            distribution: Optional Distribution over the keys in the order they were added
+        """
+        super().__init__(**kwargs)
+        self.pool = pool
+        self.weighted = weighted
+        self.distribution = distribution
+        self._cum_weights = None
+
+    def _weights(self):
+        """ Cumulative pool weights, rebuilt when the pool has grown """
+        if self._cum_weights is None or len(self._cum_weights) != len(self.pool):
+            weights = self.pool.weights or [1.0] * len(self.pool)
+            self._cum_weights = list(accumulate(weights))
+
+        return self._cum_weights
+
+    def cardinality(self):
+        """ Number of distinct keys in the pool """
+        return len(set(self.pool.values))
+
+    def generate(self):
+        """ Draw a key from the pool """
+        return self.generate_many(1)[0]
+
+    def generate_many(self, n):
+        """ Draw `n` keys from the pool """
+        if not self.pool:
+            raise RuntimeError("Reference pool is empty")
+
+        if self.distribution is not None:
+            values = self.pool.values
+            indexes = self.distribution.draw_many(self.rnd, len(values), n, self._vectorized(n))
+            return [values[index] for index in indexes]
+
+        if self.weighted:
+            return self.rnd.choices(self.pool.values, cum_weights=self._weights(), k=n)
+
+        return self.rnd.choices(self.pool.values, k=n)
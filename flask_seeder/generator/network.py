@@ -0,0 +1,231 @@
+""" IP address generators """
+
+import struct
+from bisect import bisect_right
+from itertools import accumulate
+
+from flask_seeder.permutation import Permutation
+from flask_seeder.generator.base import Generator
+
+def format_ipv6(hextets):
+    """ Format IPv6 address
+
+    Format an IPv6 address from its eight 16-bit groups, in the same
+    compressed notation as `str(ipaddress.IPv6Address)`.
+
+    Arguments:
+        hextets: Sequence of eight integers
+
+    Returns:
+        The IPv6 address as a string.
+    """
+    parts = ["%x" % hextet for hextet in hextets]
+    if 0 not in hextets:
+        return ":".join(parts)
+
+    best_start = best_length = 0
+    run_start = run_length = 0
+    for index, hextet in enumerate(hextets):
+        if hextet:
+            run_length = 0
+            continue
+
+        if not run_length:
+            run_start = index
+        run_length += 1
+        if run_length > best_length:
+            best_start, best_length = run_start, run_length
+
+    if best_length < 2:
+        return ":".join(parts)
+
+    return ":".join(parts[:best_start]) + "::" + ":".join(parts[best_start+best_length:])
+
+def format_ipv4_many(values):
+    """ Format IPv4 addresses
+
+    Arguments:
+        values: List of addresses as 32-bit integers
+
+    Returns:
+        A list with the addresses in dotted notation, like `str(ipaddress.IPv4Address)`.
+    """
+    blob = struct.pack(">%dI" % len(values), *values)
+    return ["%d.%d.%d.%d" % octets for octets in struct.iter_unpack("4B", blob)]
+
+def format_ipv6_many(values):
+    """ Format IPv6 addresses
+
+    Arguments:
+        values: List of addresses as 128-bit integers
+
+    Returns:
+        A list with the addresses in compressed notation, see format_ipv6().
+    """
+    blob = b"".join([value.to_bytes(16, "big") for value in values])
+    return [format_ipv6(hextets) for hextets in struct.iter_unpack(">8H", blob)]
+
+class _Address(Generator): # pylint: disable=too-many-instance-attributes
+    """ Base class for random IP address generators
+
+    Addresses are drawn from a network, minus any excluded networks. The
+    remaining addresses are kept as a sorted list of integer ranges, and an
+    index into all remaining addresses is mapped onto its range.
+
+    With `unique` enabled, the indexes are drawn without replacement from a
+    shuffled enumeration, like unique String patterns.
+    """
+    VERSION = None
+    LENGTH = None
+
+    def __init__(self, network=None, exclude=(), unique=False, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            network: Network in CIDR notation to draw addresses from, all addresses if not set
+            exclude: Networks or addresses that are never drawn
+            unique: Never generate the same address twice
+        """
+        super().__init__(**kwargs)
+        self.network = network
+        self.exclude = tuple(exclude)
+        self.unique = unique
+        self._key = self.rnd.getrandbits(64) if unique else None
+        self._permutation = None
+        self._index = 0
+
+        ranges = self._ranges()
+        if not ranges:
+            raise ValueError("No addresses left to generate")
+
+        self._starts = [start for start, _ in ranges]
+        self._offsets = [0] + list(accumulate(end - start for start, end in ranges))
+        self._total = self._offsets[-1]
+
+    def _ranges(self):
+        """ Sorted list of (first, last + 1) ranges of addresses to draw from """
+        if self.network is None and not self.exclude:
+            return [(0, 2**self.LENGTH)]
+
+        from ipaddress import ip_network # pylint: disable=import-outside-toplevel
+
+        def bounds(value):
+            network = ip_network(value, strict=False)
+            if network.version != self.VERSION:
+                raise ValueError("%s is not an IPv%s network" % (value, self.VERSION))
+            start = int(network.network_address)
+            return start, start + network.num_addresses
+
+        ranges = [bounds(self.network) if self.network is not None else (0, 2**self.LENGTH)]
+        for excluded_start, excluded_end in sorted(bounds(value) for value in self.exclude):
+            remaining = []
+            for start, end in ranges:
+                if excluded_end <= start or excluded_start >= end:
+                    remaining.append((start, end))
+                    continue
+                if start < excluded_start:
+                    remaining.append((start, excluded_start))
+                if excluded_end < end:
+                    remaining.append((excluded_end, end))
+            ranges = remaining
+
+        return ranges
+
+    def cardinality(self):
+        """ Number of addresses to draw from """
+        return self._total
+
+    def advance(self, n):
+        """ Skip the next `n` unique addresses, does nothing unless `unique` is set """
+        if self.unique:
+            self._index += n
+
+    def _indexes(self, n):
+        """ Draw `n` indexes into the addresses """
+        if self.unique:
+            if self._permutation is None:
+                self._permutation = Permutation(self._total, self._key)
+            if self._index + n > self._total:
+                raise RuntimeError("Unable to generate %d unique addresses, only %d left"
+                                   % (n, max(0, self._total - self._index)))
+            start = self._index
+            self._index += n
+            return self._permutation.take(start, start + n)
+
+        total = self._total
+        if total & (total - 1) == 0:
+            bits = total.bit_length() - 1
+            getrandbits = self.rnd.getrandbits
+            return [getrandbits(bits) for _ in range(n)] if bits else [0] * n
+
+        randrange = self.rnd.randrange
+        return [randrange(total) for _ in range(n)]
+
+    def _address(self, index):
+        """ Map an index onto an address """
+        position = bisect_right(self._offsets, index) - 1
+        return self._starts[position] + index - self._offsets[position]
+
+    def _addresses(self, indexes):
+        """ Map indexes onto addresses """
+        if len(self._starts) == 1:
+            start = self._starts[0]
+            return [start + index for index in indexes] if start else indexes
+
+        starts = self._starts
+        offsets = self._offsets
+        result = []
+        for index in indexes:
+            position = bisect_right(offsets, index) - 1
+            result.append(starts[position] + index - offsets[position])
+
+        return result
+
+    def _format(self, value):
+        raise NotImplementedError()
+
+    def _format_many(self, values):
+        raise NotImplementedError()
+
+    def generate(self):
+        """ Generate a random address """
+        if self.unique:
+            index = self._indexes(1)[0]
+        else:
+            index = self.rnd.randint(0, self._total - 1)
+
+        return self._format(self._address(index))
+
+    def generate_many(self, n):
+        """ Generate a list of `n` random addresses
+
+        The addresses are formatted straight from integers, without
+        creating `ipaddress` objects. NumPy is never used, formatting
+        the addresses as strings costs more than drawing them.
+        """
+        return self._format_many(self._addresses(self._indexes(n)))
+
+class IPv4(_Address):
+    """ Random IPv4 generator """
+    VERSION = 4
+    LENGTH = IPV4LENGTH = 32
+    IPV4_MAX_PREFIX_LEN = (2**IPV4LENGTH) - 1
+
+    def _format(self, value):
+        return "%d.%d.%d.%d" % (value >> 24, value >> 16 & 255, value >> 8 & 255, value & 255)
+
+    def _format_many(self, values):
+        return format_ipv4_many(values)
+
+
+class IPv6(_Address):
+    """ Random IPv6 generator """
+    VERSION = 6
+    LENGTH = IPV6LENGTH = 128
+    IPV6_MAX_PREFIX_LEN = (2**IPV6LENGTH) - 1
+
+    def _format(self, value):
+        return format_ipv6(struct.unpack(">8H", value.to_bytes(16, "big")))
+
+    def _format_many(self, values):
+        return format_ipv6_many(values)
@@ -0,0 +1,177 @@
+""" Integer and timestamp generators """
+
+import operator
+from itertools import accumulate
+
+from flask_seeder.generator.base import Generator
+
+# pylint: disable=too-few-public-methods
+class Integer(Generator):
+    """ Random Integer generator """
+
+    def __init__(self, start=1, end=100, distribution=None, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            start: Minimum value
+            end: Maximum value
+            distribution: Optional Distribution of the integers, uniform if not set
+
+        """
+        super().__init__(**kwargs)
+        self.start = start
+        self.end = end
+        self.distribution = distribution
+
+    def generate(self):
+        """ Generate a random integer
+
+        Set the start/end attributes prior to calling this method.
+
+        Returns:
+            A single random integer from `start` to `end`.
+        """
+        if self.distribution is not None:
+            return self.start + self.distribution.draw(self.rnd, self.end - self.start + 1)
+
+        return self.rnd.randint(self.start, self.end)
+
+    def cardinality(self):
+        """ Number of integers from `start` to `end` """
+        return max(0, self.end - self.start + 1)
+
+    def generate_many(self, n):
+        """ Generate a list of `n` random integers from `start` to `end` """
+        start = self.start
+        size = self.end - start + 1
+        if size < 1:
+            raise ValueError("Empty range from %s to %s" % (start, self.end))
+
+        np_random = self._vectorized(n)
+        if self.distribution is not None:
+            indexes = self.distribution.draw_many(self.rnd, size, n, np_random)
+            return [start + index for index in indexes]
+
+        if np_random is not None and -2**63 <= start and self.end < 2**63:
+            return np_random.integers(start, self.end, size=n, endpoint=True).tolist()
+
+        # choices() scales random(), which only has 53 bits, so it is only
+        # uniform for small ranges
+        if size <= 2**32:
+            return self.rnd.choices(range(start, self.end + 1), k=n)
+
+        randrange = self.rnd.randrange
+        return [start + randrange(size) for _ in range(n)]
+
+class Timestamp(Generator):
+    """ Timestamp generator
+
+    Generates datetimes from `start`, one every `interval`, so rows are created
+    in time order and end up clustered in time partitioned tables and indexes.
+    With a `jitter`, each timestamp is moved forward by a random amount less than
+    `jitter`. Timestamps keep increasing as long as `jitter` is at most `interval`,
+    a larger jitter gives timestamps that are only out of order within `jitter`.
+    Timestamps that jitter moves past `end` are set to `end`.
+    """
+
+    def __init__(self, start, end=None, interval=None, jitter=None, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            start: Datetime of the first timestamp, naive or timezone aware
+            end: Optional datetime after which no timestamps are generated
+            interval: Timedelta between timestamps, one second by default
+            jitter: Optional timedelta, upper bound of the random offset of each timestamp
+        """
+        from datetime import timedelta # pylint: disable=import-outside-toplevel
+
+        super().__init__(**kwargs)
+        interval = timedelta(seconds=1) if interval is None else interval
+        jitter = timedelta(0) if jitter is None else jitter
+        if interval <= timedelta(0) or jitter < timedelta(0):
+            raise ValueError("Interval must be positive and jitter not negative")
+
+        self.start = start
+        self.end = end
+        self.interval = interval
+        self.jitter = jitter
+        self._jitter = jitter // timedelta(microseconds=1)
+        # Number of the next timestamp
+        self._index = 0
+
+    def _offsets(self, n):
+        """ Draw the jitter of `n` timestamps in microseconds """
+        if not self._jitter:
+            return None
+
+        np_random = self._vectorized(n)
+        if np_random is not None:
+            return np_random.integers(self._jitter, size=n).tolist()
+
+        randrange = self.rnd.randrange
+        return [randrange(self._jitter) for _ in range(n)]
+
+    def _reserve(self, n):
+        """ Take the next `n` timestamps, raise RuntimeError if they pass `end` """
+        first = self.start + self.interval * self._index
+        if self.end is not None and n and first + self.interval * (n - 1) > self.end:
+            raise RuntimeError("Timestamp passed the end")
+
+        self._index += n
+        return first
+
+    def generate(self):
+        """ Generate the next timestamp
+
+        This method will raise a RuntimeError if the timestamp
+        would pass the end.
+        """
+        from datetime import timedelta # pylint: disable=import-outside-toplevel
+
+        value = self._reserve(1)
+        if self._jitter:
+            value += timedelta(microseconds=self.rnd.randrange(self._jitter))
+            if self.end is not None and value > self.end:
+                value = self.end
+
+        return value
+
+    def generate_many(self, n):
+        """ Generate the next `n` timestamps
+
+        The timestamps are computed by adding `interval` to the previous
+        timestamp and all jitter is drawn at once, instead of computing
+        each timestamp from scratch.
+
+        This method will raise a RuntimeError if the timestamps
+        would pass the end, in which case no timestamps are consumed.
+        """
+        from datetime import timedelta # pylint: disable=import-outside-toplevel
+
+        if n <= 0:
+            return []
+
+        first = self._reserve(n)
+        timestamps = accumulate([first] + [self.interval] * (n - 1))
+        offsets = self._offsets(n)
+        if offsets is None:
+            return list(timestamps)
+
+        zeros = [0] * n
+        result = list(map(operator.add, timestamps, map(timedelta, zeros, zeros, offsets)))
+        end = self.end
+        if end is not None and first + self.interval * (n - 1) + self.jitter > end:
+            result = [min(value, end) for value in result]
+
+        return result
+
+    def advance(self, n):
+        """ Skip the next `n` timestamps """
+        self._index += n
+
+    def cardinality(self):
+        """ Number of timestamps from `start` to `end`, unknown without an end """
+        if self.end is None or self.jitter > self.interval:
+            return None
+
+        return max(0, (self.end - self.start) // self.interval + 1)
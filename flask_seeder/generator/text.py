@@ -0,0 +1,456 @@
+""" Text generators """
+
+from itertools import accumulate
+
+from flask_seeder.parser import Pattern, compile as compile_pattern
+from flask_seeder.codegen import compile_function, compile_regex, compile_regex_many
+from flask_seeder.dataset import NAMES, DOMAINS, load_dataset, load_alias_table, take
+from flask_seeder.permutation import Permutation
+from flask_seeder.generator.base import slicer, Generator
+
+def _choose(rnd, path, weighted, distribution=None):
+    """ Draw an entry from a shared dataset, by distribution or by weight if it has weights """
+    dataset = load_dataset(path)
+    if distribution is not None:
+        return dataset[distribution.draw(rnd, len(dataset))]
+
+    table = load_alias_table(path) if weighted else None
+    if table is not None:
+        return dataset[table.draw(rnd)]
+
+    return rnd.choice(dataset)
+
+def _choose_many(rnd, path, n, weighted, np_random=None, distribution=None):
+    # pylint: disable=too-many-arguments
+    """ Draw `n` entries from a shared dataset, by distribution or by weight if it has weights """
+    dataset = load_dataset(path)
+    if distribution is not None:
+        return take(dataset, distribution.draw_many(rnd, len(dataset), n, np_random))
+
+    table = load_alias_table(path) if weighted else None
+    if table is not None:
+        return take(dataset, table.draw_many(rnd, n, np_random))
+
+    if np_random is not None:
+        return take(dataset, np_random.integers(len(dataset), size=n).tolist())
+
+    return rnd.choices(dataset, k=n)
+
+class Email(Generator): # pylint: disable=too-many-instance-attributes
+    """ Random Email generator
+
+    With `unique` enabled, every address is drawn without replacement:
+    a shuffled index is split into a name, a domain and a numeric suffix
+    that is appended to the name, like `anna42@example.com`. No generated
+    addresses are kept in memory and a RuntimeError is raised as soon as
+    all combinations have been used.
+    """
+
+    def __init__(self, names=NAMES, domains=DOMAINS, weighted=True, unique=False, suffixes=10000,
+                 name_distribution=None, domain_distribution=None, **kwargs):
+        # pylint: disable=too-many-arguments
+        """ Initialize generator
+
+        Arguments:
+            names: Resource path of the names dataset
+            domains: Resource path of the domains dataset
+            weighted: Draw by the weights in the datasets, if they have any.
+                Unique addresses are always drawn without weights.
+            unique: Never generate the same address twice
+            suffixes: Number of numeric suffixes for unique addresses, including no suffix
+            name_distribution: Optional Distribution over the names, replaces their weights
+            domain_distribution: Optional Distribution over the domains, replaces their weights
+        """
+        super().__init__(**kwargs)
+        self.names = names
+        self.domains = domains
+        self.weighted = weighted
+        self.unique = unique
+        self.suffixes = suffixes
+        self.name_distribution = name_distribution
+        self.domain_distribution = domain_distribution
+        self._key = self.rnd.getrandbits(64) if unique else None
+        self._permutation = None
+        self._index = 0
+        self._distinct = None
+
+    def _distinct_parts(self):
+        """ Distinct lower case names and distinct domains """
+        if self._distinct is None:
+            names = tuple(dict.fromkeys(name.lower() for name in load_dataset(self.names)))
+            domains = tuple(dict.fromkeys(load_dataset(self.domains)))
+            self._distinct = (names, domains)
+
+        return self._distinct
+
+    def cardinality(self):
+        """ Number of distinct name and domain combinations, times `suffixes` if unique """
+        names, domains = self._distinct_parts()
+        return len(names) * len(domains) * (self.suffixes if self.unique else 1)
+
+    def advance(self, n):
+        """ Skip the next `n` unique addresses, does nothing unless `unique` is set """
+        if self.unique:
+            self._index += n
+
+    def _generate_unique(self, n):
+        """ Generate the next `n` addresses of the shuffled enumeration """
+        names, domains = self._distinct_parts()
+        if self._permutation is None:
+            if any(name[-1:].isdigit() for name in names):
+                raise ValueError("Names ending with a digit can't be used for unique addresses")
+            self._permutation = Permutation(len(names) * len(domains) * self.suffixes, self._key)
+
+        if self._index + n > self._permutation.size:
+            raise RuntimeError("Unable to generate %d unique email addresses, only %d left"
+                               % (n, max(0, self._permutation.size - self._index)))
+
+        start = self._index
+        self._index += n
+        result = []
+        for index in self._permutation.take(start, start + n):
+            index, domain = divmod(index, len(domains))
+            suffix, name = divmod(index, len(names))
+            result.append(f"{names[name]}{suffix or ''}@{domains[domain]}")
+
+        return result
+
+    def generate(self):
+        """ Generate a random email address """
+        if self.unique:
+            return self._generate_unique(1)[0]
+
+        name = _choose(self.rnd, self.names, self.weighted, self.name_distribution).lower()
+        domain = _choose(self.rnd, self.domains, self.weighted, self.domain_distribution)
+
+        return f"{name}@{domain}"
+
+    def generate_many(self, n):
+        """ Generate a list of `n` random email addresses """
+        if self.unique:
+            return self._generate_unique(n)
+
+        # No NumPy here: joining the strings dominates and NumPy draws are
+        # slower to turn into Python strings than choices()
+        names = _choose_many(self.rnd, self.names, n, self.weighted,
+                             distribution=self.name_distribution)
+        domains = _choose_many(self.rnd, self.domains, n, self.weighted,
+                               distribution=self.domain_distribution)
+
+        return [f"{name.lower()}@{domain}" for name, domain in zip(names, domains)]
+
+# pylint: disable=too-few-public-methods
+class Name(Generator):
+    """ Random Name generator """
+
+    def __init__(self, dataset=NAMES, weighted=True, distribution=None, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            dataset: Resource path of the names dataset
+            weighted: Draw by the weights in the dataset, if it has any
+            distribution: Optional Distribution over the dataset entries, replaces the weights
+        """
+        super().__init__(**kwargs)
+        self.dataset = dataset
+        self.weighted = weighted
+        self.distribution = distribution
+
+    def generate(self):
+        """ Generate a random name
+
+        Returns:
+            A random name in string format
+        """
+        return _choose(self.rnd, self.dataset, self.weighted, self.distribution)
+
+    def cardinality(self):
+        """ Number of distinct names """
+        return len(set(load_dataset(self.dataset)))
+
+    def generate_many(self, n):
+        """ Generate a list of `n` random names """
+        return _choose_many(self.rnd, self.dataset, n, self.weighted, self._vectorized(n),
+                            self.distribution)
+
+class String(Generator): # pylint: disable=too-many-instance-attributes
+    """ Generate string from pattern
+
+    This generator work by reading a pattern that describes how to
+    generate the string.
+
+    The pattern looks like a simplified regular expression but is processed
+    completely different, so don't expect normal regular expressions to work.
+
+    See docs for details.
+
+    With `codegen` enabled, the pattern is turned into a specialized Python
+    function instead of being interpreted node by node, see `flask_seeder.codegen`.
+
+    With `unique` enabled, every string is drawn without replacement: the
+    strings are enumerated in a random order by mapping a shuffled index onto
+    the pattern, see `flask_seeder.parser.Pattern.unrank()`. No generated
+    strings are kept in memory and a RuntimeError is raised as soon as the
+    pattern has run out of strings. Ambiguous patterns, where different ways
+    of filling in the pattern can spell the same string, are rejected with a
+    ValueError, see `flask_seeder.parser.Pattern.ambiguous`.
+    """
+
+    def __init__(self, pattern=None, parser=None, codegen=False, unique=False, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            pattern: Pattern string, or a Pattern from `flask_seeder.parser.compile()`
+            parser: Optional custom parser, patterns are compiled with
+                `flask_seeder.parser.compile()` if not set
+            codegen: Generate strings with a function generated from the pattern
+            unique: Never generate the same string twice
+        """
+        super().__init__(**kwargs)
+        self.parser = parser
+        self.codegen = codegen
+        self.unique = unique
+        self._key = self.rnd.getrandbits(64) if unique else None
+        self.pattern = pattern
+
+    def __getstate__(self):
+        # Generated functions can't be pickled, they are recreated on demand
+        state = self.__dict__.copy()
+        state["_function"] = None
+        return state
+
+    @property
+    def pattern(self):
+        """ The pattern string """
+        return self._pattern
+
+    @pattern.setter
+    def pattern(self, value):
+        """ Set and compile the pattern """
+        self._function = None
+        self._permutation = None
+        self._index = 0
+        if isinstance(value, Pattern):
+            self._pattern = value.pattern
+            self.compiled = value
+        elif value is None:
+            self._pattern = None
+            self.compiled = None
+        elif self.parser is None:
+            self._pattern = value
+            self.compiled = compile_pattern(value)
+        else:
+            self._pattern = value
+            self.compiled = Pattern(value, self.parser.parse(value))
+
+    def _ast(self):
+        if self.compiled is None:
+            raise ValueError("No pattern to generate string from")
+
+        return self.compiled.ast
+
+    def cardinality(self):
+        """ Number of strings the pattern can produce, unknown for ambiguous patterns """
+        if self.compiled is None or self.compiled.ambiguous:
+            return None
+
+        return self.compiled.cardinality
+
+    def advance(self, n):
+        """ Skip the next `n` unique strings, does nothing unless `unique` is set """
+        if self.unique:
+            self._index += n
+
+    def _generate_unique(self, n):
+        """ Generate the next `n` strings of the shuffled enumeration """
+        self._ast()
+        if self.compiled.ambiguous:
+            raise ValueError("Pattern %r can spell the same string in different ways, "
+                             "unique strings need an unambiguous pattern" % self.pattern)
+
+        if self._permutation is None:
+            self._permutation = Permutation(self.compiled.cardinality, self._key)
+
+        if self._index + n > self._permutation.size:
+            raise RuntimeError("Unable to generate %d unique strings, only %d left"
+                               % (n, max(0, self._permutation.size - self._index)))
+
+        start = self._index
+        self._index += n
+        unrank = self.compiled.unrank
+
+        return [unrank(index) for index in self._permutation.take(start, start + n)]
+
+    def _generated_function(self):
+        if self._function is None:
+            self._ast()
+            self._function = compile_function(self.compiled)
+
+        return self._function
+
+    def _size(self, quantifier):
+        """ Get the number of repetitions from quantifier
+
+        There are two types of quantifiers
+
+        QUANTIFIER: Repeat X times
+        QUANTIFIER_RANGE: Repeat X times, where X is anywhere between start and end
+
+        Returns:
+            Number of repetitions.
+        """
+        if quantifier["type"] == "QUANTIFIER_RANGE":
+            return self.rnd.randint(quantifier["value"]["start"], quantifier["value"]["end"])
+
+        return quantifier["value"]
+
+    def _pool(self, node):
+        """ Get the values a node chooses from
+
+        Returns:
+            A string or sequence with values to choose from,
+            or None if the node doesn't choose between values.
+        """
+        if node["type"] == "CHARCODE":
+            if node["value"] == "c":
+                return self.alpha
+            if node["value"] == "d":
+                return self.digit
+            raise ValueError("Invalid CHARCODE %s" % node["value"])
+
+        if node["type"] == "RANGE":
+            start = node["value"]["start"]
+            source = self.digit if str.isdigit(start) else self.alpha
+            return slicer(source, start, node["value"]["end"])
+
+        if node["type"] in ("ONEOF", "STRING_GROUP"):
+            return node["value"]
+
+        return None
+
+    def _choose(self, node):
+        """ Draw all repetitions of a node with a single choices() call """
+        return "".join(self.rnd.choices(self._pool(node), k=self._size(node["repeat"])))
+
+    def generate_CHARCODE(self, node): # pylint: disable=invalid-name
+        """ Generate CHARCODE string
+
+        Generates a string depending on the CHARCODE:
+            "c": Character/alpha
+            "d": Digit
+        """
+        return self._choose(node)
+
+    def generate_ONEOF(self, node): # pylint: disable=invalid-name
+        """ Generate one from list
+
+        Returns a value from a list of valid values
+        """
+        return self._choose(node)
+
+    def generate_RANGE(self, node): # pylint: disable=invalid-name
+        """ Generate a range of values
+
+        Generates, in sequence, a number of alpha or digit characters.
+        """
+        return self._choose(node)
+
+    def generate_STRING_GROUP(self, node): # pylint: disable=invalid-name
+        """ Generate a string form a list of strings """
+        return self._choose(node)
+
+    def generate_NUMBER(self, node): # pylint: disable=invalid-name
+        """ Generate number literal """
+        return str(node["value"]) * self._size(node["repeat"])
+
+    def generate_STRING(self, node): # pylint: disable=invalid-name, no-self-use
+        """ Generate string literal """
+        return node["value"]
+
+    def generate_LITERAL(self, node): # pylint: disable=invalid-name, no-self-use
+        """ Generate literal """
+        return node["value"]
+
+    def generate(self):
+        """ Generate a string based on pattern """
+        if self.unique:
+            return self._generate_unique(1)[0]
+
+        if self.codegen:
+            return self._generated_function()(self.rnd)
+
+        return self._generate(self._ast())
+
+    def generate_many(self, n):
+        """ Generate `n` strings based on pattern
+
+        The strings are generated one node at a time: all repetitions of a node,
+        for every string in the batch, are drawn with a single choices() call
+        and the parts are joined at the end. This is faster than generating
+        the strings one by one, with or without `codegen`.
+        """
+        if self.unique:
+            return self._generate_unique(n)
+
+        columns = [self._column(node, n) for node in self._ast()]
+        return ["".join(parts) for parts in zip(*columns)] if columns else [""] * n
+
+    def _column(self, node, n):
+        """ Generate the part of `n` strings produced by a single node """
+        pool = self._pool(node)
+        if pool is None or "repeat" not in node:
+            function = self._node_function(node)
+            return [function(node) for _ in range(n)]
+
+        repeat = node["repeat"]
+        if repeat["type"] == "QUANTIFIER":
+            size = repeat["value"]
+            values = self.rnd.choices(pool, k=size * n)
+            if size == 1:
+                return values
+            return ["".join(values[i:i+size]) for i in range(0, size * n, size)]
+
+        sizes = [self._size(repeat) for _ in range(n)]
+        values = self.rnd.choices(pool, k=sum(sizes))
+        offsets = [0] + list(accumulate(sizes))
+        return ["".join(values[offsets[i]:offsets[i+1]]) for i in range(n)]
+
+    def _node_function(self, node):
+        function_name = "generate_" + node["type"]
+        if not hasattr(self, function_name):
+            raise NotImplementedError("Unknown node type %s" % node["type"])
+
+        return getattr(self, function_name)
+
+    def _generate(self, ast):
+        return "".join([self._node_function(node)(node) for node in ast])
+
+class Regex(Generator):
+    """ Generate string from a regular expression
+
+    Unlike String, the pattern uses the regular expression syntax of the `re`
+    module. The expression is parsed once and compiled into a function that
+    generates matching strings, see `flask_seeder.codegen.compile_regex()`.
+    """
+
+    def __init__(self, pattern, **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            pattern: Regular expression the generated strings match
+        """
+        super().__init__(**kwargs)
+        compile_regex(pattern)
+        self.pattern = pattern
+
+    def generate(self):
+        """ Generate a string matching the regular expression """
+        return compile_regex(self.pattern)(self.rnd)
+
+    def generate_many(self, n):
+        """ Generate `n` strings matching the regular expression
+
+        Like String, the strings are generated one part at a time for the
+        whole batch, see `flask_seeder.codegen.compile_regex_many()`.
+        """
+        return compile_regex_many(self.pattern)(self.rnd, n)
@@ -0,0 +1,138 @@
+""" Unique values generator """
+
+import os
+
+from flask_seeder.bloom import BloomFilter, digest
+from flask_seeder.generator.base import Generator
+
+class Unique(Generator): # pylint: disable=too-many-instance-attributes
+    """ Unique value generator
+
+    Wraps another generator and makes sure no value is returned twice.
+
+    A 64-bit keyed digest of every returned value is kept in a set, or, if
+    `bloom_capacity` is set, the values are added to a bloom filter with a fixed
+    size. Values are told apart by their repr(), or by themselves for strings.
+    A value that was never returned may very rarely be rejected when its digest
+    matches an earlier one, or more often with a bloom filter, but duplicates
+    never get through.
+
+    If the wrapped generator reports its cardinality, the generator fails
+    as soon as all distinct values have been returned, instead of retrying.
+    The cardinality is read on the first draw and only read again when it
+    looks exhausted, so it may grow, like the pool of a Reference generator.
+
+    Uniqueness can't be guaranteed across copies that keep track of their own
+    values, so `spawn()` and `fork()`, and with them partitioned creation in
+    Faker, raise a ValueError. Use a generator with a unique mode of its own,
+    like `String`, `Email` or `IPv4` with `unique=True`, or a `Sequence` instead.
+    """
+
+    def __init__(self, inner, max_attempts=100, bloom_capacity=None, bloom_error_rate=0.001,
+                 **kwargs):
+        """ Initialize generator
+
+        Arguments:
+            inner: Generator to draw values from
+            max_attempts: Number of draws in a row without a new value before giving up
+            bloom_capacity: Expected number of values, use a bloom filter if set
+            bloom_error_rate: False positive rate of the bloom filter
+        """
+        super().__init__(**kwargs)
+        self.inner = inner
+        self.max_attempts = max_attempts
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self._count = 0
+        self._cardinality = None
+        self._key = os.urandom(16)
+        self._seen = self._create_seen()
+
+    def _create_seen(self):
+        if self.bloom_capacity is None:
+            return set()
+
+        return BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+
+    def _add(self, value):
+        """ Add value to the values seen so far
+
+        Returns:
+            True if the value has not been seen before.
+        """
+        if self.bloom_capacity is not None:
+            return self._seen.add(value)
+
+        hashed = digest(value, 8, self._key)
+        if hashed in self._seen:
+            return False
+
+        self._seen.add(hashed)
+        return True
+
+    def _check_exhausted(self, n):
+        # Reading the cardinality can be slow, like for a large Reference pool
+        if self._cardinality is None or self._count + n > self._cardinality:
+            self._cardinality = self.inner.cardinality()
+
+        cardinality = self._cardinality
+        if cardinality is not None and self._count + n > cardinality:
+            raise RuntimeError("Unable to generate %d unique values, only %d left"
+                               % (n, cardinality - self._count))
+
+    def cardinality(self):
+        """ Cardinality of the wrapped generator """
+        return self.inner.cardinality()
+
+    def generate(self):
+        """ Generate a value that hasn't been generated before
+
+        Raises RuntimeError if no new value is found.
+        """
+        self._check_exhausted(1)
+
+        for _ in range(self.max_attempts):
+            value = self.inner.generate()
+            if self._add(value):
+                self._count += 1
+                return value
+
+        raise RuntimeError("Unable to generate unique value after %d attempts"
+                           % self.max_attempts)
+
+    def generate_many(self, n):
+        """ Generate `n` values that haven't been generated before
+
+        Values are drawn in batches from the wrapped generator.
+        Raises RuntimeError if not enough new values are found.
+        """
+        self._check_exhausted(n)
+
+        result = []
+        attempts = 0
+        while len(result) < n:
+            found = 0
+            for value in self.inner.generate_many(n - len(result)):
+                if self._add(value):
+                    result.append(value)
+                    found += 1
+
+            self._count += found
+            attempts = 0 if found else attempts + 1
+            if attempts >= self.max_attempts:
+                raise RuntimeError("Unable to generate unique value after %d attempts"
+                                   % self.max_attempts)
+
+        return result
+
+    def spawn(self, rnd, offset=0):
+        """ Refuse to spawn a copy
+
+        A copy would keep track of its own values, so values could be returned
+        by both copies.
+
+        Raises:
+            ValueError: always
+        """
+        raise ValueError("Unique values can't be generated in partitions or forks, "
+                         "use a generator with a unique mode of its own instead")
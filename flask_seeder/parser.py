@@ -1,6 +1,8 @@
 """ String Generator pattern parser """
 
 import re
+import functools
+from types import MappingProxyType
 
 TOKEN_MATCHERS = [
     ("CHARCODE",            r"\\([a-z])"),
@@ -14,6 +16,9 @@ TOKEN_MATCHERS = [
     ("LITERAL",             r"."),
 ]
 
+ALPHA = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGIT = "0123456789"
+
 def strtype(string):
     """ Check string type
 
@@ -62,7 +67,12 @@ class Tokenizer:
         self._cursor = 0
 
     def run(self, string=None):
-        """ Run tokenizer """
+        """ Run tokenizer
+
+        Any tokens from a previous run are discarded.
+        """
+        self.tokens = []
+        self._cursor = 0
         for match in re.finditer(self.regex, string):
             group = match.lastgroup
             value = match.group()
@@ -231,3 +241,242 @@ class SGParser:
             token = self.tokenizer.next()
 
         return ast
+
+
+def node_choices(node):
+    """ Get the values an AST node chooses from
+
+    Arguments:
+        node: AST node
+
+    Returns:
+        Tuple with the values to choose from, or None if the node
+        always produces the same string.
+    """
+    if node["type"] == "CHARCODE":
+        if node["value"] == "c":
+            return tuple(ALPHA)
+        if node["value"] == "d":
+            return tuple(DIGIT)
+        raise ValueError("Invalid CHARCODE %s" % node["value"])
+
+    if node["type"] in ("ONEOF", "STRING_GROUP"):
+        return tuple(node["value"])
+
+    if node["type"] == "RANGE":
+        start = node["value"]["start"]
+        end = node["value"]["end"]
+        source = DIGIT if str.isdigit(start) else ALPHA
+        return tuple(source[source.index(start):source.index(end)+1])
+
+    return None
+
+def node_constant(node):
+    """ Get the string a constant AST node produces once
+
+    Arguments:
+        node: AST node that doesn't choose between values
+
+    Returns:
+        The string produced by the node.
+    """
+    if node["type"] in ("STRING", "LITERAL"):
+        return node["value"]
+    if node["type"] == "NUMBER":
+        return str(node["value"])
+
+    raise NotImplementedError("Unknown node type %s" % node["type"])
+
+def node_lengths(node):
+    """ Get the smallest and largest number of repetitions of an AST node """
+    repeat = node.get("repeat")
+    if repeat is None:
+        return 1, 1
+    if repeat["type"] == "QUANTIFIER_RANGE":
+        return repeat["value"]["start"], repeat["value"]["end"]
+
+    return repeat["value"], repeat["value"]
+
+def _freeze(node):
+    """ Make an AST node immutable, dicts become mapping proxies and lists tuples """
+    if isinstance(node, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in node.items()})
+    if isinstance(node, (list, tuple)):
+        return tuple(_freeze(value) for value in node)
+    return node
+
+def _key(node):
+    """ Hashable form of a frozen AST node, mappings become sorted tuples of items """
+    if isinstance(node, MappingProxyType):
+        return tuple(sorted((key, _key(value)) for key, value in node.items()))
+    if isinstance(node, tuple):
+        return tuple(_key(value) for value in node)
+    return node
+
+def _thaw(node):
+    """ Reverse of _freeze() """
+    if isinstance(node, MappingProxyType):
+        return {key: _thaw(value) for key, value in node.items()}
+    if isinstance(node, tuple):
+        return [_thaw(value) for value in node]
+    return node
+
+class Pattern:
+    """ Compiled String Generator pattern
+
+    Immutable result of parsing a pattern, returned by `compile()`.
+    The AST has the same structure as the one from `SGParser.parse()`,
+    except nodes are read-only mappings and lists are tuples.
+
+    A pattern also knows how many strings it can produce and can map each
+    index in `range(cardinality)` to one of them, see `unrank()`. This counts
+    the different ways the pattern can be filled in, which is the number of
+    distinct strings unless the pattern is `ambiguous` and different ways
+    spell the same string, as they can in `\\d{1,2}\\d{1,2}` or `(a|aa){2}`.
+
+    Patterns compare equal when their ASTs are equal, even if the pattern
+    strings differ, like `[ab]` and `[ab]{1}`.
+
+    Attributes:
+        pattern: The pattern string
+        ast: Tuple with the AST nodes
+    """
+
+    def __init__(self, pattern, ast):
+        self._pattern = pattern
+        self._ast = _freeze(ast)
+        self._hash = hash(_key(self._ast))
+        self._parts = None
+
+    @property
+    def pattern(self):
+        """ The pattern string """
+        return self._pattern
+
+    @property
+    def ast(self):
+        """ Tuple with the AST nodes """
+        return self._ast
+
+    def _enumeration(self):
+        """ Get choices, repetitions and number of strings for each node
+
+        Computed on first use, since it fails for patterns that can't be generated.
+        """
+        if self._parts is None:
+            parts = []
+            for node in self.ast:
+                choices = node_choices(node)
+                if choices is None:
+                    choices = (node_constant(node),)
+                choices = tuple(dict.fromkeys(choices))
+                shortest, longest = node_lengths(node)
+                size = sum(len(choices) ** length for length in range(shortest, longest + 1))
+                parts.append((choices, shortest, longest, size))
+
+            self._parts = tuple(parts)
+
+        return self._parts
+
+    @property
+    def cardinality(self):
+        """ Number of strings the pattern can produce """
+        result = 1
+        for _, _, _, size in self._enumeration():
+            result *= size
+
+        return result
+
+    @property
+    def ambiguous(self):
+        """ Whether different ways of filling in the pattern may spell the same string
+
+        The check is conservative, a pattern is only unambiguous if every node
+        either always produces strings of the same length, or produces strings
+        with characters that can't start whatever follows it. Repeated string
+        groups must also have alternatives of the same length.
+        """
+        # Characters the rest of the pattern can start with
+        following = set()
+        for choices, shortest, longest, _ in reversed(self._enumeration()):
+            widths = [len(choice) for choice in choices]
+            if len(set(widths)) > 1 and longest > 1:
+                return True
+            if "" in choices and (shortest == 0 or longest > 1):
+                return True
+
+            characters = set("".join(choices))
+            if min(widths) * shortest != max(widths) * longest and characters & following:
+                return True
+
+            first = {choice[0] for choice in choices if choice}
+            if min(widths) * shortest == 0:
+                following |= first
+            else:
+                following = first
+
+        return False
+
+    def unrank(self, index):
+        """ Get a string by index
+
+        Maps every index in `range(cardinality)` to a different way of filling
+        in the pattern, without generating any of the other strings.
+
+        Arguments:
+            index: Integer from 0 up to, but not including, `cardinality`
+
+        Returns:
+            The string at `index`.
+        """
+        parts = self._enumeration()
+        if not 0 <= index < self.cardinality:
+            raise IndexError("Pattern index out of range")
+
+        result = []
+        for choices, shortest, longest, size in reversed(parts):
+            index, offset = divmod(index, size)
+
+            for length in range(shortest, longest + 1):
+                count = len(choices) ** length
+                if offset < count:
+                    break
+                offset -= count
+
+            chars = []
+            for _ in range(length): # pylint: disable=undefined-loop-variable
+                offset, digit = divmod(offset, len(choices))
+                chars.append(choices[digit])
+            result.append("".join(reversed(chars)))
+
+        return "".join(reversed(result))
+
+    def __reduce__(self):
+        return (Pattern, (self.pattern, _thaw(self.ast)))
+
+    def __eq__(self, other):
+        return isinstance(other, Pattern) and self.ast == other.ast
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "Pattern(%r)" % self.pattern
+
+# Number of compiled patterns kept by compile()
+COMPILE_CACHE_SIZE = 256
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile(pattern): # pylint: disable=redefined-builtin
+    """ Compile a String Generator pattern
+
+    Parse a pattern into an immutable Pattern object. The most recently used
+    patterns are cached, so compiling the same pattern again is cheap.
+
+    Arguments:
+        pattern: The pattern string
+
+    Returns:
+        A Pattern instance.
+    """
+    return Pattern(pattern, SGParser(tokenizer=Tokenizer()).parse(pattern))
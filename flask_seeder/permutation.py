@@ -0,0 +1,103 @@
+""" Pseudorandom permutations """
+
+import random
+import hashlib
+
+class Permutation:
+    """ Pseudo random permutation
+
+    Shuffles `range(size)` without storing it, using a small Feistel network
+    over the bits of the index. Indexes that land outside the range are
+    shuffled again until they are inside (cycle walking), which keeps the
+    mapping a bijection on `range(size)`.
+
+    Halves of up to 64 bits are mixed with a 64-bit hash, wider halves with
+    keyed BLAKE2b, so every bit of a half depends on every bit of the other.
+
+    Attributes:
+        size: Number of indexes to shuffle
+    """
+    ROUNDS = 4
+    MASK64 = 2**64 - 1
+    # Widest half mixed with the 64-bit hash
+    WORD_BITS = 64
+
+    def __init__(self, size, key):
+        """ Initialize permutation
+
+        Arguments:
+            size: Number of indexes to shuffle
+            key: Integer key, different keys give different permutations
+        """
+        self.size = size
+        self._half = max(1, (max(size - 1, 1).bit_length() + 1) // 2)
+        self._mask = (1 << self._half) - 1
+        self._bytes = (self._half + 7) // 8
+        keys = random.Random(key)
+        self._keys = [keys.getrandbits(64) for _ in range(self.ROUNDS)]
+
+    def __len__(self):
+        return self.size
+
+    def _round(self, value, key):
+        value = ((value + key) * 0xbf58476d1ce4e5b9) & self.MASK64
+        value = ((value ^ (value >> 31)) * 0x94d049bb133111eb) & self.MASK64
+        return (value ^ (value >> 29)) & self._mask
+
+    def _wide_round(self, value, key):
+        data = value.to_bytes(self._bytes, "little")
+        key = key.to_bytes(8, "little")
+        digest = b""
+        block = 0
+        while len(digest) < self._bytes:
+            digest += hashlib.blake2b(data, key=key, salt=block.to_bytes(16, "little")).digest()
+            block += 1
+
+        return int.from_bytes(digest[:self._bytes], "little") & self._mask
+
+    def _shuffle(self, index):
+        round_ = self._wide_round if self._half > self.WORD_BITS else self._round
+        left, right = index >> self._half, index & self._mask
+        for key in self._keys:
+            left, right = right, left ^ round_(right, key)
+
+        return (left << self._half) | right
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError("Permutation index out of range")
+
+        index = self._shuffle(index)
+        while index >= self.size:
+            index = self._shuffle(index)
+
+        return index
+
+    def take(self, start, stop):
+        """ Shuffled indexes of `range(start, stop)`
+
+        Gives the same indexes as looking them up one by one, only faster.
+        """
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError("Permutation index out of range")
+
+        if self._half > self.WORD_BITS:
+            return [self[index] for index in range(start, stop)]
+
+        size, half, mask, mask64 = self.size, self._half, self._mask, self.MASK64
+        keys = self._keys
+        result = []
+        append = result.append
+        for index in range(start, stop):
+            while True:
+                left, right = index >> half, index & mask
+                for key in keys:
+                    value = ((right + key) * 0xbf58476d1ce4e5b9) & mask64
+                    value = ((value ^ (value >> 31)) * 0x94d049bb133111eb) & mask64
+                    left, right = right, left ^ ((value ^ (value >> 29)) & mask)
+                index = (left << half) | right
+                if index < size:
+                    break
+            append(index)
+
+        return result
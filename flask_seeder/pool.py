@@ -0,0 +1,67 @@
+""" Key pools """
+
+from array import array
+
+class Pool:
+    """ Pool of integer keys
+
+    A compact list of integer keys, for example primary keys of created parent
+    objects, used by the Reference generator. Keys are stored in an `array('q')`
+    and may optionally have a weight each.
+
+    Attributes:
+        values: Array with the keys
+        weights: Array with a weight per key, or None if no weights have been given
+    """
+
+    def __init__(self, values=(), weights=None):
+        self.values = array("q")
+        self.weights = None
+        self.extend(values, weights)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def add(self, value, weight=None):
+        """ Add a key to the pool
+
+        Arguments:
+            value: Integer key
+            weight: Optional weight of the key, keys without a weight get weight 1
+        """
+        self.extend([value], None if weight is None else [weight])
+
+    def extend(self, values, weights=None):
+        """ Add keys to the pool
+
+        Arguments:
+            values: Iterable with integer keys
+            weights: Optional sequence with a weight for each key
+        """
+        size = len(self.values)
+        self.values.extend(values)
+        added = len(self.values) - size
+
+        if weights is not None and len(weights) != added:
+            del self.values[size:]
+            raise ValueError("Expected %d weights, got %d" % (added, len(weights)))
+
+        if weights is not None and self.weights is None:
+            self.weights = array("d", [1.0] * size)
+
+        if self.weights is not None:
+            self.weights.extend([1.0] * added if weights is None else weights)
+
+    def collect(self, objects, attr="id"):
+        """ Add keys from objects
+
+        Useful to fill the pool with primary keys after the objects have been flushed.
+
+        Arguments:
+            objects: Iterable with objects
+            attr: Name of the attribute holding the key, default "id"
+        """
+        self.extend(getattr(obj, attr) for obj in objects)
@@ -1,14 +1,25 @@
 """ Base seeder """
 
+import time
+
 # pylint: disable=too-few-public-methods
 class Seeder:
-    """ Base seeder class """
+    """ Base seeder class
+
+    Attributes:
+        db: SQLAlchemy database object
+        flush_every: Flush the session every N objects added with `add()`/`add_all()`
+        flushes: List of (objects, seconds) tuples, one for each flush
+    """
 
     def __init__(self, db=None):
         self.db = db
         self.name = None
         self.mod_path = None
         self.file_path = None
+        self.flush_every = None
+        self.flushes = []
+        self._pending = 0
 
     def run(self):
         """ Run the seeder script.
@@ -16,3 +27,56 @@ class Seeder:
         Must be implemented by the client.
         """
         raise NotImplementedError()
+
+    def after_run(self):
+        """ Called after `run()` has completed successfully
+
+        Runs after the last flush and before changes are committed, for example
+        to move database sequences past keys inserted by the seeder with
+        `flask_seeder.generator.sync_sequence()`. Does nothing by default.
+        """
+
+    @property
+    def pending(self):
+        """ Number of objects added with `add()`/`add_all()` since the last flush """
+        return self._pending
+
+    def add(self, obj):
+        """ Add an object to the database session
+
+        Same as `db.session.add()`, except the session is flushed
+        in chunks if `flush_every` is set.
+
+        Arguments:
+            obj: Object to add
+        """
+        self.add_all([obj])
+
+    def add_all(self, objects):
+        """ Add objects to the database session
+
+        Same as `db.session.add_all()`, except the session is flushed
+        in chunks if `flush_every` is set.
+
+        Arguments:
+            objects: Iterable with objects to add
+        """
+        for obj in objects:
+            self.db.session.add(obj)
+            self._pending += 1
+
+            if self.flush_every and self._pending >= self.flush_every:
+                self.flush()
+
+    def flush(self):
+        """ Flush the database session
+
+        Flushes pending changes to the database and expunges all objects
+        from the session so they can be garbage collected.
+        The number of flushed objects and time spent is stored in `flushes`.
+        """
+        start = time.perf_counter()
+        self.db.session.flush()
+        self.db.session.expunge_all()
+        self.flushes.append((self._pending, time.perf_counter() - start))
+        self._pending = 0
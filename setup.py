@@ -18,6 +18,9 @@ setuptools.setup(
     install_requires=[
         "Flask>=1.0.2",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.17"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
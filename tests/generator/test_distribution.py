@@ -0,0 +1,138 @@
+import math
+import random
+from collections import Counter
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from flask_seeder.generator import (
+    Categorical, Zipf, Normal, Exponential, Integer, Name, Email, Reference, Pool, evict_datasets,
+    numpy
+)
+
+class TestDistributions(TestCase):
+
+    def test_zipf_first_index_most_frequent(self):
+        draws = Counter(Zipf().draw_many(random.Random(1), 100, 10000))
+
+        self.assertEqual(draws.most_common(1)[0][0], 0)
+        # P(0) = 1 / H(100) ~ 0.19
+        self.assertAlmostEqual(draws[0] / 10000, 0.19, delta=0.02)
+        self.assertGreater(draws[0], draws[1])
+
+    def test_zipf_single_draw_in_range(self):
+        rnd = random.Random(1)
+
+        draws = {Zipf(exponent=2).draw(rnd, 5) for _ in range(1000)}
+
+        self.assertEqual(draws, set(range(5)))
+
+    def test_zipf_invalid_exponent_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            Zipf(exponent=0)
+
+    def test_zipf_above_table_limit_follow_distribution(self):
+        size = Zipf.TABLE_LIMIT + 1
+        for exponent in (0.5, 1.0, 2.0):
+            weights = [1 / rank ** exponent for rank in range(1, size + 1)]
+            total = math.fsum(weights)
+
+            draws = Counter(Zipf(exponent).draw_many(random.Random(1), size, 20000))
+
+            for index in range(3):
+                self.assertAlmostEqual(draws[index] / 20000, weights[index] / total, delta=0.01)
+
+    def test_zipf_huge_range_in_range(self):
+        rnd = random.Random(1)
+
+        draws = Zipf().draw_many(rnd, 10**15, 1000) + [Zipf(exponent=3).draw(rnd, 10**15)]
+
+        self.assertTrue(all(0 <= draw < 10**15 for draw in draws))
+        self.assertGreater(max(draws), Zipf.TABLE_LIMIT)
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_vectorized_zipf_above_table_limit(self):
+        np_random = numpy.random.default_rng(1)
+
+        draws = Zipf().draw_many(None, 10**9, 10000, np_random)
+
+        self.assertTrue(all(isinstance(draw, int) and 0 <= draw < 10**9 for draw in draws))
+        # P(0) = 1 / H(10**9) ~ 0.047
+        self.assertAlmostEqual(draws.count(0) / 10000, 0.047, delta=0.01)
+
+    def test_categorical_follow_weights(self):
+        draws = Categorical([1, 0, 3]).draw_many(random.Random(1), 3, 10000)
+
+        self.assertNotIn(1, draws)
+        self.assertAlmostEqual(draws.count(2) / len(draws), 0.75, delta=0.02)
+
+    def test_categorical_size_mismatch_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            Categorical([1, 2]).draw(random.Random(1), 3)
+
+    def test_normal_centered_in_range(self):
+        draws = Normal(mean=0.5, stddev=0.5).draw_many(random.Random(1), 100, 10000)
+
+        self.assertTrue(all(0 <= draw < 100 for draw in draws))
+        self.assertAlmostEqual(sum(draws) / len(draws), 49.5, delta=1.5)
+
+    def test_exponential_in_range(self):
+        draws = Exponential(scale=0.5).draw_many(random.Random(1), 10, 10000)
+
+        self.assertTrue(all(0 <= draw < 10 for draw in draws))
+        counts = Counter(draws)
+        self.assertGreater(counts[0], counts[9])
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_vectorized_continuous_in_range(self):
+        np_random = numpy.random.default_rng(1)
+        for distribution in (Normal(stddev=1), Exponential(scale=1)):
+            draws = distribution.draw_many(None, 10, 10000, np_random)
+
+            self.assertEqual(len(draws), 10000)
+            self.assertTrue(all(isinstance(draw, int) and 0 <= draw < 10 for draw in draws))
+
+    def test_invalid_parameters_raise_ValueError(self):
+        for create in (lambda: Normal(mean=2), lambda: Normal(stddev=0),
+                       lambda: Exponential(scale=-1)):
+            with self.assertRaises(ValueError):
+                create()
+
+class TestDistributionGenerators(TestCase):
+
+    def setUp(self):
+        evict_datasets()
+
+    def tearDown(self):
+        evict_datasets()
+
+    def test_integer_with_distribution(self):
+        generator = Integer(10, 19, distribution=Zipf(), rnd=random.Random(1))
+
+        values = generator.generate_many(1000) + [generator.generate() for _ in range(100)]
+
+        self.assertTrue(all(10 <= value <= 19 for value in values))
+        self.assertEqual(Counter(values).most_common(1)[0][0], 10)
+
+    @patch("flask_seeder.dataset.read_resource", return_value=["name1", "name2", "name3"])
+    def test_name_with_distribution(self, m_read_resource):
+        generator = Name(distribution=Categorical([0, 0, 1]), rnd=random.Random(1))
+
+        self.assertEqual(generator.generate(), "name3")
+        self.assertEqual(set(generator.generate_many(100)), {"name3"})
+
+    def test_email_with_name_and_domain_distributions(self):
+        datasets = {"names": ["Anna", "Bob", "Carl"], "domains": ["a.com", "b.com"]}
+        with patch("flask_seeder.dataset.read_resource", side_effect=datasets.get):
+            generator = Email(names="names", domains="domains", rnd=random.Random(1),
+                              name_distribution=Categorical([0, 1, 0]),
+                              domain_distribution=Categorical([0, 1]))
+
+            self.assertEqual(generator.generate(), "bob@b.com")
+            self.assertEqual(set(generator.generate_many(100)), {"bob@b.com"})
+
+    def test_reference_with_distribution(self):
+        pool = Pool()
+        pool.extend([5, 6, 7])
+        generator = Reference(pool, distribution=Categorical([1, 0, 0]), rnd=random.Random(1))
+
+        self.assertEqual(generator.generate_many(10), [5] * 10)
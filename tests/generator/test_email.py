@@ -1,7 +1,9 @@
+import os
+import tempfile
 from unittest import TestCase
 from unittest.mock import MagicMock, mock_open, patch, call
 
-from flask_seeder.generator import Email
+from flask_seeder.generator import Email, evict_datasets
 
 MOCK_DOMAINS = [
     "domain1.com",
@@ -26,13 +28,96 @@ class TestEmailGenerator(TestCase):
             choice=MagicMock(side_effect=lambda values: values[0])
         )
         self.generator = Email(rnd=self.rnd_mock)
+        evict_datasets()
 
-    @patch("flask_seeder.generator.read_resource", side_effect=read_resource)
+    def tearDown(self):
+        evict_datasets()
+
+    @patch("flask_seeder.dataset.read_resource", side_effect=read_resource)
     def test_generate_email(self, m_read_resource):
         result = self.generator.generate()
 
         self.rnd_mock.choice.assert_has_calls(
-            [call(MOCK_NAMES), call(MOCK_DOMAINS)], any_order=True
+            [call(tuple(MOCK_NAMES)), call(tuple(MOCK_DOMAINS))], any_order=True
         )
 
         assert result == f"{MOCK_NAMES[0]}@{MOCK_DOMAINS[0]}"
+
+    @patch("flask_seeder.dataset.read_resource", side_effect=read_resource)
+    def test_generate_many_email(self, m_read_resource):
+        self.rnd_mock.choices = MagicMock(side_effect=lambda values, k: [values[0]] * k)
+
+        result = self.generator.generate_many(2)
+
+        self.assertListEqual(result, [f"{MOCK_NAMES[0]}@{MOCK_DOMAINS[0]}"] * 2)
+
+    def test_generate_many_same_with_and_without_vectorize(self):
+        result = Email(seed=1).generate_many(1000)
+
+        self.assertListEqual(result, Email(seed=1, vectorize=False).generate_many(1000))
+
+    def test_generate_email_by_domain_weight(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "domains.txt")
+            with open(path, "w") as target:
+                target.write("common.test\t1\nnever.test\t0\n")
+
+            generator = Email(domains=path, seed=1)
+            result = [generator.generate() for _ in range(100)] + generator.generate_many(100)
+
+        self.assertTrue(all(email.endswith("@common.test") for email in result))
+
+
+class TestUniqueEmailGenerator(TestCase):
+
+    def test_unique_addresses_are_distinct(self):
+        generator = Email(unique=True, seed=1)
+
+        result = generator.generate_many(100000) + [generator.generate() for _ in range(10)]
+
+        self.assertEqual(len(set(result)), len(result))
+
+    def test_unique_addresses_are_reproducible(self):
+        first = Email(unique=True, seed=1).generate_many(10)
+        second = Email(unique=True, seed=1).generate_many(10)
+
+        self.assertListEqual(first, second)
+
+    def setUp(self):
+        evict_datasets()
+
+    def tearDown(self):
+        evict_datasets()
+
+    @patch("flask_seeder.dataset.read_resource",
+           side_effect=lambda path: ["Test", "test"] if path == "names/names.txt" else MOCK_DOMAINS)
+    def test_unique_addresses_cover_all_combinations(self, m_read_resource):
+        generator = Email(unique=True, suffixes=3, seed=1)
+
+        result = generator.generate_many(3)
+
+        self.assertEqual(generator.cardinality(), 3)
+        self.assertEqual(set(result), {"test@domain1.com", "test1@domain1.com", "test2@domain1.com"})
+        with self.assertRaises(RuntimeError):
+            generator.generate()
+
+    @patch("flask_seeder.dataset.read_resource", side_effect=read_resource)
+    def test_unique_names_ending_with_digit_raise_ValueError(self, m_read_resource):
+        with self.assertRaises(ValueError):
+            Email(unique=True, seed=1).generate()
+
+    def test_advance_skips_unique_addresses(self):
+        generator = Email(unique=True, seed=1)
+        expected = generator.generate_many(10)[5:]
+
+        spawned = Email(unique=True, seed=1)
+        spawned.advance(5)
+
+        self.assertListEqual(spawned.generate_many(5), expected)
+
+    def test_unique_addresses_with_more_than_2_64_combinations(self):
+        generator = Email(unique=True, suffixes=2**64, seed=1)
+
+        result = generator.generate_many(3) + generator.generate_many(100)
+
+        self.assertEqual(len(set(result)), 103)
@@ -1,7 +1,13 @@
-from unittest import TestCase
+import os
+import random
+from ipaddress import IPv6Address
+from unittest import TestCase, skipIf
 from unittest.mock import MagicMock, patch, mock_open
 
-from flask_seeder.generator import Generator, resource_path, read_resource, slicer
+from flask_seeder.generator import (
+    Generator, resource_path, read_resource, slicer, format_ipv6, derive_random, numpy, seed,
+    Permutation, AliasTable, load_dataset, preload_datasets, evict_datasets, NAMES, DOMAINS
+)
 
 MOCK_CONTENTS = "line1\nline2"
 
@@ -11,19 +17,22 @@ class TestGenerator(TestCase):
         self.rnd_mock = MagicMock()
         self.generator = Generator(rnd=self.rnd_mock)
 
+    def tearDown(self):
+        seed(None)
+
 
     def test_generate_raise_NotImplementedError(self):
         with self.assertRaises(NotImplementedError):
             self.generator.generate()
 
-    @patch("flask_seeder.generator.pkg_resources")
-    def test_resource_path(self, m_pkg):
-        resource_path("test")
+    def test_resource_path(self):
+        result = resource_path("names/names.txt")
 
-        m_pkg.resource_filename.assert_called_once()
+        self.assertTrue(os.path.isfile(result))
+        self.assertEqual(os.path.basename(result), "names.txt")
 
-    @patch("flask_seeder.generator.resource_path", return_value="test")
-    @patch("flask_seeder.generator.open", mock_open(read_data=MOCK_CONTENTS))
+    @patch("flask_seeder.dataset.resource_path", return_value="test")
+    @patch("flask_seeder.dataset.open", mock_open(read_data=MOCK_CONTENTS))
     def test_read_resource_return_contents_as_list(self, m_open):
         expected = [
             "line1",
@@ -34,6 +43,39 @@ class TestGenerator(TestCase):
 
         self.assertListEqual(result, expected)
 
+    @patch("flask_seeder.dataset.read_resource", return_value=["line1", "line2"])
+    def test_load_dataset_reads_resource_once(self, m_read_resource):
+        evict_datasets()
+
+        first = load_dataset("test")
+        second = load_dataset("test")
+
+        self.assertIs(first, second)
+        self.assertEqual(first, ("line1", "line2"))
+        m_read_resource.assert_called_once_with("test")
+        evict_datasets()
+
+    @patch("flask_seeder.dataset.read_resource", return_value=["line1"])
+    def test_evict_dataset_reads_resource_again(self, m_read_resource):
+        load_dataset("test")
+
+        evict_datasets("test")
+        load_dataset("test")
+
+        self.assertEqual(m_read_resource.call_count, 2)
+        evict_datasets()
+
+    @patch("flask_seeder.dataset.read_resource", return_value=["line1"])
+    def test_preload_datasets_loads_builtin_datasets(self, m_read_resource):
+        evict_datasets()
+
+        preload_datasets()
+        load_dataset(NAMES)
+        load_dataset(DOMAINS)
+
+        self.assertEqual(m_read_resource.call_count, 2)
+        evict_datasets()
+
     def test_slicer_return_new_string(self):
         original = "abcdefghijklmnopqrstuvwxyz"
         expected = "ijklmno"
@@ -49,3 +91,177 @@ class TestGenerator(TestCase):
         result = slicer(original, "z", "a")
 
         self.assertIsNone(result)
+
+    def test_generate_many_call_generate_n_times(self):
+        self.generator.generate = MagicMock(return_value="value")
+
+        result = self.generator.generate_many(3)
+
+        self.assertListEqual(result, ["value"] * 3)
+        self.assertEqual(self.generator.generate.call_count, 3)
+
+    def test_format_ipv6_match_ipaddress(self):
+        addresses = [
+            "::", "::1", "1::", "1:0:0:2::3", "1::2:0:0:3", "0:1:0:1:0:1:0:1",
+            "ffff:0:0:ffff:0:0:0:ffff", "1:2:3:4:5:6:7:8",
+        ]
+        for address in addresses:
+            expected = IPv6Address(address)
+            hextets = [int(expected.exploded[i:i+4], 16) for i in range(0, 39, 5)]
+
+            result = format_ipv6(hextets)
+
+            self.assertEqual(result, str(expected))
+
+    @patch("flask_seeder.generator.base._import_numpy", return_value=None)
+    def test_vectorized_without_numpy(self, m_import_numpy):
+        self.assertIsNone(Generator()._vectorized(1000))
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_vectorized_with_numpy(self):
+        generator = Generator(rnd=random.Random(1))
+
+        self.assertIsNotNone(generator._vectorized(1000))
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_vectorized_skip_small_batches(self):
+        self.assertIsNone(Generator()._vectorized(1))
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_vectorized_disabled(self):
+        self.assertIsNone(Generator(vectorize=False)._vectorized(1000))
+
+    def test_vectorized_skip_custom_rnd(self):
+        self.assertIsNone(self.generator._vectorized(1000))
+
+    def test_spawn_copy_with_new_rnd(self):
+        rnd = random.Random(1)
+
+        result = self.generator.spawn(rnd)
+
+        self.assertIsInstance(result, Generator)
+        self.assertIs(result.rnd, rnd)
+        self.assertIs(self.generator.rnd, self.rnd_mock)
+
+    def test_derive_random_reproducible(self):
+        first = derive_random(1, 0, "name")
+        second = derive_random(1, 0, "name")
+        other = derive_random(1, 1, "name")
+
+        self.assertEqual(first.random(), second.random())
+        self.assertNotEqual(derive_random(1, 0, "name").random(), other.random())
+
+    def test_default_rnd_is_global_random(self):
+        self.assertIs(Generator().rnd, random)
+
+    def test_seed_create_independent_stream(self):
+        first = Generator(seed=1)
+        second = Generator(seed=1)
+
+        self.assertIsNot(first.rnd, random)
+        self.assertEqual(first.rnd.random(), second.rnd.random())
+
+    def test_master_seed_reproducible_streams(self):
+        seed(1)
+        first = [Generator().rnd.random() for _ in range(3)]
+        seed(1)
+        second = [Generator().rnd.random() for _ in range(3)]
+
+        self.assertListEqual(first, second)
+        self.assertEqual(len(set(first)), 3)
+
+    def test_master_seed_reset(self):
+        seed(1)
+        seed(None)
+
+        self.assertIs(Generator().rnd, random)
+
+    def test_fork_seeded_generator(self):
+        generator = Generator(seed=1)
+
+        first = generator.fork(0)
+        second = generator.fork(0)
+        other = generator.fork(1)
+
+        self.assertEqual(first.rnd.random(), second.rnd.random())
+        self.assertNotEqual(generator.fork(0).rnd.random(), other.rnd.random())
+
+
+class TestPermutation(TestCase):
+
+    def test_permutation_is_bijective(self):
+        for size in [1, 2, 3, 10, 1000, 4097]:
+            permutation = Permutation(size, key=1)
+
+            result = [permutation[i] for i in range(size)]
+
+            self.assertListEqual(sorted(result), list(range(size)))
+
+    def test_permutation_depend_on_key(self):
+        first = [Permutation(100, key=1)[i] for i in range(100)]
+        second = [Permutation(100, key=2)[i] for i in range(100)]
+
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(first, list(range(100)))
+
+    def test_permutation_raise_IndexError_out_of_range(self):
+        with self.assertRaises(IndexError):
+            Permutation(10, key=1)[10]
+
+    def test_take_matches_indexing(self):
+        permutation = Permutation(1000, key=3)
+
+        self.assertListEqual(permutation.take(10, 500), [permutation[i] for i in range(10, 500)])
+
+    def test_wide_permutation_mix_high_bits(self):
+        # Halves are 70 bits wide, wider than the 64-bit hash
+        permutation = Permutation(2**140, key=1)
+
+        result = permutation.take(0, 100)
+
+        self.assertEqual(len(set(result)), 100)
+        self.assertListEqual(result, [permutation[i] for i in range(100)])
+        self.assertGreater(max(result), 2**135)
+
+    def test_wide_permutation_is_bijective(self):
+        # Cycle walking inside 2**130 indexes with halves wider than 64 bits
+        permutation = Permutation(2**129 + 1, key=1)
+
+        result = permutation.take(2**129 - 50, 2**129 + 1)
+
+        self.assertEqual(len(set(result)), 51)
+        self.assertTrue(all(0 <= index <= 2**129 for index in result))
+
+    def test_take_out_of_range_raise_IndexError(self):
+        with self.assertRaises(IndexError):
+            Permutation(10, key=1).take(5, 11)
+
+class TestAliasTable(TestCase):
+
+    def test_draws_follow_weights(self):
+        table = AliasTable([1, 0, 3])
+
+        draws = table.draw_many(random.Random(1), 10000)
+
+        self.assertNotIn(1, draws)
+        self.assertAlmostEqual(draws.count(2) / len(draws), 0.75, delta=0.02)
+
+    def test_single_draw_follows_weights(self):
+        table = AliasTable([0, 1])
+        rnd = random.Random(1)
+
+        self.assertEqual({table.draw(rnd) for _ in range(100)}, {1})
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_vectorized_draws_follow_weights(self):
+        table = AliasTable([1, 0, 3])
+
+        draws = table.draw_many(None, 10000, numpy.random.default_rng(1))
+
+        self.assertNotIn(1, draws)
+        self.assertAlmostEqual(draws.count(2) / len(draws), 0.75, delta=0.02)
+
+    def test_invalid_weights_raise_ValueError(self):
+        for weights in ([], [0, 0], [1, -1]):
+            with self.assertRaises(ValueError):
+                AliasTable(weights)
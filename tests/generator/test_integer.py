@@ -1,7 +1,7 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from unittest.mock import MagicMock
 
-from flask_seeder.generator import Integer
+from flask_seeder.generator import Integer, numpy
 
 class TestIntegerGenerator(TestCase):
 
@@ -25,4 +25,46 @@ class TestIntegerGenerator(TestCase):
         self.rnd_mock.randint.assert_called_once_with(
             self.generator.start,
             self.generator.end
-        )
\ No newline at end of file
+        )
+
+    def test_generate_many_draw_whole_batch(self):
+        self.generator.start = 10
+        self.generator.end = 20
+
+        self.generator.generate_many(5)
+
+        self.rnd_mock.choices.assert_called_once_with(range(10, 21), k=5)
+
+    def test_generate_many_within_range(self):
+        generator = Integer(start=10, end=20)
+
+        result = generator.generate_many(100)
+
+        self.assertEqual(len(result), 100)
+        self.assertTrue(all(10 <= value <= 20 for value in result))
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_generate_many_vectorized_within_range(self):
+        generator = Integer(start=10, end=20)
+
+        result = generator.generate_many(1000)
+
+        self.assertEqual(set(result), set(range(10, 21)))
+        self.assertIsInstance(result[0], int)
+
+    def test_generate_many_large_range(self):
+        for generator in (Integer(0, 2**63, seed=1), Integer(-2**100, 2**100, seed=1)):
+            result = generator.generate_many(100)
+
+            self.assertEqual(len(set(result)), 100)
+            self.assertTrue(all(generator.start <= value <= generator.end for value in result))
+
+    def test_generate_many_empty_range_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            Integer(start=2, end=1).generate_many(5)
+
+    def test_cardinality(self):
+        self.generator.start = 10
+        self.generator.end = 20
+
+        self.assertEqual(self.generator.cardinality(), 11)
@@ -1,9 +1,9 @@
-from ipaddress import IPv4Address
+from ipaddress import IPv4Address, ip_network
 
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from flask_seeder.generator import IPv4
+from flask_seeder.generator import IPv4, format_ipv4_many
 
 
 class TestIPv4Generator(TestCase):
@@ -25,3 +25,73 @@ class TestIPv4Generator(TestCase):
         self.generator = IPv4()
         result = self.generator.generate()
         self.assertEqual(type(result), str)
+
+    def test_generate_many_ipv4(self):
+        self.generator = IPv4()
+
+        result = self.generator.generate_many(10)
+
+        self.assertEqual(len(result), 10)
+        for value in result:
+            self.assertEqual(str(IPv4Address(value)), value)
+
+    def test_generate_many_zero(self):
+        self.generator = IPv4()
+
+        self.assertListEqual(self.generator.generate_many(0), [])
+
+    def test_generate_many_same_with_and_without_vectorize(self):
+        result = IPv4(seed=1).generate_many(1000)
+
+        self.assertListEqual(result, IPv4(seed=1, vectorize=False).generate_many(1000))
+
+
+class TestIPv4NetworkGenerator(TestCase):
+
+    def test_addresses_are_in_network(self):
+        generator = IPv4(network="10.20.0.0/16", seed=1)
+
+        result = generator.generate_many(1000) + [generator.generate() for _ in range(10)]
+
+        network = ip_network("10.20.0.0/16")
+        self.assertTrue(all(IPv4Address(value) in network for value in result))
+
+    def test_excluded_addresses_are_never_generated(self):
+        generator = IPv4(network="192.168.1.0/29", exclude=["192.168.1.0", "192.168.1.4/30"], seed=1)
+
+        result = set(generator.generate_many(1000))
+
+        self.assertEqual(result, {"192.168.1.1", "192.168.1.2", "192.168.1.3"})
+        self.assertEqual(generator.cardinality(), 3)
+
+    def test_unique_addresses_cover_network(self):
+        generator = IPv4(network="10.0.0.0/24", unique=True, seed=1)
+
+        result = generator.generate_many(200) + [generator.generate() for _ in range(56)]
+
+        self.assertEqual(set(result), {str(address) for address in ip_network("10.0.0.0/24")})
+        with self.assertRaises(RuntimeError):
+            generator.generate()
+
+    def test_advance_skips_unique_addresses(self):
+        expected = IPv4(network="10.0.0.0/16", unique=True, seed=1).generate_many(10)[5:]
+        generator = IPv4(network="10.0.0.0/16", unique=True, seed=1)
+
+        generator.advance(5)
+
+        self.assertListEqual(generator.generate_many(5), expected)
+
+    def test_ipv6_network_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            IPv4(network="2001:db8::/32")
+
+    def test_everything_excluded_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            IPv4(network="10.0.0.0/24", exclude=["10.0.0.0/8"])
+
+    def test_format_ipv4_many(self):
+        values = [0, 1, 2**32 - 1, 3232235777]
+
+        result = format_ipv4_many(values)
+
+        self.assertListEqual(result, [str(IPv4Address(value)) for value in values])
@@ -1,9 +1,9 @@
-from ipaddress import IPv6Address
+from ipaddress import IPv6Address, ip_network
 
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from flask_seeder.generator import IPv6
+from flask_seeder.generator import IPv6, format_ipv6_many
 
 
 class TestIPv6Generator(TestCase):
@@ -25,3 +25,46 @@ class TestIPv6Generator(TestCase):
         self.generator = IPv6()
         result = self.generator.generate()
         self.assertEqual(type(result), str)
+
+    def test_generate_many_ipv6(self):
+        self.generator = IPv6()
+
+        result = self.generator.generate_many(10)
+
+        self.assertEqual(len(result), 10)
+        for value in result:
+            self.assertEqual(str(IPv6Address(value)), value)
+
+    def test_generate_many_same_with_and_without_vectorize(self):
+        result = IPv6(seed=1).generate_many(1000)
+
+        self.assertListEqual(result, IPv6(seed=1, vectorize=False).generate_many(1000))
+
+
+class TestIPv6NetworkGenerator(TestCase):
+
+    def test_addresses_are_in_network(self):
+        generator = IPv6(network="2001:db8::/32", exclude=["2001:db8:8000::/33"], seed=1)
+
+        result = generator.generate_many(1000) + [generator.generate() for _ in range(10)]
+
+        network = ip_network("2001:db8::/33")
+        self.assertTrue(all(IPv6Address(value) in network for value in result))
+
+    def test_unique_addresses_cover_network(self):
+        generator = IPv6(network="2001:db8::/120", unique=True, seed=1)
+
+        result = generator.generate_many(256)
+
+        self.assertEqual(set(result), {str(address) for address in ip_network("2001:db8::/120")})
+
+    def test_ipv4_network_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            IPv6(network="10.0.0.0/8")
+
+    def test_format_ipv6_many(self):
+        values = [0, 1, 2**128 - 1, int(IPv6Address("2001:db8::1:0:0:1"))]
+
+        result = format_ipv6_many(values)
+
+        self.assertListEqual(result, [str(IPv6Address(value)) for value in values])
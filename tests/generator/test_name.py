@@ -1,7 +1,7 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from unittest.mock import MagicMock, mock_open, patch
 
-from flask_seeder.generator import Name
+from flask_seeder.generator import Name, evict_datasets, numpy
 
 MOCK_CONTENTS = [
     "name1",
@@ -11,11 +11,34 @@ MOCK_CONTENTS = [
 class TestNameGenerator(TestCase):
 
     def setUp(self):
+        evict_datasets()
         self.rnd_mock = MagicMock()
         self.generator = Name(rnd=self.rnd_mock)
 
-    @patch("flask_seeder.generator.read_resource", return_value=MOCK_CONTENTS)
+    def tearDown(self):
+        evict_datasets()
+
+    @patch("flask_seeder.dataset.read_resource", return_value=MOCK_CONTENTS)
     def test_generate_name(self, m_read_resource):
         result = self.generator.generate()
 
-        self.rnd_mock.choice.assert_called_once_with(MOCK_CONTENTS)
+        self.rnd_mock.choice.assert_called_once_with(tuple(MOCK_CONTENTS))
+
+    @patch("flask_seeder.dataset.read_resource", return_value=MOCK_CONTENTS)
+    def test_generate_many_names(self, m_read_resource):
+        self.generator.generate_many(5)
+
+        self.rnd_mock.choices.assert_called_once_with(tuple(MOCK_CONTENTS), k=5)
+
+    @skipIf(numpy is None, "NumPy not installed")
+    @patch("flask_seeder.dataset.read_resource", return_value=MOCK_CONTENTS)
+    def test_generate_many_names_vectorized(self, m_read_resource):
+        generator = Name()
+
+        result = generator.generate_many(1000)
+
+        self.assertEqual(set(result), set(MOCK_CONTENTS))
+
+    @patch("flask_seeder.dataset.read_resource", return_value=MOCK_CONTENTS + MOCK_CONTENTS)
+    def test_cardinality_count_distinct_names(self, m_read_resource):
+        self.assertEqual(self.generator.cardinality(), 2)
@@ -0,0 +1,75 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from flask_seeder.generator import Reference, Pool
+
+
+class TestReferenceGenerator(TestCase):
+
+    def setUp(self):
+        self.pool = Pool([10, 20, 30])
+        self.generator = Reference(self.pool, seed=1)
+
+    def test_generate_draw_from_pool(self):
+        result = [self.generator.generate() for _ in range(20)]
+
+        self.assertTrue(set(result) <= {10, 20, 30})
+
+    def test_generate_many_draw_from_pool(self):
+        result = self.generator.generate_many(100)
+
+        self.assertEqual(set(result), {10, 20, 30})
+
+    def test_generate_weighted(self):
+        pool = Pool([10, 20], weights=[0, 1])
+        generator = Reference(pool, weighted=True)
+
+        result = generator.generate_many(20)
+
+        self.assertEqual(set(result), {20})
+
+    def test_generate_weighted_after_pool_has_grown(self):
+        pool = Pool([10], weights=[1])
+        generator = Reference(pool, weighted=True)
+        generator.generate()
+        pool.add(20, weight=1000000)
+
+        result = generator.generate_many(10)
+
+        self.assertIn(20, result)
+
+    def test_generate_raise_RuntimeError_for_empty_pool(self):
+        with self.assertRaises(RuntimeError):
+            Reference(Pool()).generate()
+
+
+class TestPool(TestCase):
+
+    def test_values_stored_in_array(self):
+        pool = Pool([1, 2])
+        pool.add(3)
+
+        self.assertEqual(pool.values.typecode, "q")
+        self.assertListEqual(list(pool), [1, 2, 3])
+        self.assertIsNone(pool.weights)
+
+    def test_weights_default_to_one(self):
+        pool = Pool([1, 2])
+        pool.add(3, weight=5)
+
+        self.assertListEqual(list(pool.weights), [1.0, 1.0, 5.0])
+
+    def test_extend_raise_ValueError_for_mismatched_weights(self):
+        pool = Pool([1])
+
+        with self.assertRaises(ValueError):
+            pool.extend([2, 3], weights=[1])
+
+        self.assertListEqual(list(pool), [1])
+
+    def test_collect_keys_from_objects(self):
+        pool = Pool()
+
+        pool.collect([MagicMock(id=1), MagicMock(id=2)])
+
+        self.assertListEqual(list(pool), [1, 2])
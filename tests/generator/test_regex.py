@@ -0,0 +1,118 @@
+import re
+import pickle
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from flask_seeder.generator import Regex
+from flask_seeder.codegen import REPEAT_LIMIT, regex_source
+
+class TestRegexGenerator(TestCase):
+
+    def assert_matches(self, pattern, rounds=200):
+        generator = Regex(pattern, seed=1)
+        for value in generator.generate_many(rounds):
+            self.assertIsNotNone(re.fullmatch(pattern, value, re.DOTALL), value)
+
+    def test_literal_is_returned_as_is(self):
+        m_rnd = MagicMock()
+        generator = Regex("abc", rnd=m_rnd)
+
+        result = generator.generate()
+
+        self.assertEqual(result, "abc")
+        m_rnd.choice.assert_not_called()
+
+    def test_character_class_draws_single_choice(self):
+        m_rnd = MagicMock()
+        m_rnd.choice.return_value = "b"
+        generator = Regex("x[abc]", rnd=m_rnd)
+
+        result = generator.generate()
+
+        self.assertEqual(result, "xb")
+        m_rnd.choice.assert_called_once_with(("a", "b", "c"))
+
+    def test_fixed_repeat_draws_with_choices(self):
+        m_rnd = MagicMock()
+        m_rnd.choices.return_value = ["1", "2", "3"]
+        generator = Regex(r"\d{3}", rnd=m_rnd)
+
+        result = generator.generate()
+
+        self.assertEqual(result, "123")
+        m_rnd.choices.assert_called_once_with(tuple("0123456789"), k=3)
+
+    def test_generate_many_draws_fixed_repeat_for_whole_batch(self):
+        m_rnd = MagicMock()
+        m_rnd.choices.return_value = list("123456")
+        generator = Regex(r"#\d{3}", rnd=m_rnd)
+
+        result = generator.generate_many(2)
+
+        self.assertListEqual(result, ["#123", "#456"])
+        m_rnd.choices.assert_called_once_with(tuple("0123456789"), k=6)
+
+    def test_generate_many_mixes_batched_and_single_parts(self):
+        self.assert_matches(r"(mr|mrs|ms) [A-Z][a-z]{2,9}%s x{0}[ab]{0}\d{1,3}-?\.")
+
+    def test_character_classes_and_categories(self):
+        self.assert_matches(r"[a-f0-9]{8}-[^a-z\d]\w\s\S\D\W")
+
+    def test_any_character(self):
+        self.assert_matches(r"a.b.{2,4}")
+
+    def test_alternation(self):
+        self.assert_matches(r"(foo|bar|)baz(?:one|two)")
+
+    def test_alternation_uses_all_branches(self):
+        values = set(Regex(r"(foo|bar|baz)", seed=1).generate_many(100))
+
+        self.assertEqual(values, {"foo", "bar", "baz"})
+
+    def test_nested_groups_and_quantifiers(self):
+        self.assert_matches(r"((ab|c)+-){1,3}x*?y?z+")
+
+    def test_backreference_repeats_group(self):
+        self.assert_matches(r"(a|bc)+-\1(?P<tail>[xyz]{2})(?P=tail)")
+
+    def test_backreference_to_group_that_may_not_match_raises_value_error(self):
+        for pattern in [r"((a)|b)\2", r"(a)?\1", r"(?:(a)|b){2}\1"]:
+            with self.subTest(pattern=pattern), self.assertRaises(ValueError):
+                Regex(pattern)
+
+    def test_backreference_to_group_in_every_branch(self):
+        self.assert_matches(r"(?:(a)x|(a)y)(a|b)+\3")
+
+    def test_anchors_and_boundaries_are_ignored(self):
+        self.assert_matches(r"^\bword\b$")
+
+    def test_unbounded_repeat_is_limited(self):
+        values = Regex(r"a*", seed=1).generate_many(500)
+
+        self.assertLessEqual(max(len(value) for value in values), REPEAT_LIMIT)
+
+    def test_lookaround_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Regex(r"foo(?=bar)")
+
+    def test_empty_character_class_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Regex(r"[^\s\S]")
+
+    def test_seed_gives_reproducible_strings(self):
+        first = Regex(r"[A-Z]{3}-\d{4}", seed=42).generate_many(10)
+        second = Regex(r"[A-Z]{3}-\d{4}", seed=42).generate_many(10)
+
+        self.assertEqual(first, second)
+
+    def test_generator_can_be_pickled(self):
+        generator = Regex(r"[A-Z]{3}", seed=42)
+
+        copy = pickle.loads(pickle.dumps(generator))
+
+        self.assertEqual(copy.generate_many(5), generator.generate_many(5))
+
+    def test_constant_expression_compiles_to_single_return(self):
+        code, _ = regex_source(r"ab(?:c)d")
+
+        self.assertIn("return 'abcd'", code)
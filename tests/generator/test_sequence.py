@@ -1,7 +1,15 @@
-from unittest import TestCase
+import pickle
+import threading
+from unittest import TestCase, skipIf
 from unittest.mock import MagicMock
 
-from flask_seeder.generator import Sequence
+from flask_seeder.generator import Sequence, Allocator, SharedAllocator, sync_sequence
+
+try:
+    import sqlalchemy
+    from sqlalchemy import orm
+except ImportError:
+    sqlalchemy = None
 
 class TestSequenceGenerator(TestCase):
 
@@ -32,4 +40,142 @@ class TestSequenceGenerator(TestCase):
         self.generator.end = 5
 
         with self.assertRaises(RuntimeError):
-            self.generator.generate()
\ No newline at end of file
+            self.generator.generate()
+
+    def test_generate_many_sequential_numbers(self):
+        self.generator.generate()
+
+        result = self.generator.generate_many(3)
+
+        self.assertListEqual(result, [2, 3, 4])
+        self.assertEqual(self.generator.generate(), 5)
+
+    def test_generate_many_raise_RuntimeError_when_exhausted(self):
+        self.generator.start = 1
+        self.generator.end = 5
+
+        with self.assertRaises(RuntimeError):
+            self.generator.generate_many(6)
+
+        self.assertEqual(self.generator.generate(), 1)
+
+    def test_advance_skip_values(self):
+        self.generator.advance(10)
+
+        self.assertEqual(self.generator.generate(), 11)
+
+    def test_spawn_with_offset(self):
+        result = self.generator.spawn(self.rnd_mock, offset=5)
+
+        self.assertEqual(result.generate(), 6)
+        self.assertEqual(self.generator.generate(), 1)
+
+
+class TestSequenceAllocator(TestCase):
+
+    def test_generators_sharing_allocator_never_overlap(self):
+        allocator = Allocator(start=10)
+        first = Sequence(allocator=allocator, block_size=4)
+        second = Sequence(allocator=allocator, block_size=4)
+
+        values = first.generate_many(6) + second.generate_many(3) + [first.generate()]
+
+        self.assertListEqual(values, [10, 11, 12, 13, 14, 15, 16, 17, 18, 20])
+
+    def test_threads_sharing_allocator_never_overlap(self):
+        allocator = Allocator()
+        results = []
+
+        def work():
+            generator = Sequence(allocator=allocator, block_size=10)
+            results.extend(generator.generate_many(1000))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), list(range(1, 4001)))
+
+    def test_shared_allocator_hands_out_blocks(self):
+        allocator = SharedAllocator(start=5)
+        copy = pickle.loads(pickle.dumps(allocator))
+
+        self.assertEqual(allocator.allocate(10), 5)
+        self.assertEqual(copy.allocate(10), 15)
+        self.assertEqual(allocator.allocate(1), 25)
+
+    def test_end_applies_with_allocator(self):
+        generator = Sequence(allocator=Allocator(), end=3)
+
+        with self.assertRaises(RuntimeError):
+            generator.generate_many(4)
+
+    def test_spawn_starts_with_new_block(self):
+        generator = Sequence(allocator=Allocator(), block_size=10)
+        generator.generate()
+
+        clone = generator.spawn(MagicMock(), offset=5)
+
+        self.assertEqual(clone.generate(), 11)
+        self.assertEqual(generator.generate(), 2)
+        self.assertIsNone(clone.cardinality())
+
+
+@skipIf(sqlalchemy is None, "SQLAlchemy not installed")
+class TestSequenceDatabase(TestCase):
+
+    def setUp(self):
+        self.engine = sqlalchemy.create_engine("sqlite://")
+        self.metadata = sqlalchemy.MetaData()
+        self.table = sqlalchemy.Table(
+            "users", self.metadata,
+            sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+            sqlite_autoincrement=True,
+        )
+        self.metadata.create_all(self.engine)
+        self.session = orm.Session(bind=self.engine)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_allocator_from_database_starts_after_highest_value(self):
+        self.session.execute(self.table.insert(), [{"id": 7}, {"id": 42}])
+
+        generator = Sequence(allocator=Allocator.from_database(self.session, self.table.c.id))
+
+        self.assertEqual(generator.generate(), 43)
+
+    def test_allocator_from_empty_table_starts_at_one(self):
+        allocator = Allocator.from_database(self.session, self.table.c.id)
+
+        self.assertEqual(allocator.allocate(1), 1)
+
+    def test_sync_sequence_sqlite(self):
+        self.session.execute(self.table.insert(), [{"id": 100}])
+        self.session.execute(sqlalchemy.text("UPDATE sqlite_sequence SET seq = 1"))
+
+        sync_sequence(self.session, self.table.c.id)
+        self.session.execute(self.table.insert(), [{}])
+
+        ids = self.session.execute(sqlalchemy.select(self.table.c.id)).scalars().all()
+        self.assertListEqual(sorted(ids), [100, 101])
+
+    def test_sync_sequence_postgresql(self):
+        session = MagicMock()
+        session.query.return_value.scalar.return_value = 100
+        session.get_bind.return_value.dialect.name = "postgresql"
+
+        sync_sequence(session, self.table.c.id)
+
+        params = session.execute.call_args[0][1]
+        self.assertEqual(params, {"table": "users", "column": "id", "value": 100, "called": True})
+
+    def test_sync_sequence_unsupported_dialect(self):
+        session = MagicMock()
+        session.query.return_value.scalar.return_value = 1
+        session.get_bind.return_value.dialect.name = "oracle"
+
+        with self.assertRaises(NotImplementedError):
+            sync_sequence(session, self.table.c.id)
@@ -2,6 +2,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from flask_seeder.generator import String
+from flask_seeder.parser import compile
 
 class TestStringGenerator(TestCase):
 
@@ -15,7 +16,7 @@ class TestStringGenerator(TestCase):
 
         self.generator.generate()
 
-        m_rnd.choice.assert_called_once_with("456")
+        m_rnd.choices.assert_called_once_with("456", k=1)
 
     def test_string_range_produce_character_from_valid_range(self):
         m_rnd = MagicMock()
@@ -24,7 +25,7 @@ class TestStringGenerator(TestCase):
 
         self.generator.generate()
 
-        m_rnd.choice.assert_called_once_with("ijklmno")
+        m_rnd.choices.assert_called_once_with("ijklmno", k=1)
 
     def test_integer_range_pattern(self):
         self.generator.pattern = "[0-9]"
@@ -130,3 +131,133 @@ class TestStringGenerator(TestCase):
         string = self.generator.generate()
 
         self.assertEqual(string, "123")
+
+    def test_generate_many(self):
+        self.generator.pattern = r"abc\d{4}[i-m]{2}"
+
+        result = self.generator.generate_many(10)
+
+        self.assertEqual(len(result), 10)
+        for string in result:
+            self.assertRegex(string, r"^abc\d{4}[i-m]{2}$")
+
+    def test_pattern_compiled_once(self):
+        m_parser = MagicMock()
+        m_parser.parse.return_value = [{"type": "STRING", "value": "abc"}]
+        generator = String("abc", parser=m_parser)
+
+        generator.generate()
+        generator.generate_many(3)
+
+        m_parser.parse.assert_called_once_with("abc")
+
+    def test_pattern_shared_between_instances(self):
+        self.assertIs(String("[abc]").compiled, String("[abc]").compiled)
+
+    def test_compiled_pattern(self):
+        generator = String(compile(r"\d{3}"))
+
+        self.assertEqual(generator.pattern, r"\d{3}")
+        self.assertRegex(generator.generate(), r"^\d{3}$")
+
+    def test_generate_without_pattern_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            self.generator.generate()
+
+    def test_generate_draw_repetitions_at_once(self):
+        m_rnd = MagicMock()
+        self.generator.rnd = m_rnd
+        self.generator.pattern = r"\c{64}"
+
+        self.generator.generate()
+
+        m_rnd.choices.assert_called_once_with(self.generator.alpha, k=64)
+
+    def test_generate_many_draw_node_for_whole_batch(self):
+        m_rnd = MagicMock()
+        m_rnd.choices.side_effect = lambda pool, k: [pool[0]] * k
+        self.generator.rnd = m_rnd
+        self.generator.pattern = r"ab[4-6]{3}"
+
+        result = self.generator.generate_many(5)
+
+        self.assertListEqual(result, ["ab444"] * 5)
+        m_rnd.choices.assert_called_once_with("456", k=15)
+
+    def test_generate_many_with_quantifier_range(self):
+        self.generator.pattern = r"\d{1,3}x(one|two){0,2}"
+
+        result = self.generator.generate_many(50)
+
+        for string in result:
+            self.assertRegex(string, r"^\d{1,3}x(one|two){0,2}$")
+
+    def test_generate_many_empty_pattern(self):
+        self.generator.pattern = ""
+
+        self.assertListEqual(self.generator.generate_many(2), ["", ""])
+
+    def test_cardinality(self):
+        self.generator.pattern = r"[a-c]\d{2}"
+
+        self.assertEqual(self.generator.cardinality(), 300)
+
+    def test_unique_generate_every_string_once(self):
+        generator = String(r"[a-c]\d", unique=True, seed=1)
+
+        result = [generator.generate() for _ in range(10)] + generator.generate_many(20)
+
+        self.assertEqual(len(set(result)), 30)
+        for string in result:
+            self.assertRegex(string, r"^[a-c]\d$")
+
+    def test_unique_raise_RuntimeError_when_exhausted(self):
+        generator = String(r"[a-c]\d", unique=True)
+
+        with self.assertRaises(RuntimeError):
+            generator.generate_many(31)
+
+        self.assertEqual(len(generator.generate_many(30)), 30)
+
+    def test_unique_variable_length_pattern_distinct(self):
+        generator = String(r"\d{1,2}-\d{1,2}", unique=True, seed=1)
+
+        result = generator.generate_many(generator.cardinality())
+
+        self.assertEqual(len(set(result)), 12100)
+
+    def test_unique_ambiguous_pattern_raise_ValueError(self):
+        for pattern in (r"\d{1,2}\d{1,2}", r"(a|aa){2}"):
+            generator = String(pattern, unique=True)
+
+            with self.assertRaises(ValueError):
+                generator.generate()
+            self.assertIsNone(generator.cardinality())
+
+    def test_unique_pattern_above_2_64(self):
+        for pattern, regex in ((r"\c{12}", r"^[a-zA-Z]{12}$"), (r"\d{45}", r"^\d{45}$"),
+                               (r"[A-Z]{4}-[A-Z]{4}-[A-Z]{4}-[A-Z]{4}", r"^([A-Z]{4}-){3}[A-Z]{4}$")):
+            generator = String(pattern, unique=True, seed=1)
+
+            result = generator.generate_many(3) + generator.generate_many(100)
+
+            self.assertGreater(generator.cardinality(), 2**64)
+            self.assertEqual(len(set(result)), 103)
+            for string in result:
+                self.assertRegex(string, regex)
+
+    def test_unique_reproducible_with_seed(self):
+        first = String(r"\d{6}", unique=True, seed=1).generate_many(10)
+        second = String(r"\d{6}", unique=True, seed=1).generate_many(10)
+
+        self.assertListEqual(first, second)
+
+    def test_unique_spawned_partitions_do_not_overlap(self):
+        generator = String(r"\d{3}", unique=True, seed=1)
+        first = generator.spawn(MagicMock(), offset=0)
+        second = generator.spawn(MagicMock(), offset=500)
+
+        result = first.generate_many(500) + second.generate_many(500)
+
+        self.assertEqual(len(set(result)), 1000)
+
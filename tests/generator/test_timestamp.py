@@ -0,0 +1,121 @@
+import random
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, skipIf
+
+from flask_seeder.generator import Timestamp, numpy
+
+START = datetime(2024, 1, 1)
+
+class TestTimestampGenerator(TestCase):
+
+    def test_generate_timestamps_at_interval(self):
+        generator = Timestamp(START, interval=timedelta(minutes=5))
+
+        result = [generator.generate() for _ in range(3)]
+
+        self.assertListEqual(result, [
+            datetime(2024, 1, 1, 0, 0),
+            datetime(2024, 1, 1, 0, 5),
+            datetime(2024, 1, 1, 0, 10),
+        ])
+
+    def test_generate_many_continue_sequence(self):
+        generator = Timestamp(START)
+        generator.generate()
+
+        result = generator.generate_many(3)
+
+        self.assertListEqual(result, [START + timedelta(seconds=i) for i in range(1, 4)])
+
+    def test_generate_many_zero(self):
+        self.assertListEqual(Timestamp(START).generate_many(0), [])
+
+    def test_timezone_aware_start(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        result = Timestamp(start).generate_many(2)
+
+        self.assertEqual(result[1], start + timedelta(seconds=1))
+        self.assertIs(result[1].tzinfo, timezone.utc)
+
+    def test_jitter_keep_timestamps_increasing(self):
+        generator = Timestamp(START, jitter=timedelta(seconds=1), rnd=random.Random(1))
+
+        result = generator.generate_many(1000)
+
+        self.assertTrue(all(a < b for a, b in zip(result, result[1:])))
+        for index, value in enumerate(result):
+            offset = value - START - timedelta(seconds=index)
+            self.assertTrue(timedelta(0) <= offset < timedelta(seconds=1))
+        self.assertGreater(len({value.microsecond for value in result}), 1)
+
+    def test_generate_many_match_generate(self):
+        jitter = timedelta(milliseconds=10)
+        first = Timestamp(START, jitter=jitter, rnd=random.Random(1), vectorize=False)
+        second = Timestamp(START, jitter=jitter, rnd=random.Random(1))
+
+        self.assertListEqual(first.generate_many(100), [second.generate() for _ in range(100)])
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_vectorized_jitter_in_bounds(self):
+        generator = Timestamp(START, jitter=timedelta(seconds=1), seed=1)
+
+        result = generator.generate_many(1000)
+
+        self.assertTrue(all(a < b for a, b in zip(result, result[1:])))
+        self.assertTrue(result[-1] < START + timedelta(seconds=1000))
+
+    def test_raise_RuntimeError_past_end(self):
+        generator = Timestamp(START, end=START + timedelta(seconds=2))
+
+        self.assertEqual(len(generator.generate_many(3)), 3)
+        with self.assertRaises(RuntimeError):
+            generator.generate()
+
+    def test_jitter_never_pass_end(self):
+        end = START + timedelta(seconds=9)
+        jitter = timedelta(seconds=1)
+        generator = Timestamp(START, end=end, jitter=jitter, rnd=random.Random(1))
+        single = Timestamp(START, end=end, jitter=jitter, rnd=random.Random(1))
+
+        result = generator.generate_many(10)
+        values = [single.generate() for _ in range(10)]
+
+        for timestamps in (result, values):
+            self.assertTrue(all(a < b for a, b in zip(timestamps, timestamps[1:])))
+            self.assertTrue(START + timedelta(seconds=9) <= timestamps[-1] <= end)
+
+    def test_generate_many_past_end_consume_nothing(self):
+        generator = Timestamp(START, end=START + timedelta(seconds=2))
+
+        with self.assertRaises(RuntimeError):
+            generator.generate_many(4)
+
+        self.assertEqual(generator.generate(), START)
+
+    def test_advance_skip_timestamps(self):
+        generator = Timestamp(START)
+
+        generator.advance(10)
+
+        self.assertEqual(generator.generate(), START + timedelta(seconds=10))
+
+    def test_spawn_with_offset(self):
+        generator = Timestamp(START)
+
+        result = generator.spawn(random.Random(1), 5)
+
+        self.assertEqual(result.generate(), START + timedelta(seconds=5))
+        self.assertEqual(generator.generate(), START)
+
+    def test_cardinality(self):
+        end = START + timedelta(minutes=1)
+
+        self.assertEqual(Timestamp(START, end=end, interval=timedelta(seconds=7)).cardinality(), 9)
+        self.assertIsNone(Timestamp(START).cardinality())
+        self.assertIsNone(Timestamp(START, end=end, jitter=timedelta(seconds=2)).cardinality())
+
+    def test_invalid_interval_raise_ValueError(self):
+        for kwargs in ({"interval": timedelta(0)}, {"jitter": timedelta(seconds=-1)}):
+            with self.assertRaises(ValueError):
+                Timestamp(START, **kwargs)
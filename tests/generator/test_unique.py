@@ -0,0 +1,106 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from flask_seeder.generator import Unique, Integer, Generator, BloomFilter
+
+
+class TestUniqueGenerator(TestCase):
+
+    def setUp(self):
+        self.inner = Integer(start=1, end=10, seed=1)
+        self.generator = Unique(self.inner)
+
+    def test_generate_unique_values(self):
+        result = [self.generator.generate() for _ in range(10)]
+
+        self.assertListEqual(sorted(result), list(range(1, 11)))
+
+    def test_generate_many_unique_values(self):
+        result = self.generator.generate_many(5) + self.generator.generate_many(5)
+
+        self.assertListEqual(sorted(result), list(range(1, 11)))
+
+    def test_generate_raise_RuntimeError_when_exhausted(self):
+        self.generator.generate_many(10)
+
+        with self.assertRaises(RuntimeError):
+            self.generator.generate()
+
+    def test_generate_many_fail_early_when_cardinality_is_too_small(self):
+        self.inner.generate_many = MagicMock()
+
+        with self.assertRaises(RuntimeError):
+            self.generator.generate_many(11)
+
+        self.inner.generate_many.assert_not_called()
+
+    def test_generate_raise_RuntimeError_after_max_attempts(self):
+        m_inner = MagicMock(spec=Generator)
+        m_inner.cardinality.return_value = None
+        m_inner.generate.return_value = "value"
+        generator = Unique(m_inner, max_attempts=3)
+        generator.generate()
+
+        with self.assertRaises(RuntimeError):
+            generator.generate()
+
+        self.assertEqual(m_inner.generate.call_count, 4)
+
+    def test_generate_with_bloom_filter(self):
+        generator = Unique(Integer(start=1, end=1000, seed=1), bloom_capacity=1000)
+
+        result = generator.generate_many(500)
+
+        self.assertEqual(len(set(result)), 500)
+
+    def test_spawn_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            self.generator.spawn(MagicMock())
+
+        with self.assertRaises(ValueError):
+            self.generator.fork(1)
+
+    def test_generate_values_with_equal_hashes(self):
+        generator = Unique(Integer(start=-2, end=-1, seed=1))
+
+        self.assertListEqual(sorted(generator.generate_many(2)), [-2, -1])
+
+    def test_seen_values_are_kept_as_digests(self):
+        inner = MagicMock(spec=Generator)
+        inner.cardinality.return_value = None
+        inner.generate_many.return_value = ["x" * 1000, "y" * 1000]
+        generator = Unique(inner)
+
+        generator.generate_many(2)
+
+        self.assertEqual(len(generator._seen), 2)
+        self.assertTrue(all(isinstance(value, int) and value < 2**64 for value in generator._seen))
+
+    def test_cardinality_read_once(self):
+        self.inner.cardinality = MagicMock(return_value=10)
+
+        for _ in range(5):
+            self.generator.generate()
+
+        self.inner.cardinality.assert_called_once_with()
+
+    def test_cardinality_read_again_when_exhausted(self):
+        self.inner.cardinality = MagicMock(return_value=5)
+        self.generator.generate_many(5)
+        self.inner.cardinality.return_value = 10
+
+        self.assertEqual(len(self.generator.generate_many(5)), 5)
+
+
+class TestBloomFilter(TestCase):
+
+    def test_add_return_True_for_new_values(self):
+        bloom = BloomFilter(100)
+
+        self.assertTrue(bloom.add("value"))
+        self.assertFalse(bloom.add("value"))
+        self.assertIn("value", bloom)
+
+    def test_invalid_capacity_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            BloomFilter(0)
@@ -1,4 +1,7 @@
+import time
+import random
 import uuid
+from datetime import datetime, timezone
 
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
@@ -20,3 +23,74 @@ class TestUUIDGenerator(TestCase):
         result = self.generator.generate()
         
         self.assertEqual(4, uuid.UUID(str(result), version=4).version)
+
+    def test_generate_many_uuid(self):
+        result = self.generator.generate_many(10)
+
+        self.assertEqual(len(set(result)), 10)
+        for value in result:
+            self.assertEqual(4, uuid.UUID(str(value), version=4).version)
+
+    def test_generate_seeded_uuid_reproducible(self):
+        first = UUID(seed=1)
+        second = UUID(seed=1)
+
+        self.assertEqual(first.generate(), second.generate())
+        self.assertListEqual(first.generate_many(5), second.generate_many(5))
+        self.assertEqual(4, first.generate().version)
+
+    def test_spawned_uuid_reproducible(self):
+        first = UUID(seed=1).spawn(random.Random(2))
+        second = UUID(seed=1).spawn(random.Random(2))
+
+        self.assertListEqual(first.generate_many(5), second.generate_many(5))
+        self.assertEqual(first.generate(), second.generate())
+
+
+class TestUUIDv7Generator(TestCase):
+    START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def test_generate_version_7_uuid(self):
+        result = UUID(version=7).generate()
+
+        self.assertEqual(result.version, 7)
+        self.assertEqual(result.variant, uuid.RFC_4122)
+
+    def test_uuids_are_increasing(self):
+        generator = UUID(version=7)
+
+        result = generator.generate_many(5000) + [generator.generate() for _ in range(10)]
+
+        self.assertListEqual(result, sorted(set(result)))
+
+    def test_timestamp_is_current_time(self):
+        before = int(time.time() * 1000)
+
+        result = UUID(version=7).generate()
+
+        self.assertGreaterEqual(result.int >> 80, before)
+        self.assertLessEqual(result.int >> 80, int(time.time() * 1000) + 1)
+
+    def test_timestamp_counts_from_start(self):
+        result = UUID(version=7, start=self.START).generate_many(4097)
+
+        self.assertEqual(result[0].int >> 80, int(self.START.timestamp() * 1000))
+        self.assertEqual(result[-1].int >> 80, int(self.START.timestamp() * 1000) + 1)
+
+    def test_seeded_uuids_with_start_are_reproducible(self):
+        first = UUID(version=7, start=self.START, seed=1).generate_many(5)
+        second = UUID(version=7, start=self.START, seed=1).generate_many(5)
+
+        self.assertListEqual(first, second)
+
+    def test_advance_skips_timestamps(self):
+        generator = UUID(version=7, start=self.START, seed=1)
+        generator.advance(5)
+
+        result = generator.generate()
+
+        self.assertEqual((result.int >> 64) & 0xfff, 5)
+
+    def test_unsupported_version_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            UUID(version=1)
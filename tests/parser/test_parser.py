@@ -1,7 +1,8 @@
+import pickle
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from flask_seeder.parser import SGParser, Token, strtype
+from flask_seeder.parser import SGParser, Token, Pattern, compile, strtype
 
 
 class TestUtility(TestCase):
@@ -317,3 +318,79 @@ class TestSGParser(TestCase):
         result = self.parser.parse_LITERAL(token)
 
         self.assertDictEqual(result, expected)
+
+
+class TestCompile(TestCase):
+
+    def test_compile_return_pattern_with_ast(self):
+        result = compile(r"abc\d{2}")
+
+        self.assertIsInstance(result, Pattern)
+        self.assertEqual(result.pattern, r"abc\d{2}")
+        self.assertEqual(result.ast[0]["type"], "STRING")
+        self.assertEqual(result.ast[1]["type"], "CHARCODE")
+        self.assertEqual(result.ast[1]["repeat"]["value"], 2)
+
+    def test_compile_cache_patterns(self):
+        self.assertIs(compile("[abc]"), compile("[abc]"))
+
+    def test_pattern_is_immutable(self):
+        result = compile("[abc]")
+
+        with self.assertRaises(AttributeError):
+            result.pattern = "[xyz]"
+        with self.assertRaises(TypeError):
+            result.ast[0]["type"] = "STRING"
+
+    def test_equal_patterns_have_equal_hashes(self):
+        first = compile("[a-c]")
+        second = compile("[a-c]{1}")
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, compile("[a-c]{2}"))
+
+    def test_pattern_can_be_pickled(self):
+        result = compile("[abc]{2}(one|two)")
+
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+
+class TestPatternEnumeration(TestCase):
+
+    def test_cardinality(self):
+        self.assertEqual(compile(r"abc").cardinality, 1)
+        self.assertEqual(compile(r"\d{3}").cardinality, 1000)
+        self.assertEqual(compile(r"[a-c]\c").cardinality, 3 * 52)
+        self.assertEqual(compile(r"(one|two|three)[xy]").cardinality, 6)
+
+    def test_cardinality_with_quantifier_range(self):
+        self.assertEqual(compile(r"\d{1,2}").cardinality, 110)
+
+    def test_cardinality_ignore_duplicate_choices(self):
+        self.assertEqual(compile(r"[aab]").cardinality, 2)
+
+    def test_ambiguous(self):
+        for pattern in (r"\d{1,2}\d{1,2}", r"(a|aa){2}", r"[a]{0,1}[b]{0,1}[a]{0,1}"):
+            self.assertTrue(compile(pattern).ambiguous, pattern)
+
+        for pattern in (r"abc", r"\d{3}", r"\c{3,8}\d{2}", r"\d{1,2}-\d{1,2}", r"(one|three)"):
+            self.assertFalse(compile(pattern).ambiguous, pattern)
+
+    def test_unrank_is_bijective(self):
+        pattern = compile(r"x[a-c]{1,2}(one|two)1")
+
+        result = [pattern.unrank(i) for i in range(pattern.cardinality)]
+
+        self.assertEqual(len(set(result)), pattern.cardinality)
+        for string in result:
+            self.assertRegex(string, r"^x[a-c]{1,2}(one|two)1$")
+
+    def test_unrank_raise_IndexError_out_of_range(self):
+        with self.assertRaises(IndexError):
+            compile(r"\d").unrank(10)
+
+    def test_cardinality_raise_ValueError_for_invalid_charcode(self):
+        with self.assertRaises(ValueError):
+            compile(r"\q").cardinality
+
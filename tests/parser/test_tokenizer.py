@@ -81,3 +81,12 @@ class TestTokenizer(TestCase):
         self.t.run("abc")
 
         self.assertEqual(self.t.peek(), self.t.peek())
+
+    def test_run_discard_previous_tokens(self):
+        self.t.run("abc")
+        self.t.next()
+
+        self.t.run("123")
+
+        self.assertEqual(len(self.t.tokens), 1)
+        self.assertEqual(self.t.next().group, "NUMBER")
@@ -1,4 +1,6 @@
 import os
+import pickle
+import tempfile
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 from flask import Flask
@@ -14,6 +16,18 @@ MOCK_FILES = [
     [os.path.join("data", "sub2"), [], ["file3.py", "file4.py"]],
 ]
 
+SEED_SCRIPT = """
+from flask_seeder import Seeder, Faker, generator
+
+class User:
+    def __init__(self, id=None):
+        self.id = id
+
+class UserSeeder(Seeder):
+    def create_faker(self):
+        return Faker(cls=User, init={"id": generator.Sequence()})
+"""
+
 class TestSeedCLI(TestCase):
 
     def setUp(self):
@@ -46,6 +60,19 @@ class TestSeedCLI(TestCase):
 
         m_seeder.run.assert_called_once()
 
+    def test_classes_in_seed_scripts_can_be_pickled(self):
+        with tempfile.TemporaryDirectory() as root:
+            script = os.path.join(root, "pickled.py")
+            with open(script, "w") as source:
+                source.write(SEED_SCRIPT)
+
+            seeder = cli.get_seeders_from_script(script)[0]
+            faker = seeder.create_faker()
+
+            self.assertIs(pickle.loads(pickle.dumps(faker.cls)), faker.cls)
+            self.assertListEqual([user.id for user in faker.create(6, workers=2)],
+                                 list(range(1, 7)))
+
     @patch("flask_seeder.cli.get_seed_scripts", return_value=["test"])
     @patch("flask_seeder.cli.get_seeders_from_script")
     def test_get_seeders_return_ordered_iterable_of_seeders(self, m_get_seeders, m_get_scripts):
@@ -116,6 +143,25 @@ class TestSeedCLI(TestCase):
 
         m_seeder.run.assert_called_once()
 
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_calls_after_run_hook(self, m_get_seeders):
+        m_seeder = MagicMock()
+        m_get_seeders.return_value = [m_seeder]
+
+        self.cli.invoke(cli.seed_run)
+
+        m_seeder.after_run.assert_called_once()
+
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_skips_after_run_hook_for_failed_seeder(self, m_get_seeders):
+        m_seeder = MagicMock()
+        m_seeder.run.side_effect = Exception()
+        m_get_seeders.return_value = [m_seeder]
+
+        self.cli.invoke(cli.seed_run)
+
+        m_seeder.after_run.assert_not_called()
+
     @patch("flask_seeder.cli.get_seeders", return_value=[])
     def test_run_commit_session_by_default(self, m_get_seeders):
         self.cli.invoke(cli.seed_run)
@@ -127,3 +173,106 @@ class TestSeedCLI(TestCase):
         self.cli.invoke(cli.seed_run, args=["--no-commit"])
 
         self.assertFalse(self.db_mock.session.commit.called)
+
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_with_flush_every_option(self, m_get_seeders):
+        class TestSeeder(Seeder):
+            def run(self):
+                self.add_all(range(5))
+        seeder = TestSeeder()
+        m_get_seeders.return_value = [seeder]
+
+        result = self.cli.invoke(cli.seed_run, args=["--flush-every", "2"])
+
+        self.assertEqual(seeder.flush_every, 2)
+        self.assertEqual(self.db_mock.session.flush.call_count, 3)
+        self.assertTrue("Flush 3: 1 objects" in result.output)
+
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_with_flush_every_skip_empty_final_flush(self, m_get_seeders):
+        class TestSeeder(Seeder):
+            def run(self):
+                self.add_all(range(4))
+        seeder = TestSeeder()
+        m_get_seeders.return_value = [seeder]
+
+        result = self.cli.invoke(cli.seed_run, args=["--flush-every", "2"])
+
+        self.assertEqual(self.db_mock.session.flush.call_count, 2)
+        self.assertEqual(len(seeder.flushes), 2)
+        self.assertFalse("Flush 3" in result.output)
+
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_with_flush_every_seeder_without_base_init(self, m_get_seeders):
+        class TestSeeder(Seeder):
+            def __init__(self):
+                self.name = "TestSeeder"
+
+            def run(self):
+                pass
+        m_get_seeders.return_value = [TestSeeder()]
+
+        result = self.cli.invoke(cli.seed_run, args=["--flush-every", "2"])
+
+        self.assertTrue("TestSeeder...\t[OK]" in result.output)
+        self.assertFalse("ERROR" in result.output)
+
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_commit_per_seeder(self, m_get_seeders):
+        m_get_seeders.return_value = [MagicMock(), MagicMock()]
+
+        self.cli.invoke(cli.seed_run, args=["--commit-per-seeder"])
+
+        self.assertEqual(self.db_mock.session.commit.call_count, 2)
+
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_commit_per_seeder_rollback_failed_seeder(self, m_get_seeders):
+        class TestSeeder(Seeder):
+            def run(self):
+                raise ValueError()
+        m_get_seeders.return_value = [TestSeeder()]
+
+        self.cli.invoke(cli.seed_run, args=["--commit-per-seeder"])
+
+        self.db_mock.session.rollback.assert_called_once()
+        self.db_mock.session.commit.assert_not_called()
+
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_commit_per_seeder_with_no_commit_option(self, m_get_seeders):
+        m_get_seeders.return_value = [MagicMock()]
+
+        self.cli.invoke(cli.seed_run, args=["--commit-per-seeder", "--no-commit"])
+
+        self.assertFalse(self.db_mock.session.commit.called)
+
+
+    @patch("flask_seeder.generator.seed")
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_with_seed_option(self, m_get_seeders, m_seed):
+        m_seeder = MagicMock()
+        m_seeder.name = "TestSeeder"
+        m_get_seeders.return_value = [m_seeder]
+
+        self.cli.invoke(cli.seed_run, args=["--seed", "1234"])
+
+        m_seed.assert_any_call("1234:TestSeeder")
+        m_seed.assert_called_with(None)
+
+    @patch("flask_seeder.generator.seed")
+    @patch("flask_seeder.cli.get_seeders")
+    def test_run_with_seed_from_config(self, m_get_seeders, m_seed):
+        m_seeder = MagicMock()
+        m_seeder.name = "TestSeeder"
+        m_get_seeders.return_value = [m_seeder]
+        self.app.extensions["flask_seeder"].seed = 1
+
+        self.cli.invoke(cli.seed_run)
+
+        m_seed.assert_any_call("1:TestSeeder")
+
+    @patch("flask_seeder.generator.seed")
+    @patch("flask_seeder.cli.get_seeders", return_value=[])
+    def test_run_without_seed(self, m_get_seeders, m_seed):
+        self.cli.invoke(cli.seed_run)
+
+        m_seed.assert_not_called()
@@ -0,0 +1,60 @@
+import pickle
+import random
+from unittest import TestCase
+
+from flask_seeder import codegen
+from flask_seeder.generator import String
+from flask_seeder.parser import compile
+
+PATTERNS = [
+    (r"abc[5-9]{4}\c[xyz]", r"^abc[5-9]{4}[a-zA-Z][xyz]$"),
+    (r"\d{20}", r"^\d{20}$"),
+    (r"\c{1,3}", r"^[a-zA-Z]{1,3}$"),
+    (r"(one|two){2}", r"^(one|two){2}$"),
+    (r"[i-m]{2,4}-12{2}", r"^[i-m]{2,4}-1212$"),
+    (r"", r"^$"),
+]
+
+class TestCodegen(TestCase):
+
+    def test_generated_function_match_pattern(self):
+        for pattern, regex in PATTERNS:
+            function = codegen.compile_function(compile(pattern))
+
+            for _ in range(20):
+                self.assertRegex(function(random), regex)
+
+    def test_source_fold_constants(self):
+        code, _ = codegen.source(compile(r"abc-12{2}[x]"))
+
+        self.assertIn("'abc-1212x'", code)
+        self.assertNotIn("choice(_c", code)
+
+    def test_source_precompute_range(self):
+        _, namespace = codegen.source(compile(r"[i-o]{2}"))
+
+        self.assertIn(tuple("ijklmno"), namespace.values())
+
+    def test_invalid_charcode_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            codegen.compile_function(compile(r"\q"))
+
+    def test_compile_function_is_cached(self):
+        pattern = compile(r"\d{4}")
+
+        self.assertIs(codegen.compile_function(pattern), codegen.compile_function(pattern))
+
+    def test_string_generator_with_codegen(self):
+        generator = String(r"abc\d{4}[i-m]{2}", codegen=True)
+
+        self.assertRegex(generator.generate(), r"^abc\d{4}[i-m]{2}$")
+        for string in generator.generate_many(10):
+            self.assertRegex(string, r"^abc\d{4}[i-m]{2}$")
+
+    def test_string_generator_with_codegen_can_be_pickled(self):
+        generator = String(r"\d{4}", codegen=True, seed=1)
+        generator.generate()
+
+        result = pickle.loads(pickle.dumps(generator))
+
+        self.assertRegex(result.generate(), r"^\d{4}$")
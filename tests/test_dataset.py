@@ -0,0 +1,180 @@
+import os
+import pickle
+import random
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from flask_seeder.dataset import Dataset, build, build_text, text_files, parse_lines, main
+from flask_seeder.generator import Name, load_dataset, load_alias_table, evict_datasets
+
+ENTRIES = ["alpha", "", "bête", "名前", "omega"]
+
+class TestDataset(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "test.bin")
+        build(ENTRIES, self.path)
+        self.dataset = Dataset(self.path)
+
+    def tearDown(self):
+        del self.dataset
+        self.directory.cleanup()
+
+    def test_entries_are_read_back(self):
+        self.assertEqual(len(self.dataset), len(ENTRIES))
+        self.assertListEqual(list(self.dataset), ENTRIES)
+
+    def test_negative_index_and_slice(self):
+        self.assertEqual(self.dataset[-1], "omega")
+        self.assertListEqual(self.dataset[1:4], ENTRIES[1:4])
+
+    def test_index_out_of_range_raise_IndexError(self):
+        with self.assertRaises(IndexError):
+            self.dataset[len(ENTRIES)]
+
+    def test_take_returns_entries_at_indices(self):
+        self.assertListEqual(self.dataset.take([3, 0, 3]), ["名前", "alpha", "名前"])
+
+    def test_random_choice_draws_entries(self):
+        values = random.Random(1).choices(self.dataset, k=100)
+
+        self.assertTrue(set(values) <= set(ENTRIES))
+
+    def test_dataset_can_be_pickled(self):
+        result = pickle.loads(pickle.dumps(self.dataset))
+
+        self.assertListEqual(list(result), ENTRIES)
+
+    def test_invalid_file_raise_ValueError(self):
+        path = os.path.join(self.directory.name, "invalid.bin")
+        with open(path, "wb") as target:
+            target.write(b"\0" * 64)
+
+        with self.assertRaises(ValueError):
+            Dataset(path)
+
+    def test_dataset_without_weights(self):
+        self.assertIsNone(self.dataset.weights)
+
+    def test_weights_are_read_back(self):
+        path = os.path.join(self.directory.name, "weighted.bin")
+        build(["a", "b"], path, weights=[2.5, 1])
+
+        result = Dataset(path)
+
+        self.assertListEqual(list(result), ["a", "b"])
+        self.assertListEqual(list(result.weights), [2.5, 1.0])
+
+    def test_build_with_wrong_number_of_weights_raise_ValueError(self):
+        with self.assertRaises(ValueError):
+            build(["a", "b"], self.path, weights=[1])
+
+    def test_parse_lines_without_weights(self):
+        self.assertEqual(parse_lines(["a", "b"]), (("a", "b"), None))
+
+    def test_parse_lines_with_weights(self):
+        result = parse_lines(["a\t10", "b", "c d\t0.5"])
+
+        self.assertEqual(result, (("a", "b", "c d"), (10.0, 1.0, 0.5)))
+
+    def test_build_text_writes_binary_next_to_text(self):
+        path = os.path.join(self.directory.name, "words.txt")
+        with open(path, "w", encoding="utf-8") as target:
+            target.write("one\ntwo\n")
+
+        result = build_text(path)
+
+        self.assertEqual(result, os.path.join(self.directory.name, "words.bin"))
+        self.assertListEqual(list(Dataset(result)), ["one", "two"])
+
+    def test_text_files_finds_bundled_datasets(self):
+        names = [os.path.basename(path) for path in text_files()]
+
+        self.assertIn("names.txt", names)
+        self.assertIn("domains.txt", names)
+
+    def test_load_dataset_prefers_binary_dataset(self):
+        evict_datasets()
+        text = os.path.join(self.directory.name, "test.txt")
+
+        with patch("flask_seeder.dataset.resource_path", return_value=text):
+            result = load_dataset("test.txt")
+
+        self.assertIsInstance(result, Dataset)
+        self.assertListEqual(list(result), ENTRIES)
+        evict_datasets()
+
+    def test_load_dataset_ignore_outdated_binary_dataset(self):
+        evict_datasets()
+        text = os.path.join(self.directory.name, "test.txt")
+        with open(text, "w", encoding="utf-8") as target:
+            target.write("edited\n")
+        os.utime(self.path, (0, 0))
+
+        result = load_dataset(text)
+
+        self.assertEqual(result, ("edited",))
+        evict_datasets()
+
+    def test_load_dataset_from_binary_path(self):
+        evict_datasets()
+
+        result = load_dataset(self.path)
+
+        self.assertIsInstance(result, Dataset)
+        evict_datasets()
+
+    def test_build_text_into_directory(self):
+        path = os.path.join(self.directory.name, "words.txt")
+        with open(path, "w", encoding="utf-8") as target:
+            target.write("one\ntwo\n")
+        output = os.path.join(self.directory.name, "output")
+
+        with patch("sys.stdout"):
+            main([path, "-o", output])
+
+        self.assertListEqual(list(Dataset(os.path.join(output, "words.bin"))), ["one", "two"])
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "words.bin")))
+
+class TestWeightedDataset(TestCase):
+
+    def setUp(self):
+        evict_datasets()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "names.txt")
+        with open(self.path, "w", encoding="utf-8") as target:
+            target.write("common\t99\nrare\t1\nnever\t0\n")
+
+    def tearDown(self):
+        evict_datasets()
+        self.directory.cleanup()
+
+    def test_load_alias_table_from_text_weights(self):
+        self.assertEqual(len(load_alias_table(self.path)), 3)
+        self.assertEqual(load_dataset(self.path), ("common", "rare", "never"))
+
+    def test_unweighted_dataset_has_no_alias_table(self):
+        with open(self.path, "w", encoding="utf-8") as target:
+            target.write("one\ntwo\n")
+
+        self.assertIsNone(load_alias_table(self.path))
+
+    def test_name_draws_by_weight(self):
+        names = Name(dataset=self.path, seed=1).generate_many(1000)
+
+        self.assertNotIn("never", names)
+        self.assertGreater(names.count("common"), 950)
+
+    def test_name_draws_by_weight_from_binary_dataset(self):
+        build_text(self.path)
+
+        names = [Name(dataset=self.path, seed=1).generate() for _ in range(100)]
+
+        self.assertNotIn("never", names)
+
+    def test_name_ignores_weights_when_not_weighted(self):
+        names = Name(dataset=self.path, weighted=False, seed=1).generate_many(1000)
+
+        self.assertIn("never", names)
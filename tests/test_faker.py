@@ -1,7 +1,16 @@
-from unittest import TestCase
+from datetime import datetime
+from itertools import islice
+from unittest import TestCase, skipIf
+from unittest.mock import MagicMock
+
+try:
+    import sqlalchemy
+    from sqlalchemy import orm
+except ImportError:
+    sqlalchemy = None
 
 from flask_seeder import Faker
-from flask_seeder.generator import Generator
+from flask_seeder.generator import Generator, Sequence, Integer, Pool, UUID, Unique, String
 
 class Dummy:
     def __init__(self, test_arg=None):
@@ -38,3 +47,272 @@ class TestFaker(TestCase):
         result = self.faker.create()
 
         self.assertEqual(result[0].test_arg, "test_value")
+
+    def test_create_same_as_create_iter_for_same_seed(self):
+        def faker():
+            return Faker(cls=Dummy, init={"test_arg": Integer(start=1, end=10**6, seed=1)})
+
+        result = [dummy.test_arg for dummy in faker().create(100)]
+
+        self.assertListEqual(result, [dummy.test_arg for dummy in faker().create_iter(100)])
+
+    def test_create_iter_yield_instances_lazily(self):
+        m_cls = MagicMock()
+        self.faker.cls = m_cls
+
+        result = self.faker.create_iter(3)
+        next(result)
+
+        m_cls.assert_called_once()
+
+    def test_create_iter_with_limit(self):
+        result = list(self.faker.create_iter(3))
+
+        self.assertEqual(len(result), 3)
+
+    def test_create_iter_without_limit_is_unbounded(self):
+        result = list(islice(self.faker.create_iter(), 5))
+
+        self.assertEqual(len(result), 5)
+
+    def test_create_iter_with_chunk_size(self):
+        result = list(self.faker.create_iter(5, chunk_size=2))
+
+        self.assertListEqual([len(chunk) for chunk in result], [2, 2, 1])
+
+    def test_create_iter_raise_ValueError_for_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(self.faker.create_iter(5, chunk_size=0))
+
+    def test_create_columns_return_column_per_field(self):
+        class DummyGenerator(Generator):
+            def generate(self):
+                return "generated"
+        self.faker.init = {"test_arg": DummyGenerator(), "constant": "value"}
+
+        result = self.faker.create_columns(2)
+
+        self.assertDictEqual(result, {
+            "test_arg": ["generated", "generated"],
+            "constant": ["value", "value"],
+        })
+
+    def test_create_columns_call_generate_many_once_per_field(self):
+        m_generator = MagicMock(spec=Generator)
+        m_generator.generate_many.return_value = [1, 2, 3]
+        self.faker.init = {"test_arg": m_generator}
+
+        self.faker.create_columns(3)
+
+        m_generator.generate_many.assert_called_once_with(3)
+        m_generator.generate.assert_not_called()
+
+    def test_create_columns_without_init(self):
+        self.faker.init = None
+
+        self.assertDictEqual(self.faker.create_columns(2), {})
+
+    def test_create_records_return_tuples_in_init_order(self):
+        m_generator = MagicMock(spec=Generator)
+        m_generator.generate_many.return_value = [1, 2]
+        self.faker.init = {"test_arg": m_generator, "constant": "value"}
+
+        result = self.faker.create_records(2)
+
+        self.assertListEqual(result, [(1, "value"), (2, "value")])
+
+    def test_create_records_without_init(self):
+        self.assertListEqual(self.faker.create_records(2), [(), ()])
+
+    def test_create_partitioned_independent_of_workers(self):
+        self.faker.init = {"test_arg": Integer(start=1, end=1000000)}
+
+        single = self.faker.create(20, workers=1, partitions=3, seed=1)
+        parallel = self.faker.create(20, workers=2, partitions=3, seed=1)
+
+        self.assertListEqual([obj.test_arg for obj in single], [obj.test_arg for obj in parallel])
+
+    def test_create_partitioned_reproducible_with_seed(self):
+        self.faker.init = {"test_arg": Integer(start=1, end=1000000)}
+
+        first = self.faker.create(20, partitions=4, seed=1)
+        second = self.faker.create(20, partitions=4, seed=1)
+        other = self.faker.create(20, partitions=4, seed=2)
+
+        self.assertListEqual([obj.test_arg for obj in first], [obj.test_arg for obj in second])
+        self.assertNotEqual([obj.test_arg for obj in first], [obj.test_arg for obj in other])
+
+    def test_create_partitioned_uuid_reproducible_with_seed(self):
+        for create in (UUID, lambda: UUID(version=7, start=datetime(2024, 1, 1))):
+            first = Faker(cls=Dummy, init={"test_arg": create()})
+            second = Faker(cls=Dummy, init={"test_arg": create()})
+
+            first = first.create(10, workers=1, partitions=2, seed=1)
+            second = second.create(10, workers=1, partitions=2, seed=1)
+
+            self.assertListEqual([obj.test_arg for obj in first],
+                                 [obj.test_arg for obj in second])
+
+    def test_create_partitioned_refuse_unique(self):
+        self.faker.init = {"test_arg": Unique(Integer(start=1, end=1000))}
+
+        with self.assertRaises(ValueError):
+            self.faker.create(10, partitions=2)
+
+    def test_create_partitioned_sequence_offsets(self):
+        self.faker.init = {"test_arg": Sequence()}
+
+        result = self.faker.create(10, partitions=3)
+
+        self.assertListEqual([obj.test_arg for obj in result], list(range(1, 11)))
+
+    def test_create_partitioned_repeatedly_continue_sequence(self):
+        self.faker.init = {"test_arg": Sequence()}
+
+        result = self.faker.create(3, partitions=2, seed=1)
+        result += self.faker.create(3, partitions=2, seed=1)
+        result += list(self.faker.create_iter(3, partitions=3, seed=1))
+        result += self.faker.create(3)
+
+        self.assertListEqual([obj.test_arg for obj in result], list(range(1, 13)))
+
+    def test_create_partitioned_repeatedly_keep_values_unique(self):
+        self.faker.init = {"test_arg": String(r"\d{3}", unique=True, seed=1)}
+
+        result = self.faker.create(10, partitions=2, seed=1)
+        result += self.faker.create(10, workers=2, partitions=3, seed=1)
+        result += self.faker.create(10)
+
+        self.assertEqual(len({obj.test_arg for obj in result}), 30)
+
+    def test_create_partitioned_unpicklable_class_in_process(self):
+        class Local:
+            def __init__(self, test_arg=None):
+                self.test_arg = test_arg
+
+        faker = Faker(cls=Local, init={"test_arg": Integer(start=1, end=1000000)})
+
+        parallel = faker.create(20, workers=2, partitions=3, seed=1)
+        single = faker.create(20, workers=1, partitions=3, seed=1)
+
+        self.assertListEqual([obj.test_arg for obj in parallel], [obj.test_arg for obj in single])
+
+    def test_create_iter_partitioned(self):
+        self.faker.init = {"test_arg": Sequence()}
+
+        result = list(self.faker.create_iter(10, chunk_size=4, workers=2))
+
+        self.assertListEqual([[obj.test_arg for obj in chunk] for chunk in result],
+                             [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]])
+
+    def test_create_iter_partitioned_raise_ValueError_without_limit(self):
+        with self.assertRaises(ValueError):
+            next(self.faker.create_iter(workers=2))
+
+    def test_create_fill_pools(self):
+        pool = Pool()
+        self.faker.init = {"test_arg": Sequence()}
+        self.faker.pools = {"test_arg": pool}
+
+        self.faker.create(3)
+        list(self.faker.create_iter(2))
+
+        self.assertListEqual(list(pool), [1, 2, 3, 4, 5])
+
+    def test_create_partitioned_fill_pools(self):
+        pool = Pool()
+        self.faker.init = {"test_arg": Sequence()}
+        self.faker.pools = {"test_arg": pool}
+
+        self.faker.create(10, workers=2, partitions=3)
+
+        self.assertListEqual(list(pool), list(range(1, 11)))
+
+    def test_create_mappings_return_dict_per_row(self):
+        m_generator = MagicMock(spec=Generator)
+        m_generator.generate_many.return_value = [1, 2]
+        self.faker.init = {"test_arg": m_generator, "constant": "value"}
+
+        result = self.faker.create_mappings(2)
+
+        self.assertListEqual(result, [
+            {"test_arg": 1, "constant": "value"},
+            {"test_arg": 2, "constant": "value"},
+        ])
+
+    def test_insert_mapped_class_in_batches(self):
+        m_session = MagicMock()
+        self.faker.cls = MagicMock(__mapper__=MagicMock())
+        self.faker.init = {"test_arg": "value"}
+
+        result = self.faker.insert(m_session, 5, batch_size=2)
+
+        self.assertEqual(result, 5)
+        self.assertListEqual(
+            [len(c[0][1]) for c in m_session.bulk_insert_mappings.call_args_list],
+            [2, 2, 1]
+        )
+        self.faker.cls.assert_not_called()
+
+    def test_insert_table(self):
+        m_session = MagicMock()
+        m_table = MagicMock(spec=["insert"])
+        self.faker.cls = m_table
+        self.faker.init = {"test_arg": "value"}
+
+        self.faker.insert(m_session, 2)
+
+        m_session.execute.assert_called_once_with(
+            m_table.insert.return_value, [{"test_arg": "value"}] * 2
+        )
+
+    def test_insert_raise_ValueError_for_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            self.faker.insert(MagicMock(), 5, batch_size=0)
+
+
+@skipIf(sqlalchemy is None, "SQLAlchemy not installed")
+class TestFakerInsertSQLite(TestCase):
+
+    def setUp(self):
+        self.engine = sqlalchemy.create_engine("sqlite://")
+        self.metadata = sqlalchemy.MetaData()
+        self.table = sqlalchemy.Table(
+            "users", self.metadata,
+            sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+            sqlalchemy.Column("age", sqlalchemy.Integer),
+        )
+        self.metadata.create_all(self.engine)
+        self.session = orm.Session(bind=self.engine)
+        self.init = {
+            "id": Sequence(end=1000),
+            "age": Integer(start=20, end=100),
+        }
+
+    def tearDown(self):
+        self.session.close()
+
+    def _rows(self):
+        return self.session.execute(
+            sqlalchemy.select(self.table.c.id, self.table.c.age).order_by(self.table.c.id)
+        ).all()
+
+    def test_insert_table_rows(self):
+        faker = Faker(cls=self.table, init=self.init)
+
+        faker.insert(self.session, 250, batch_size=100)
+
+        rows = self._rows()
+        self.assertListEqual([row.id for row in rows], list(range(1, 251)))
+        self.assertTrue(all(20 <= row.age <= 100 for row in rows))
+
+    def test_insert_mapped_class_rows(self):
+        class User:
+            pass
+        orm.registry().map_imperatively(User, self.table)
+        faker = Faker(cls=User, init=self.init)
+
+        faker.insert(self.session, 250, batch_size=100)
+
+        self.assertEqual(len(self._rows()), 250)
+        self.assertEqual(len(self.session.identity_map), 0)
@@ -16,3 +16,25 @@ class TestFlaskSeeder(TestCase):
         seeder.init_app(app)
 
         self.assertEqual(ext["flask_seeder"].db, db)
+
+    def test_init_app_with_seed(self):
+        app = MagicMock()
+        ext = {}
+        app.extensions.__setitem__.side_effect = ext.__setitem__
+        seeder = FlaskSeeder(db=MagicMock(), seed=1234)
+
+        seeder.init_app(app)
+
+        self.assertEqual(ext["flask_seeder"].seed, 1234)
+
+    def test_faker_is_exported(self):
+        import flask_seeder
+        from flask_seeder.faker import Faker
+
+        self.assertIs(flask_seeder.Faker, Faker)
+
+    def test_unknown_attribute_raise_AttributeError(self):
+        import flask_seeder
+
+        with self.assertRaises(AttributeError):
+            flask_seeder.NotFaker
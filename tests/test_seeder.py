@@ -1,4 +1,5 @@
 from unittest import TestCase
+from unittest.mock import MagicMock
 from flask_seeder import Seeder
 
 class TestBaseSeeder(TestCase):
@@ -10,3 +11,30 @@ class TestBaseSeeder(TestCase):
         with self.assertRaises(NotImplementedError):
             self.seeder.run()
 
+    def test_add_without_flush_every(self):
+        self.seeder.db = MagicMock()
+
+        self.seeder.add_all(["obj1", "obj2", "obj3"])
+
+        self.assertEqual(self.seeder.db.session.add.call_count, 3)
+        self.seeder.db.session.flush.assert_not_called()
+
+    def test_add_flush_and_expunge_in_chunks(self):
+        self.seeder.db = MagicMock()
+        self.seeder.flush_every = 2
+
+        for obj in range(5):
+            self.seeder.add(obj)
+
+        self.assertEqual(self.seeder.db.session.flush.call_count, 2)
+        self.assertEqual(self.seeder.db.session.expunge_all.call_count, 2)
+        self.assertListEqual([objects for objects, _ in self.seeder.flushes], [2, 2])
+
+    def test_flush_record_pending_objects(self):
+        self.seeder.db = MagicMock()
+        self.seeder.add("obj")
+
+        self.seeder.flush()
+
+        self.assertEqual(self.seeder.flushes[0][0], 1)
+        self.seeder.db.session.flush.assert_called_once()